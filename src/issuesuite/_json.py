@@ -0,0 +1,43 @@
+"""JSON encode/decode helpers that use orjson when it is installed.
+
+Both backends produce the same text: optional 2-space indentation, non-string
+keys coerced to strings, and non-ASCII characters written as UTF-8 rather than
+escaped. Callers therefore never see output that depends on the backend.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import json
+from typing import Any, cast
+
+
+@functools.cache
+def _orjson() -> Any:
+    try:
+        return importlib.import_module("orjson")
+    except ImportError:
+        return None
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from ``data`` (bytes are decoded by the parser itself)."""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes, 2-space indented when ``indent``."""
+    orjson = _orjson()
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return cast(bytes, orjson.dumps(obj, option=option))
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+__all__ = ["dumps", "loads"]
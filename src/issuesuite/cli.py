@@ -16,62 +16,31 @@ Designed to be dependency-light; heavy validation can be layered externally.
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import logging
+import operator
 import os
 import re
 import sys
-from collections.abc import Iterable, Sequence
+from collections.abc import Callable, Iterable, Sequence
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
-from issuesuite.advisory_refresh import refresh_advisories
-from issuesuite.agent_updates import apply_agent_updates
-from issuesuite.ai_context import get_ai_context
+from issuesuite import _json
 from issuesuite.config import SuiteConfig
 from issuesuite.core import IssueSuite
-from issuesuite.dependency_audit import (
-    Finding,
-    SuppressedFinding,
-    collect_installed_packages,
-    render_findings_table,
-)
-from issuesuite.dependency_audit import apply_allowlist as apply_security_allowlist
-from issuesuite.dependency_audit import load_advisories as load_security_advisories
-from issuesuite.dependency_audit import load_allowlist as load_security_allowlist
-from issuesuite.dependency_audit import perform_audit as run_dependency_audit
-from issuesuite.env_auth import create_env_auth_manager
-from issuesuite.github_issues import IssuesClient, IssuesClientConfig
-from issuesuite.github_projects_sync import (
-    ProjectsSyncError,
-    sync_projects,
-)
-from issuesuite.github_projects_sync import build_config as build_projects_sync_config
-from issuesuite.observability import configure_telemetry
-from issuesuite.orchestrator import sync_with_summary
-from issuesuite.parser import render_issue_block
-from issuesuite.pip_audit_integration import (
-    collect_online_findings,
-    run_resilient_pip_audit,
-)
-from issuesuite.projects_status import (
-    generate_report,
-    render_comment,
-    serialize_report,
-)
-from issuesuite.reconcile import format_report, reconcile
-from issuesuite.runtime import execute_command, prepare_config
-from issuesuite.scaffold import (
-    ScaffoldResult,
-    scaffold_project,
-    write_vscode_assets,
-)
-from issuesuite.schemas import get_schemas
-from issuesuite.setup_wizard import run_guided_setup
+
+if TYPE_CHECKING:
+    from issuesuite.dependency_audit import Finding, SuppressedFinding
+    from issuesuite.scaffold import ScaffoldResult
 
 CONFIG_DEFAULT = "issue_suite.config.yaml"
 REPO_HELP = "Override target repository (owner/repo)"
 
+_EXPORT_FIELDS = ("external_id", "title", "labels", "milestone", "status", "hash", "body")
+_export_values = operator.attrgetter(*_EXPORT_FIELDS)
+
 
 _MAX_HELP_WIDTH = 100
 
@@ -96,10 +65,56 @@ def _should_print(args: argparse.Namespace | None = None) -> bool:
     return True
 
 
-def _build_parser() -> argparse.ArgumentParser:
+def _sniff_subcommand(argv: Sequence[str] | None) -> str | None:
+    """Return the first positional token (the subcommand) without full parsing."""
+    tokens = sys.argv[1:] if argv is None else argv
+    for token in tokens:
+        if not token.startswith("-"):
+            return token
+    return None
+
+
+def _add_agent_apply_arguments(au: argparse.ArgumentParser) -> None:
+    au.add_argument("--updates-json", help="Path to JSON file with agent updates (default: stdin)")
+    au.add_argument("--apply", action="store_true", help="Perform GitHub mutations (sync apply)")
+    au.add_argument(
+        "--no-sync",
+        action="store_true",
+        help="Do not run sync after applying file updates",
+    )
+    au.add_argument(
+        "--respect-status",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Respect status for closing issues (default: true; use --no-respect-status to disable)",
+    )
+    au.add_argument(
+        "--dry-run-sync",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Run a dry-run sync after file updates (default: true when --apply is not used; otherwise false unless explicitly enabled)",
+    )
+    au.add_argument(
+        "--summary-json",
+        help="Optional path to write sync summary json (passed through to sync)",
+    )
+    au.add_argument(
+        "--require-approval",
+        action="store_true",
+        help="Require explicit --approve acknowledgement before applying agent updates",
+    )
+    au.add_argument(
+        "--approve",
+        action="store_true",
+        help="Acknowledge review approval when used with --require-approval",
+    )
+
+
+def _build_parser(command: str | None = None) -> argparse.ArgumentParser:
     """Construct top-level CLI parser with subcommands.
 
-    Keep ordering stable for help output readability.
+    Keep ordering stable for help output readability. When ``command`` is given,
+    subcommand-specific arguments that it cannot use may be left unregistered.
     """
     p = _FormatterArgumentParser(
         prog="issuesuite", description="Declarative GitHub issue automation"
@@ -109,6 +124,12 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Suppress informational logging (env: ISSUESUITE_QUIET=1)",
     )
+    # Shared option groups: subcommands inherit these Action objects rather
+    # than each registering its own --config/--repo copies.
+    config_parent = _FormatterArgumentParser(add_help=False)
+    config_parent.add_argument("--config", default=CONFIG_DEFAULT)
+    repo_parent = _FormatterArgumentParser(add_help=False, parents=[config_parent])
+    repo_parent.add_argument("--repo", help=REPO_HELP)
     sub = p.add_subparsers(
         dest="cmd",
         required=True,
@@ -116,9 +137,11 @@ def _build_parser() -> argparse.ArgumentParser:
         metavar="<command>",
     )
 
-    ps = sub.add_parser("sync", help="Sync issues to GitHub (create/update/close)")
-    ps.add_argument("--config", default=CONFIG_DEFAULT)
-    ps.add_argument("--repo", help=REPO_HELP)
+    ps = sub.add_parser(
+        "sync",
+        help="Sync issues to GitHub (create/update/close)",
+        parents=[repo_parent],
+    )
     ps.add_argument("--update", action="store_true")
     ps.add_argument("--apply", action="store_true", help="Alias for --update (creates/updates)")
     ps.add_argument("--dry-run", action="store_true")
@@ -137,20 +160,18 @@ def _build_parser() -> argparse.ArgumentParser:
     ps.add_argument("--project-owner", help="Override project owner (for future GraphQL)")
     ps.add_argument("--project-number", type=int, help="Override project number")
 
-    pe = sub.add_parser("export", help="Export issues to JSON")
-    pe.add_argument("--config", default=CONFIG_DEFAULT)
-    pe.add_argument("--repo", help=REPO_HELP)
+    pe = sub.add_parser("export", help="Export issues to JSON", parents=[repo_parent])
     pe.add_argument("--output")
     pe.add_argument("--pretty", action="store_true")
 
-    psm = sub.add_parser("summary", help="Quick summary of parsed specs")
-    psm.add_argument("--config", default=CONFIG_DEFAULT)
-    psm.add_argument("--repo", help=REPO_HELP)
+    psm = sub.add_parser("summary", help="Quick summary of parsed specs", parents=[repo_parent])
     psm.add_argument("--limit", type=int, default=20)
 
-    imp = sub.add_parser("import", help="Generate draft ISSUES.md from live issues")
-    imp.add_argument("--config", default=CONFIG_DEFAULT)
-    imp.add_argument("--repo", help=REPO_HELP)
+    imp = sub.add_parser(
+        "import",
+        help="Generate draft ISSUES.md from live issues",
+        parents=[repo_parent],
+    )
     imp.add_argument(
         "--output",
         default="ISSUES.import.md",
@@ -158,9 +179,11 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     imp.add_argument("--limit", type=int, default=500, help="Max issues to import (default 500)")
 
-    rec = sub.add_parser("reconcile", help="Detect drift between local specs and live issues")
-    rec.add_argument("--config", default=CONFIG_DEFAULT)
-    rec.add_argument("--repo", help=REPO_HELP)
+    rec = sub.add_parser(
+        "reconcile",
+        help="Detect drift between local specs and live issues",
+        parents=[repo_parent],
+    )
     rec.add_argument(
         "--limit",
         type=int,
@@ -168,12 +191,17 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Max issues to fetch for comparison (default 500)",
     )
 
-    doc = sub.add_parser("doctor", help="Run diagnostics (auth, repo access, config)")
-    doc.add_argument("--config", default=CONFIG_DEFAULT)
-    doc.add_argument("--repo", help=REPO_HELP)
+    sub.add_parser(
+        "doctor",
+        help="Run diagnostics (auth, repo access, config)",
+        parents=[repo_parent],
+    )
 
-    sec = sub.add_parser("security", help="Audit dependencies with offline-aware fallback")
-    sec.add_argument("--config", default=CONFIG_DEFAULT)
+    sec = sub.add_parser(
+        "security",
+        help="Audit dependencies with offline-aware fallback",
+        parents=[config_parent],
+    )
     sec.add_argument("--offline-only", action="store_true", help="Skip the live pip-audit probe")
     sec.add_argument("--output-json", type=Path, help="Write findings JSON to the given path")
     sec.add_argument(
@@ -201,6 +229,7 @@ def _build_parser() -> argparse.ArgumentParser:
     proj = sub.add_parser(
         "projects-status",
         help="Generate GitHub Projects status payloads and Markdown commentary",
+        parents=[repo_parent],
     )
     proj.add_argument(
         "--next-steps",
@@ -209,8 +238,6 @@ def _build_parser() -> argparse.ArgumentParser:
         type=Path,
         help="Path to a Next Steps tracker (defaults to repository root files)",
     )
-    proj.add_argument("--config", default=CONFIG_DEFAULT)
-    proj.add_argument("--repo", help=REPO_HELP)
     proj.add_argument(
         "--coverage",
         dest="coverage",
@@ -240,9 +267,8 @@ def _build_parser() -> argparse.ArgumentParser:
     psync = sub.add_parser(
         "projects-sync",
         help="Preview or apply GitHub Projects status updates and comments",
+        parents=[repo_parent],
     )
-    psync.add_argument("--config", default=CONFIG_DEFAULT)
-    psync.add_argument("--repo", help=REPO_HELP)
     psync.add_argument(
         "--next-steps",
         dest="next_steps",
@@ -321,9 +347,11 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Apply updates instead of running a dry-run preview",
     )
 
-    aictx = sub.add_parser("ai-context", help="Emit machine-readable context JSON for AI tooling")
-    aictx.add_argument("--config", default=CONFIG_DEFAULT)
-    aictx.add_argument("--repo", help=REPO_HELP)
+    aictx = sub.add_parser(
+        "ai-context",
+        help="Emit machine-readable context JSON for AI tooling",
+        parents=[repo_parent],
+    )
     aictx.add_argument("--output", help="Output file (defaults to stdout)")
     aictx.add_argument("--preview", type=int, default=5, help="Preview first N specs")
     aictx.add_argument(
@@ -332,55 +360,30 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Suppress informational logging (env: ISSUESUITE_QUIET=1)",
     )
 
-    sch = sub.add_parser("schema", help="Emit JSON Schema files")
-    sch.add_argument("--config", default=CONFIG_DEFAULT)
-    sch.add_argument("--repo", help=REPO_HELP)
+    sch = sub.add_parser("schema", help="Emit JSON Schema files", parents=[repo_parent])
     sch.add_argument("--stdout", action="store_true")
 
-    val = sub.add_parser("validate", help="Basic parse + id pattern validation")
-    val.add_argument("--config", default=CONFIG_DEFAULT)
-    val.add_argument("--repo", help=REPO_HELP)
+    sub.add_parser(
+        "validate",
+        help="Basic parse + id pattern validation",
+        parents=[repo_parent],
+    )
 
     au = sub.add_parser(
         "agent-apply",
         help="Apply agent completion summaries to ISSUES.md and optional docs, then sync",
+        parents=[config_parent],
     )
-    au.add_argument("--config", default=CONFIG_DEFAULT)
-    au.add_argument("--updates-json", help="Path to JSON file with agent updates (default: stdin)")
-    au.add_argument("--apply", action="store_true", help="Perform GitHub mutations (sync apply)")
-    au.add_argument(
-        "--no-sync",
-        action="store_true",
-        help="Do not run sync after applying file updates",
+    # agent-apply carries the only BooleanOptionalAction flags; skip building
+    # them unless agent-apply (or full help) is actually requested.
+    if command in (None, "agent-apply"):
+        _add_agent_apply_arguments(au)
+
+    setup = sub.add_parser(
+        "setup",
+        help="Setup authentication and VS Code integration",
+        parents=[config_parent],
     )
-    au.add_argument(
-        "--respect-status",
-        action=argparse.BooleanOptionalAction,
-        default=True,
-        help="Respect status for closing issues (default: true; use --no-respect-status to disable)",
-    )
-    au.add_argument(
-        "--dry-run-sync",
-        action=argparse.BooleanOptionalAction,
-        default=False,
-        help="Run a dry-run sync after file updates (default: true when --apply is not used; otherwise false unless explicitly enabled)",
-    )
-    au.add_argument(
-        "--summary-json",
-        help="Optional path to write sync summary json (passed through to sync)",
-    )
-    au.add_argument(
-        "--require-approval",
-        action="store_true",
-        help="Require explicit --approve acknowledgement before applying agent updates",
-    )
-    au.add_argument(
-        "--approve",
-        action="store_true",
-        help="Acknowledge review approval when used with --require-approval",
-    )
-
-    setup = sub.add_parser("setup", help="Setup authentication and VS Code integration")
     setup.add_argument("--create-env", action="store_true", help="Create sample .env file")
     setup.add_argument("--check-auth", action="store_true", help="Check authentication status")
     setup.add_argument("--vscode", action="store_true", help="Setup VS Code integration files")
@@ -389,7 +392,6 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Overwrite automation assets when rerunning setup",
     )
-    setup.add_argument("--config", default=CONFIG_DEFAULT)
     setup.add_argument(
         "--guided",
         action="store_true",
@@ -422,8 +424,11 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Include workflow, VS Code tasks, and gitignore entries",
     )
 
-    upgrade = sub.add_parser("upgrade", help="Check config for recommended IssueSuite updates")
-    upgrade.add_argument("--config", default=CONFIG_DEFAULT)
+    upgrade = sub.add_parser(
+        "upgrade",
+        help="Check config for recommended IssueSuite updates",
+        parents=[config_parent],
+    )
     upgrade.add_argument("--json", action="store_true")
 
     return p
@@ -434,27 +439,24 @@ def _cmd_export(cfg: SuiteConfig, args: argparse.Namespace) -> int:
 
     suite = IssueSuite(cfg)
     specs = suite.parse()
-    data: list[dict[str, object]] = [
-        {
-            "external_id": s.external_id,
-            "title": s.title,
-            "labels": s.labels,
-            "milestone": s.milestone,
-            "status": s.status,
-            "hash": s.hash,
-            "body": s.body,
-        }
-        for s in specs
-    ]
     out_path = Path(args.output or cfg.export_json)
-    out_path.write_text(
-        json.dumps(data, indent=2 if args.pretty else None) + ("\n" if args.pretty else "")
-    )
+    # Stream one spec at a time; output matches json.dumps(list, indent=2 | None).
+    with out_path.open("w") as fh:
+        fh.write("[\n  " if args.pretty and specs else "[")
+        for i, s in enumerate(specs):
+            if i:
+                fh.write(",\n  " if args.pretty else ", ")
+            item = dict(zip(_EXPORT_FIELDS, _export_values(s), strict=True))
+            if args.pretty:
+                fh.write(json.dumps(item, indent=2).replace("\n", "\n  "))
+            else:
+                json.dump(item, fh)
+        fh.write(("\n]\n" if specs else "]\n") if args.pretty else "]")
 
     if _should_print(args):
-        print_success(f"Exported {len(data)} issues to {out_path}")
+        print_success(f"Exported {len(specs)} issues to {out_path}")
     else:
-        print(f"[export] {len(data)} issues -> {out_path}")
+        print(f"[export] {len(specs)} issues -> {out_path}")
 
     return 0
 
@@ -510,19 +512,20 @@ def _write_plan_json(plan_path: str | None, summary: Any) -> None:
 def _resolve_plan_path(cfg: SuiteConfig, args: argparse.Namespace) -> str | None:
     if not args.dry_run:
         return None
-    plan_override = getattr(args, "plan_json", None)
+    plan_override = args.plan_json
     if isinstance(plan_override, str) and plan_override:
         return plan_override
-    return getattr(cfg, "plan_json", None)
+    return cfg.plan_json
 
 
 def _apply_update_alias(args: argparse.Namespace) -> None:
-    if not getattr(args, "apply", False) or getattr(args, "update", False):
+    if not args.apply or args.update:
         return
     args.update = True
 
 
 def _cmd_sync(cfg: SuiteConfig, args: argparse.Namespace) -> int:
+    from .orchestrator import sync_with_summary  # noqa: PLC0415
     from .ux import print_operation_status, print_summary_box  # noqa: PLC0415
 
     _apply_update_alias(args)
@@ -567,34 +570,57 @@ def _cmd_sync(cfg: SuiteConfig, args: argparse.Namespace) -> int:
     return 0
 
 
+def _write_if_changed(path: Path, payload: Any) -> bool:
+    """Write ``payload`` as pretty JSON unless ``path`` already holds identical bytes."""
+    data = (json.dumps(payload, indent=2) + "\n").encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+def _dumps_indented(payload: Any) -> str:
+    """Serialize ``payload`` as 2-space indented JSON (orjson-backed when installed)."""
+    return _json.dumps(payload, indent=True).decode("utf-8")
+
+
 def _cmd_schema(cfg: SuiteConfig, args: argparse.Namespace) -> int:
+    from .schemas import get_schemas  # noqa: PLC0415
     from .ux import print_error, print_success  # noqa: PLC0415
 
     schemas = get_schemas()
     if args.stdout:
-        print(json.dumps(schemas, indent=2))
+        print(_dumps_indented(schemas))
         return 0
     try:
-        files_written = []
-
-        Path(cfg.schema_export_file).write_text(json.dumps(schemas["export"], indent=2) + "\n")
-        files_written.append(cfg.schema_export_file)
-
-        Path(cfg.schema_summary_file).write_text(json.dumps(schemas["summary"], indent=2) + "\n")
-        files_written.append(cfg.schema_summary_file)
-
+        targets: list[tuple[str, Any]] = [
+            (cfg.schema_export_file, schemas["export"]),
+            (cfg.schema_summary_file, schemas["summary"]),
+        ]
         if "ai_context" in schemas and getattr(cfg, "schema_ai_context_file", None):
-            Path(cfg.schema_ai_context_file).write_text(
-                json.dumps(schemas["ai_context"], indent=2) + "\n"
-            )
-            files_written.append(cfg.schema_ai_context_file)
+            targets.append((cfg.schema_ai_context_file, schemas["ai_context"]))
+
+        files_written: list[str] = []
+        files_unchanged: list[str] = []
+        for filename, schema in targets:
+            if _write_if_changed(Path(filename), schema):
+                files_written.append(filename)
+            else:
+                files_unchanged.append(filename)
 
         if _should_print(args):
             print_success(f"Generated {len(files_written)} schema file(s)")
             for f in files_written:
                 print(f"  • {f}")
+            for f in files_unchanged:
+                print(f"  • {f} (unchanged)")
         else:
-            print(f"[schema] wrote {', '.join(files_written)}")
+            print(f"[schema] wrote {', '.join(files_written) or 'none'}")
+            if files_unchanged:
+                print(f"[schema] unchanged {', '.join(files_unchanged)}")
 
         return 0
     except Exception as e:  # pragma: no cover - rare filesystem error
@@ -603,8 +629,10 @@ def _cmd_schema(cfg: SuiteConfig, args: argparse.Namespace) -> int:
 
 
 def _print_lines(lines: Iterable[str]) -> None:
-    for line in lines:
-        print(line)
+    """Emit a block of lines with a single stdout write."""
+    block = "\n".join(lines)
+    if block:
+        sys.stdout.write(block + "\n")
 
 
 def _setup_create_env(auth_manager: Any) -> None:  # auth manager is dynamic, keep Any
@@ -627,12 +655,12 @@ def _setup_check_auth(
     )
     recs = auth_manager.get_authentication_recommendations()
     if recs:
-        print("[setup] Recommendations:")
-        for rec in recs:
-            print(f"  - {rec}")
+        _print_lines(["[setup] Recommendations:", *(f"  - {rec}" for rec in recs)])
 
 
 def _setup_vscode(*, force: bool = False) -> ScaffoldResult:
+    from .scaffold import write_vscode_assets  # noqa: PLC0415
+
     workspace = Path.cwd()
     vscode_dir = workspace / ".vscode"
     if force:
@@ -704,6 +732,9 @@ def _setup_show_help() -> None:
 
 
 def _cmd_setup(args: argparse.Namespace) -> int:
+    from .env_auth import create_env_auth_manager  # noqa: PLC0415
+    from .setup_wizard import run_guided_setup  # noqa: PLC0415
+
     auth_manager = create_env_auth_manager()
     if args.create_env:
         _setup_create_env(auth_manager)
@@ -720,7 +751,16 @@ def _cmd_setup(args: argparse.Namespace) -> int:
     return 0
 
 
+def _relative_to(path: Path, root: Path) -> Path:
+    try:
+        return path.relative_to(root)
+    except ValueError:
+        return path
+
+
 def _cmd_init(args: argparse.Namespace) -> int:
+    from .scaffold import scaffold_project  # noqa: PLC0415
+
     include: list[str] = list(args.include or [])
     if args.all_extras:
         include = ["workflow", "vscode", "gitignore"]
@@ -729,7 +769,9 @@ def _cmd_init(args: argparse.Namespace) -> int:
     for item in include:
         if item not in include_unique:
             include_unique.append(item)
-    target = Path(args.directory).resolve()
+    # scaffold_project joins every output onto ``target``, so no realpath is needed
+    # to print relative paths.
+    target = Path(args.directory)
     result = scaffold_project(
         target,
         issues_filename=args.issues_name,
@@ -737,25 +779,19 @@ def _cmd_init(args: argparse.Namespace) -> int:
         force=args.force,
         include=include_unique,
     )
-    for path in result.created:
-        print(f"[init] created {path.relative_to(target)}")
-    for path in result.skipped:
-        print(f"[init] skipped (exists) {path.relative_to(target)}")
+    _print_lines(f"[init] created {_relative_to(path, target)}" for path in result.created)
+    _print_lines(f"[init] skipped (exists) {_relative_to(path, target)}" for path in result.skipped)
     if not result.created:
         print("[init] no files created (all existed)")
     return 0
 
 
 class _QuietLogs:
-    """Context manager to silence 'issuesuite' logger for clean machine-readable output."""
+    """Context manager to silence logging for clean machine-readable output."""
 
     def __enter__(self) -> _QuietLogs:  # noqa: D401
-        self._logger = logging.getLogger("issuesuite")
-        self._prev_level = self._logger.level
-        self._prev_handlers = list(self._logger.handlers)
-        self._logger.handlers = []
-        self._logger.propagate = False
-        self._logger.setLevel(logging.CRITICAL + 10)
+        self._prev_disable = logging.root.manager.disable
+        logging.disable(logging.CRITICAL)
         return self
 
     def __exit__(
@@ -764,9 +800,7 @@ class _QuietLogs:
         exc: BaseException | None,
         tb: Any | None,
     ) -> None:  # noqa: D401
-        self._logger.setLevel(self._prev_level)
-        self._logger.handlers = self._prev_handlers
-        self._logger.propagate = True
+        logging.disable(self._prev_disable)
 
 
 def _cmd_validate(cfg: SuiteConfig) -> int:
@@ -774,7 +808,7 @@ def _cmd_validate(cfg: SuiteConfig) -> int:
     specs = suite.parse()
     print(f"[validate] parsed {len(specs)} specs")
     # minimal id pattern check
-    bad = [s.external_id for s in specs if not re.match(cfg.id_pattern, s.external_id)]
+    bad = [s.external_id for s in specs if not cfg.id_pattern_re.match(s.external_id)]
     if bad:
         print(f"[validate] invalid ids: {bad}", file=sys.stderr)
         return 1
@@ -784,11 +818,13 @@ def _cmd_validate(cfg: SuiteConfig) -> int:
 
 def _cmd_ai_context(cfg: SuiteConfig, args: argparse.Namespace) -> int:
     """Emit a JSON document summarizing current IssueSuite state for AI assistants."""
+    from .ai_context import get_ai_context  # noqa: PLC0415
+
     # Leverage shared library function for single source of truth
     doc = get_ai_context(cfg, preview=args.preview)
-    out_text = json.dumps(doc, indent=2) + "\n"
+    out_text = _dumps_indented(doc) + "\n"
     if args.output:
-        Path(args.output).write_text(out_text)
+        Path(args.output).write_text(out_text, encoding="utf-8")
     else:
         sys.stdout.write(out_text)
     return 0
@@ -809,6 +845,9 @@ def _read_updates_json(path: str | None) -> dict[str, Any] | list[dict[str, Any]
 
 
 def _cmd_agent_apply(cfg: SuiteConfig, args: argparse.Namespace) -> int:
+    from .agent_updates import apply_agent_updates  # noqa: PLC0415
+    from .orchestrator import sync_with_summary  # noqa: PLC0415
+
     # Load updates data
     try:
         updates_data = _read_updates_json(args.updates_json)
@@ -858,8 +897,20 @@ def _cmd_agent_apply(cfg: SuiteConfig, args: argparse.Namespace) -> int:
     return 0
 
 
+# Disallowed ASCII characters map to a sentinel so that runs of them (and only
+# them) collapse into a single hyphen, mirroring ``re.sub(r"[^a-zA-Z0-9-_]+", "-")``.
+_SLUG_SEP = "\x00"
+_SLUG_TABLE = str.maketrans(
+    {ch: _SLUG_SEP for ch in map(chr, range(128)) if not (ch.isalnum() or ch in "-_")}
+)
+_SLUG_SEP_RUN_RE = re.compile(_SLUG_SEP + "+")
+
+
 def _slugify(title: str) -> str:
-    base = re.sub(r"[^a-zA-Z0-9-_]+", "-", title.strip().lower()).strip("-")
+    base = title.strip().lower().translate(_SLUG_TABLE)
+    if not base.isascii():
+        base = "".join(ch if ch.isascii() else _SLUG_SEP for ch in base)
+    base = _SLUG_SEP_RUN_RE.sub("-", base).strip("-")
     if not base:
         base = "issue"
     return base[:50]
@@ -871,15 +922,22 @@ def _extract_issue_fields(
     title = str(it.get("title") or "").strip() or "Untitled"
     body = str(it.get("body") or "").strip()
     labels_raw: list[str] = []
-    for lbl in it.get("labels") or []:
-        if isinstance(lbl, dict):
-            name = lbl.get("name")
-            if isinstance(name, str) and name:
-                labels_raw.append(name)
-    ms = it.get("milestone")
-    milestone_title = (
-        ms.get("title") if isinstance(ms, dict) and isinstance(ms.get("title"), str) else None
-    )
+    # EAFP: the common shape is a dict with a string "name"/"title"; anything
+    # else (plain strings, None) raises and is skipped.
+    for lbl in it.get("labels") or ():
+        try:
+            name = lbl["name"]
+        except (TypeError, KeyError):
+            continue
+        if isinstance(name, str) and name:
+            labels_raw.append(name)
+    milestone_title: str | None
+    try:
+        ms_title = it["milestone"]["title"]
+    except (TypeError, KeyError):
+        milestone_title = None
+    else:
+        milestone_title = ms_title if isinstance(ms_title, str) else None
     state_val = str(it.get("state") or "").lower()
     status = state_val if state_val in {"open", "closed"} else None
     return title, body, labels_raw, milestone_title, status
@@ -893,6 +951,8 @@ def _render_issue_block(
     milestone: str | None,
     status: str | None,
 ) -> list[str]:
+    from .parser import render_issue_block  # noqa: PLC0415
+
     # Preserve import-time trimming but use shared renderer for formatting
     trimmed = re.sub(r"<!--\s*issuesuite:slug=[^>]+-->\s*", "", body)[:400].replace("```", "`\n`")
     if trimmed and not trimmed.endswith("\n"):
@@ -908,6 +968,8 @@ def _render_issue_block(
 
 
 def _cmd_import(cfg: SuiteConfig, args: argparse.Namespace) -> int:
+    from .github_issues import IssuesClient, IssuesClientConfig  # noqa: PLC0415
+
     client_cfg = IssuesClientConfig(
         repo=args.repo or cfg.github_repo,
         dry_run=False,
@@ -943,6 +1005,9 @@ def _cmd_import(cfg: SuiteConfig, args: argparse.Namespace) -> int:
 
 
 def _cmd_reconcile(cfg: SuiteConfig, args: argparse.Namespace) -> int:
+    from .github_issues import IssuesClient, IssuesClientConfig  # noqa: PLC0415
+    from .reconcile import format_report, reconcile  # noqa: PLC0415
+
     # Parse local specs
     suite = IssueSuite(cfg)
     try:
@@ -1080,6 +1145,8 @@ def _doctor_env_flags() -> tuple[bool, bool]:
 
 
 def _doctor_issue_list(repo: str | None, mock: bool, problems: list[str]) -> None:
+    from .github_issues import IssuesClient, IssuesClientConfig  # noqa: PLC0415
+
     if repo and not mock:
         try:
             client = IssuesClient(IssuesClientConfig(repo=repo, dry_run=False, mock=False))
@@ -1094,13 +1161,11 @@ def _doctor_emit_results(warnings: list[str], problems: list[str]) -> int:
 
     if warnings:
         print_warning(f"{len(warnings)} warning(s) detected:")
-        for w in warnings:
-            print(f"  • {w}")
+        _print_lines(f"  • {w}" for w in warnings)
 
     if problems:
         print_error(f"{len(problems)} problem(s) detected:")
-        for p in problems:
-            print(f"  • {p}")
+        _print_lines(f"  • {p}" for p in problems)
         return 2
 
     if not warnings:
@@ -1133,6 +1198,8 @@ def _cmd_doctor(cfg: SuiteConfig, args: argparse.Namespace) -> int:
 def _maybe_refresh_offline_advisories(requested: bool) -> None:
     if not requested:
         return
+    from .advisory_refresh import refresh_advisories  # noqa: PLC0415
+
     try:
         refresh_advisories()
     except Exception as exc:  # pragma: no cover - network/OSV availability
@@ -1175,6 +1242,8 @@ def _build_security_payload(
 
 
 def _emit_security_table(findings: Sequence[Finding], fallback_reason: str | None) -> None:
+    from .dependency_audit import render_findings_table  # noqa: PLC0415
+
     print(render_findings_table(findings))
     if fallback_reason:
         print(
@@ -1209,6 +1278,8 @@ def _write_security_json(path: Path, payload: dict[str, object]) -> None:
 def _maybe_run_pip_audit(args: argparse.Namespace, exit_code: int) -> int:
     if not args.pip_audit:
         return exit_code
+    from .pip_audit_integration import run_resilient_pip_audit  # noqa: PLC0415
+
     forwarded: list[str] = list(args.pip_audit_arg or [])
     if not any(arg.startswith("--progress-spinner") for arg in forwarded):
         forwarded = ["--progress-spinner", "off", *forwarded]
@@ -1238,17 +1309,26 @@ def _maybe_run_pip_audit(args: argparse.Namespace, exit_code: int) -> int:
 
 
 def _cmd_security(args: argparse.Namespace) -> int:
+    from .dependency_audit import (  # noqa: PLC0415
+        apply_allowlist,
+        collect_installed_packages,
+        load_advisories,
+        load_allowlist,
+        perform_audit,
+    )
+    from .pip_audit_integration import collect_online_findings  # noqa: PLC0415
+
     _maybe_refresh_offline_advisories(args.refresh_offline)
-    advisories = load_security_advisories()
+    advisories = load_advisories()
     packages = collect_installed_packages()
-    findings, fallback_reason = run_dependency_audit(
+    findings, fallback_reason = perform_audit(
         advisories=advisories,
         packages=packages,
         online_probe=not args.offline_only,
         online_collector=collect_online_findings,
     )
-    allowlist = load_security_allowlist()
-    findings, suppressed = apply_security_allowlist(findings, allowlist)
+    allowlist = load_allowlist()
+    findings, suppressed = apply_allowlist(findings, allowlist)
     output_payload = _build_security_payload(findings, fallback_reason, suppressed)
     if args.output_json:
         _write_security_json(Path(args.output_json), output_payload)
@@ -1274,6 +1354,8 @@ def _ensure_parent(path: Path | None) -> None:
 
 
 def _cmd_projects_status(args: argparse.Namespace) -> int:
+    from .projects_status import generate_report, render_comment, serialize_report  # noqa: PLC0415
+
     report = generate_report(
         next_steps_paths=args.next_steps,
         coverage_payload_path=args.coverage,
@@ -1353,6 +1435,12 @@ def _resolve_token(args: argparse.Namespace) -> str | None:
 
 
 def _cmd_projects_sync(cfg: SuiteConfig | None, args: argparse.Namespace) -> int:
+    from .github_projects_sync import (  # noqa: PLC0415
+        ProjectsSyncError,
+        build_config,
+        sync_projects,
+    )
+
     field_status = _resolve_field(cfg, getattr(args, "status_field", None), "status")
     field_coverage = _resolve_field(cfg, getattr(args, "coverage_field", None), "coverage")
     field_summary = _resolve_field(cfg, getattr(args, "summary_field", None), "summary")
@@ -1373,7 +1461,7 @@ def _cmd_projects_sync(cfg: SuiteConfig | None, args: argparse.Namespace) -> int
     token = _resolve_token(args)
 
     try:
-        sync_cfg = build_projects_sync_config(
+        sync_cfg = build_config(
             owner=owner,
             project_number=project_number,
             owner_type=owner_type,
@@ -1482,7 +1570,7 @@ def _cmd_upgrade(cfg: SuiteConfig, args: argparse.Namespace) -> int:
     suggestions = _collect_upgrade_suggestions(cfg)
     payload = {"suggestions": suggestions, "count": len(suggestions)}
     if getattr(args, "json", False):
-        print(json.dumps(payload, indent=2))
+        print(_dumps_indented(payload))
     elif not suggestions:
         print("[upgrade] configuration already aligned with recommended defaults")
     else:
@@ -1505,32 +1593,55 @@ def _require_cfg(cfg: SuiteConfig | None) -> SuiteConfig:
     return cfg
 
 
-def _build_handlers(args: argparse.Namespace, cfg: SuiteConfig | None) -> dict[str, Any]:
-    return {
-        "export": lambda: _cmd_export(_require_cfg(cfg), args),
-        "summary": lambda: _cmd_summary(_require_cfg(cfg), args),
-        "sync": lambda: _cmd_sync(_require_cfg(cfg), args),
-        "ai-context": lambda: _cmd_ai_context(_require_cfg(cfg), args),
-        "agent-apply": lambda: _cmd_agent_apply(_require_cfg(cfg), args),
-        "schema": lambda: _cmd_schema(_require_cfg(cfg), args),
-        "validate": lambda: _cmd_validate(_require_cfg(cfg)),
-        "setup": lambda: _cmd_setup(args),
-        "import": lambda: _cmd_import(_require_cfg(cfg), args),
-        "reconcile": lambda: _cmd_reconcile(_require_cfg(cfg), args),
-        "doctor": lambda: _cmd_doctor(_require_cfg(cfg), args),
-        "security": lambda: _cmd_security(args),
-        "projects-status": lambda: _cmd_projects_status(args),
-        "projects-sync": lambda: _cmd_projects_sync(cfg, args),
-        "init": lambda: _cmd_init(args),
-        "upgrade": lambda: _cmd_upgrade(_require_cfg(cfg), args),
-    }
+_CommandHandler = Callable[[SuiteConfig | None, argparse.Namespace], int]
+
+# Built once at import; commands that do not need a config simply ignore it.
+_HANDLERS: dict[str, _CommandHandler] = {
+    "export": lambda cfg, args: _cmd_export(_require_cfg(cfg), args),
+    "summary": lambda cfg, args: _cmd_summary(_require_cfg(cfg), args),
+    "sync": lambda cfg, args: _cmd_sync(_require_cfg(cfg), args),
+    "ai-context": lambda cfg, args: _cmd_ai_context(_require_cfg(cfg), args),
+    "agent-apply": lambda cfg, args: _cmd_agent_apply(_require_cfg(cfg), args),
+    "schema": lambda cfg, args: _cmd_schema(_require_cfg(cfg), args),
+    "validate": lambda cfg, _args: _cmd_validate(_require_cfg(cfg)),
+    "setup": lambda _cfg, args: _cmd_setup(args),
+    "import": lambda cfg, args: _cmd_import(_require_cfg(cfg), args),
+    "reconcile": lambda cfg, args: _cmd_reconcile(_require_cfg(cfg), args),
+    "doctor": lambda cfg, args: _cmd_doctor(_require_cfg(cfg), args),
+    "security": lambda _cfg, args: _cmd_security(args),
+    "projects-status": lambda _cfg, args: _cmd_projects_status(args),
+    "projects-sync": _cmd_projects_sync,
+    "init": lambda _cfg, args: _cmd_init(args),
+    "upgrade": lambda cfg, args: _cmd_upgrade(_require_cfg(cfg), args),
+}
+
+
+def _get_parser(command: str | None) -> argparse.ArgumentParser:
+    """Return the parser for ``command``, built once per process and reused.
+
+    The grammar depends only on ``command`` (no environment reads), so cached
+    parsers stay valid for repeated in-process invocations. Tokens that are not
+    subcommands all share the full parser, so the cache holds at most one parser
+    per subcommand however many mistyped commands a process sees.
+    """
+    return _cached_parser(command if command in _HANDLERS else None)
+
+
+@functools.cache
+def _cached_parser(command: str | None) -> argparse.ArgumentParser:
+    return _build_parser(command)
 
 
 def main(argv: list[str] | None = None) -> int:
-    parser = _build_parser()
+    parser = _get_parser(_sniff_subcommand(argv))
     args = parser.parse_args(argv)
+    # Runtime/telemetry helpers are imported after parsing so --help stays cheap.
+    from issuesuite.runtime import execute_command, prepare_config  # noqa: PLC0415
+
     exporter = os.environ.get("ISSUESUITE_OTEL_EXPORTER")
     if exporter:
+        from issuesuite.observability import configure_telemetry  # noqa: PLC0415
+
         configure_telemetry(
             service_name=os.environ.get("ISSUESUITE_SERVICE_NAME", "issuesuite-cli"),
             exporter="otlp" if exporter.lower() == "otlp" else "console",
@@ -1539,12 +1650,11 @@ def main(argv: list[str] | None = None) -> int:
     if not getattr(args, "quiet", False) and os.environ.get("ISSUESUITE_QUIET") == "1":
         args.quiet = True
     cfg = prepare_config(args)
-    handlers = _build_handlers(args, cfg)
-    handler = handlers.get(args.cmd)
+    handler = _HANDLERS.get(args.cmd)
     if handler is None:  # pragma: no cover - argparse enforces valid choices
         parser.print_help()
         return 1
-    return execute_command(handler, args, cfg, args.cmd)
+    return execute_command(functools.partial(handler, cfg, args), args, cfg, args.cmd)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -8,41 +8,358 @@ from __future__ import annotations
 
 import asyncio
 import functools
+import inspect
 import json
 import subprocess  # nosec B404 - required for invoking GitHub CLI commands
+import sys
+import threading
 import time
-from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
 from types import TracebackType
-from typing import Any, TypeVar
+from typing import Any, TypeVar, cast
 
+import requests
+
+from .github_rest import DEFAULT_API_URL, DEFAULT_GRAPHQL_URL, GitHubAPIError, GitHubRestClient
 from .logging import get_logger
 
 T = TypeVar("T")
 R = TypeVar("R")
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Aliased mutations per GraphQL document; keeps each request well under
+# GitHub's node/complexity limits.
+GRAPHQL_BATCH_SIZE = 50
+
+# Conditional-request cache for issue listing (ETag + decoded page per URL).
+ETAG_CACHE_PATH = Path(".issuesuite") / "etag-cache.json"
+_ISSUES_FIRST_PAGE = "repos/{owner}/{repo}/issues?state=all&per_page=100"
+_ISSUES_LIMIT = 1000
+# Only the fields sync reads; unlike the REST issues endpoint, PRs are never listed.
+_ISSUES_GRAPHQL_QUERY = """\
+query($owner: String!, $name: String!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, after: $after, states: [OPEN, CLOSED]) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number title body state
+        labels(first: 100) { nodes { name } }
+        milestone { number title }
+      }
+    }
+  }
+}"""
+_API_ROOT = "https://api.github.com/"
+HTTP_OK = 200
+HTTP_NOT_MODIFIED = 304
+HTTP_REDIRECT_STATUS = 300
 
 
 class ConcurrencyConfig:
     """Configuration for concurrency settings."""
 
-    def __init__(self, enabled: bool = False, max_workers: int = 4, batch_size: int = 10):
+    __slots__ = (
+        "enabled",
+        "max_workers",
+        "batch_size",
+        "requests_per_second",
+        "mock_latency",
+        "transport",
+    )
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        max_workers: int = 4,
+        batch_size: int = 10,
+        requests_per_second: float = 10.0,
+        mock_latency: float = 0.0,
+        transport: str = "gh",
+    ):
         self.enabled = enabled
         self.max_workers = max_workers
         self.batch_size = batch_size
+        # Token-bucket ceiling for GitHub calls; <= 0 disables client-side pacing.
+        self.requests_per_second = requests_per_second
+        # Simulated per-command delay in mock mode (seconds); 0 keeps tests fast.
+        self.mock_latency = mock_latency
+        # "gh" spawns the GitHub CLI per call; "http" uses a pooled REST session.
+        self.transport = transport
+
+
+class RateLimiter:
+    """Token bucket whose refill rate adapts to GitHub rate-limit headers.
+
+    The configured rate is a ceiling; ``update_from_headers`` lowers the refill
+    rate so the remaining quota is spread evenly until the reset time. Coroutines
+    wait with ``acquire``; worker threads making blocking calls use
+    ``acquire_blocking``. The bucket itself is guarded by a thread lock that is
+    never held while waiting.
+    """
+
+    _MIN_RATE = 1 / 60
+
+    def __init__(self, requests_per_second: float) -> None:
+        self.max_rate = requests_per_second
+        self.refill_rate = requests_per_second
+        self.capacity = max(1.0, requests_per_second)
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+
+    def _try_take(self) -> float:
+        """Consume a token and return 0, or return the seconds until one is due."""
+        with self._lock:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.refill_rate
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        if self.max_rate <= 0:
+            return
+        while (wait := self._try_take()) > 0:
+            await asyncio.sleep(wait)
+
+    def acquire_blocking(self) -> None:
+        """``acquire`` for threads: sleep until a token is available and consume it."""
+        if self.max_rate <= 0:
+            return
+        while (wait := self._try_take()) > 0:
+            time.sleep(wait)
+
+    def update_from_headers(self, headers: dict[str, str]) -> None:
+        """Retune the refill rate from ``X-RateLimit-Remaining``/``X-RateLimit-Reset``."""
+        if self.max_rate <= 0:
+            return
+        try:
+            remaining = int(headers["x-ratelimit-remaining"])
+            reset_at = float(headers["x-ratelimit-reset"])
+        except (KeyError, ValueError):
+            return
+        window = max(reset_at - time.time(), 1.0)
+        with self._lock:
+            # Bank tokens earned at the old rate before switching to the new one.
+            self._refill()
+            if remaining <= 0:
+                self.tokens = 0.0
+                self.refill_rate = max(1 / window, self._MIN_RATE)
+                return
+            self.refill_rate = min(self.max_rate, max(remaining / window, self._MIN_RATE))
+
+
+class AdaptiveConcurrencyLimit:
+    """Cap on in-flight ``gh`` calls that adapts to observed service time.
+
+    A short-term EWMA of call duration is compared with a slow long-term
+    baseline every few completions. When calls slow down relative to the
+    baseline the link is saturated and the cap shrinks proportionally; while
+    they keep pace it grows by one slot. The cap stays within ``[1, ceiling]``.
+    """
+
+    _SHORT_ALPHA = 0.3
+    _LONG_ALPHA = 0.05
+    _ADJUST_EVERY = 8
+    _MIN_GRADIENT = 0.5
+
+    def __init__(self, initial: int, ceiling: int) -> None:
+        self.ceiling = max(1, ceiling)
+        self.limit = min(max(1, initial), self.ceiling)
+        self.short_ewma: float | None = None
+        self.long_ewma: float | None = None
+        self._in_flight = 0
+        self._completed = 0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def release(self, elapsed: float) -> bool:
+        """Record a finished call; return True when the cap was re-evaluated."""
+        async with self._cond:
+            self._in_flight -= 1
+            adjusted = self._record(elapsed)
+            self._cond.notify_all()
+        return adjusted
+
+    def _record(self, elapsed: float) -> bool:
+        if self.short_ewma is None or self.long_ewma is None:
+            self.short_ewma = self.long_ewma = elapsed
+        else:
+            self.short_ewma += self._SHORT_ALPHA * (elapsed - self.short_ewma)
+            self.long_ewma += self._LONG_ALPHA * (elapsed - self.long_ewma)
+        self._completed += 1
+        if self._completed % self._ADJUST_EVERY or self.short_ewma <= 0:
+            return False
+        gradient = min(1.0, max(self._MIN_GRADIENT, self.long_ewma / self.short_ewma))
+        self.limit = min(self.ceiling, max(1, int(self.limit * gradient) + 1))
+        return True
+
+
+_SHARED_REST_CLIENTS: dict[tuple[str, str, str, str], GitHubRestClient] = {}
+_SHARED_REST_LOCK = threading.Lock()
+
+
+def _get_shared_rest_client(token: str, repo: str) -> GitHubRestClient:
+    """Return the process-wide REST client for ``(token, repo)`` and the API endpoint.
+
+    Every ``HttpGitHubClient`` for the same repository shares one ``requests``
+    session, so keep-alive connections (and their TLS handshakes) outlive a
+    single sync. Endpoints come from ``ISSUESUITE_GITHUB_API`` and
+    ``ISSUESUITE_GITHUB_GRAPHQL``, as for ``IssuesClient``, so GitHub Enterprise
+    hosts work over either transport.
+    """
+    from .github_issues import IssuesClient  # noqa: PLC0415 - github_issues imports this module
+
+    base_url = IssuesClient._clean_env("ISSUESUITE_GITHUB_API", DEFAULT_API_URL)
+    graphql_url = IssuesClient._clean_env("ISSUESUITE_GITHUB_GRAPHQL", DEFAULT_GRAPHQL_URL)
+    key = (token, repo, base_url, graphql_url)
+    with _SHARED_REST_LOCK:
+        client = _SHARED_REST_CLIENTS.get(key)
+        if client is None:
+            client = _SHARED_REST_CLIENTS[key] = GitHubRestClient(
+                token=token, repo=repo, base_url=base_url, graphql_url=graphql_url
+            )
+        return client
+
+
+@dataclass(frozen=True)
+class IssueUpdate:
+    """A single issue edit to be applied as part of a GraphQL batch."""
+
+    number: int
+    body: str | None = None
+    labels: tuple[str, ...] = ()
+    milestone: str | None = None
+
+
+def _gql_str(value: str) -> str:
+    # JSON string literals are valid GraphQL string literals.
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _update_mutations(
+    index: int,
+    issue_id: str,
+    update: IssueUpdate,
+    label_ids: list[str],
+    milestone_id: str | None,
+) -> list[str]:
+    """Render the aliased mutation fields for one resolved ``IssueUpdate``."""
+    mutations: list[str] = []
+    fields = [f"id: {_gql_str(issue_id)}"]
+    if update.body:
+        fields.append(f"body: {_gql_str(update.body)}")
+    if milestone_id:
+        fields.append(f"milestoneId: {_gql_str(milestone_id)}")
+    if len(fields) > 1:
+        mutations.append(
+            f"u{index}: updateIssue(input: {{{', '.join(fields)}}}) {{ issue {{ number }} }}"
+        )
+    if label_ids:
+        ids = ", ".join(_gql_str(lid) for lid in label_ids)
+        mutations.append(
+            f"a{index}: addLabelsToLabelable(input: {{labelableId: {_gql_str(issue_id)}, "
+            f"labelIds: [{ids}]}}) {{ clientMutationId }}"
+        )
+    return mutations
+
+
+def _parse_http_response(raw: str) -> tuple[int, dict[str, str], str]:
+    """Split ``gh api -i`` output into status code, lower-cased headers and body."""
+    head, _, body = raw.replace("\r\n", "\n").partition("\n\n")
+    lines = head.split("\n")
+    try:
+        status = int(lines[0].split()[1])
+    except (IndexError, ValueError):
+        status = 0
+    headers: dict[str, str] = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return status, headers, body
+
+
+def _next_page(link_header: str | None) -> str | None:
+    """Return the ``rel="next"`` endpoint from a Link header, relative to the API root."""
+    for part in (link_header or "").split(","):
+        url, _, rel = part.partition(";")
+        if 'rel="next"' in rel:
+            url = url.strip().strip("<>")
+            return url[len(_API_ROOT) :] if url.startswith(_API_ROOT) else url
+    return None
+
+
+def _project_issue(item: dict[str, Any]) -> dict[str, Any]:
+    """Reduce a REST issue payload to the fields ``gh issue list --json`` used to emit."""
+    milestone = item.get("milestone")
+    return {
+        "number": item.get("number"),
+        "title": item.get("title"),
+        "body": item.get("body"),
+        "labels": [{"name": lbl.get("name")} for lbl in item.get("labels") or []],
+        "milestone": (
+            {"number": milestone.get("number"), "title": milestone.get("title")}
+            if isinstance(milestone, dict)
+            else None
+        ),
+        "state": str(item.get("state") or "").upper(),
+    }
+
+
+def _project_graphql_issue(node: dict[str, Any]) -> dict[str, Any]:
+    """Reduce a GraphQL issue node to the same shape as ``_project_issue``."""
+    labels = (node.get("labels") or {}).get("nodes") or []
+    return _project_issue({**node, "labels": labels})
 
 
 class AsyncGitHubClient:
     """Async wrapper for GitHub CLI operations."""
 
-    def __init__(self, concurrency_config: ConcurrencyConfig, mock: bool = False):
+    __slots__ = (
+        "config",
+        "mock",
+        "logger",
+        "_mock_latency",
+        "_limit",
+        "_rate_limiter",
+        "_etag_cache_path",
+        "_etag_cache",
+    )
+
+    def __init__(
+        self,
+        concurrency_config: ConcurrencyConfig,
+        mock: bool = False,
+        etag_cache_path: Path | None = None,
+    ):
         self.config = concurrency_config
         self.mock = mock
         self.logger = get_logger()
-        self._executor: ThreadPoolExecutor | None = None
+        # Settings are fixed for the client's lifetime; read them once here.
+        self._mock_latency = concurrency_config.mock_latency
+        self._limit = AdaptiveConcurrencyLimit(
+            concurrency_config.max_workers, concurrency_config.max_workers * 2
+        )
+        self._rate_limiter = RateLimiter(concurrency_config.requests_per_second)
+        self._etag_cache_path = etag_cache_path or ETAG_CACHE_PATH
+        self._etag_cache: dict[str, dict[str, Any]] | None = None
 
     def __enter__(self) -> AsyncGitHubClient:
-        if self.config.enabled:
-            self._executor = ThreadPoolExecutor(max_workers=self.config.max_workers)
+        if self._etag_cache is None and not self.mock:
+            self._etag_cache = self._load_etag_cache()
         return self
 
     def __exit__(
@@ -51,8 +368,7 @@ class AsyncGitHubClient:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        if self._executor:
-            self._executor.shutdown(wait=True)
+        return None
 
     async def __aenter__(self) -> AsyncGitHubClient:
         # Delegate to sync __enter__ to avoid duplicate logic
@@ -67,40 +383,61 @@ class AsyncGitHubClient:
         # Delegate to sync __exit__ to avoid duplicate logic
         self.__exit__(exc_type, exc_val, exc_tb)
 
-    async def _run_command_async(self, cmd: list[str]) -> tuple[bool, str]:
-        """Run a command asynchronously."""
-        if self.mock:
-            # Simulate some work
-            await asyncio.sleep(0.01)
-            return True, f"MOCK: {' '.join(cmd)}"
+    def _load_etag_cache(self) -> dict[str, dict[str, Any]]:
+        try:
+            data = json.loads(self._etag_cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
 
-        if not self.config.enabled or not self._executor:
-            # Fallback to background thread to avoid blocking event loop
-            loop = asyncio.get_event_loop()
-            try:
-                result = await loop.run_in_executor(
-                    None,
-                    functools.partial(
-                        subprocess.run,
-                        cmd,
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                    ),
-                )
-                return True, result.stdout
-            except subprocess.CalledProcessError as e:
-                return False, f"Error: {e}"
+    def _save_etag_cache(self, cache: dict[str, dict[str, Any]]) -> None:
+        try:
+            self._etag_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._etag_cache_path.write_text(json.dumps(cache), encoding="utf-8")
+        except OSError as exc:  # pragma: no cover - filesystem edge
+            self.logger.debug("Failed to persist ETag cache", error=str(exc))
 
-        # Run in thread pool
+    async def _exec(
+        self, cmd: Sequence[str], stdin: bytes | None = None
+    ) -> tuple[int, bytes, bytes]:
+        """Spawn ``cmd`` on the event loop and return (returncode, stdout, stderr)."""
+        # The adaptive limit keeps the number of in-flight ``gh`` processes near
+        # what the link sustains; the rate limiter paces how quickly new ones start.
+        await self._rate_limiter.acquire()
+        await self._limit.acquire()
+        started = time.perf_counter()
         try:
-            result = await asyncio.get_event_loop().run_in_executor(
-                self._executor,
-                functools.partial(subprocess.run, cmd, capture_output=True, text=True, check=True),
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE if stdin is not None else None,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
-            return True, result.stdout
-        except subprocess.CalledProcessError as e:
-            return False, f"Error: {e}"
+            stdout, stderr = await proc.communicate(stdin)
+        finally:
+            elapsed = time.perf_counter() - started
+            if await self._limit.release(elapsed):
+                self.logger.log_performance(
+                    "gh_call_latency",
+                    (self._limit.short_ewma or elapsed) * 1000,
+                    concurrency_limit=self._limit.limit,
+                )
+        return proc.returncode or 0, stdout, stderr
+
+    async def _run_command_async(
+        self, cmd: Sequence[str], stdin: bytes | None = None
+    ) -> tuple[bool, str]:
+        """Run a command asynchronously, optionally feeding ``stdin`` to it."""
+        if self.mock:
+            if self._mock_latency > 0:
+                await asyncio.sleep(self._mock_latency)
+            return True, f"MOCK: {' '.join(cmd)}"
+
+        returncode, stdout, stderr = await self._exec(cmd, stdin)
+        if returncode != 0:
+            error = subprocess.CalledProcessError(returncode, cmd, stdout, stderr)
+            return False, f"Error: {error}"
+        return True, stdout.decode()
 
     async def create_issue_async(
         self,
@@ -110,11 +447,11 @@ class AsyncGitHubClient:
         milestone: str | None = None,
     ) -> tuple[bool, str]:
         """Create an issue asynchronously."""
-        cmd = ["gh", "issue", "create", "--title", title, "--body", body]
+        cmd: tuple[str, ...] = ("gh", "issue", "create", "--title", title, "--body", body)
         if labels:
-            cmd += ["--label", ",".join(labels)]
+            cmd += ("--label", ",".join(labels))
         if milestone:
-            cmd += ["--milestone", milestone]
+            cmd += ("--milestone", milestone)
 
         self.logger.debug("Creating issue async", title=title[:50])
         return await self._run_command_async(cmd)
@@ -127,84 +464,423 @@ class AsyncGitHubClient:
         milestone: str | None = None,
     ) -> tuple[bool, str]:
         """Update an issue asynchronously."""
+        number = str(issue_number)
+        edit = ("gh", "issue", "edit", number)
+        commands: list[tuple[str, ...]] = []
+        if labels:
+            commands.append((*edit, "--add-label", ",".join(labels)))
+        if milestone:
+            commands.append((*edit, "--milestone", milestone))
+        if body:
+            commands.append(
+                (
+                    "gh",
+                    "api",
+                    f"repos/:owner/:repo/issues/{number}",
+                    "--method",
+                    "PATCH",
+                    "-f",
+                    f"body={body}",
+                )
+            )
+
         success = True
         messages = []
-
-        if labels:
-            cmd = [
-                "gh",
-                "issue",
-                "edit",
-                str(issue_number),
-                "--add-label",
-                ",".join(labels),
-            ]
+        for cmd in commands:
             result, msg = await self._run_command_async(cmd)
             success = success and result
             messages.append(msg)
+        return success, "\n".join(messages)
 
-        if milestone:
-            cmd = ["gh", "issue", "edit", str(issue_number), "--milestone", milestone]
-            result, msg = await self._run_command_async(cmd)
-            success = success and result
-            messages.append(msg)
+    async def batch_update_issues_async(
+        self, updates: list[IssueUpdate], repo: str | None = None
+    ) -> list[tuple[bool, str]]:
+        """Apply many issue edits with two GraphQL requests per chunk.
 
-        if body:
-            cmd = [
-                "gh",
-                "api",
-                f"repos/:owner/:repo/issues/{issue_number}",
-                "--method",
-                "PATCH",
-                "-f",
-                f"body={body}",
-            ]
-            result, msg = await self._run_command_async(cmd)
-            success = success and result
-            messages.append(msg)
+        Node ids for issues, labels and milestones are resolved with one aliased
+        query, then all edits are sent as one aliased mutation. ``repo``
+        (``owner/name``) targets that repository instead of the one ``gh``
+        infers from the working directory. Results are returned in the same
+        order as ``updates``.
+        """
+        owner, _, name = (repo or "").partition("/")
+        if owner and name:
+            repo_fields = ("-f", f"owner={owner}", "-f", f"name={name}")
+        else:
+            repo_fields = ("-F", "owner={owner}", "-F", "name={repo}")
+        results: list[tuple[bool, str]] = []
+        for start in range(0, len(updates), GRAPHQL_BATCH_SIZE):
+            chunk = updates[start : start + GRAPHQL_BATCH_SIZE]
+            if self.mock:
+                results.extend((True, f"MOCK: graphql update #{u.number}") for u in chunk)
+                continue
+            results.extend(await self._batch_update_chunk(chunk, repo_fields))
+        return results
 
-        return success, "\n".join(messages)
+    async def _graphql_async(
+        self, query: str, *fields: str
+    ) -> tuple[dict[str, Any], list[dict[str, Any]], str | None]:
+        cmd = ["gh", "api", "graphql", *fields, "-F", "query=@-"]
+        success, output = await self._run_command_async(cmd, stdin=query.encode("utf-8"))
+        if not success:
+            return {}, [], output
+        try:
+            payload = json.loads(output)
+        except json.JSONDecodeError as exc:
+            return {}, [], f"Error: invalid GraphQL response ({exc})"
+        return payload.get("data") or {}, payload.get("errors") or [], None
+
+    async def _batch_update_chunk(
+        self, chunk: list[IssueUpdate], repo_fields: Sequence[str]
+    ) -> list[tuple[bool, str]]:
+        label_alias = {
+            name: f"l{i}"
+            for i, name in enumerate(dict.fromkeys(n for u in chunk for n in u.labels))
+        }
+        milestone_alias = {
+            title: f"m{i}"
+            for i, title in enumerate(dict.fromkeys(u.milestone for u in chunk if u.milestone))
+        }
+        lookups = [f"i{i}: issue(number: {u.number}) {{ id }}" for i, u in enumerate(chunk)]
+        lookups += [f"{a}: label(name: {_gql_str(n)}) {{ id }}" for n, a in label_alias.items()]
+        lookups += [
+            f"{a}: milestones(query: {_gql_str(t)}, first: 10) {{ nodes {{ id title }} }}"
+            for t, a in milestone_alias.items()
+        ]
+        query = (
+            "query($owner: String!, $name: String!) {\n"
+            "  repository(owner: $owner, name: $name) {\n    " + "\n    ".join(lookups) + "\n  }\n}"
+        )
+        data, _errors, failure = await self._graphql_async(query, *repo_fields)
+        if failure is not None:
+            return [(False, failure)] * len(chunk)
+        repo = data.get("repository") or {}
+
+        def _node_id(alias: str) -> str | None:
+            node = repo.get(alias)
+            return node.get("id") if isinstance(node, dict) else None
+
+        def _milestone_id(title: str) -> str | None:
+            nodes = (repo.get(milestone_alias[title]) or {}).get("nodes") or []
+            return next((n["id"] for n in nodes if n.get("title") == title), None)
+
+        results: list[tuple[bool, str]] = [(True, "")] * len(chunk)
+        mutations: list[str] = []
+        for i, update in enumerate(chunk):
+            issue_id = _node_id(f"i{i}")
+            if issue_id is None:
+                results[i] = (False, f"Error: issue #{update.number} not found")
+                continue
+            label_ids = [_node_id(label_alias[n]) for n in update.labels]
+            milestone_id = _milestone_id(update.milestone) if update.milestone else None
+            missing = [n for n, lid in zip(update.labels, label_ids, strict=True) if lid is None]
+            if update.milestone and milestone_id is None:
+                missing.append(f"milestone {update.milestone}")
+            if missing:
+                results[i] = (False, f"Error: #{update.number} unknown {', '.join(missing)}")
+                continue
+            mutations.extend(
+                _update_mutations(
+                    i, issue_id, update, [lid for lid in label_ids if lid], milestone_id
+                )
+            )
+            results[i] = (True, f"updated #{update.number}")
+
+        if not mutations:
+            return results
+        self.logger.debug("Batch updating issues via GraphQL", count=len(mutations))
+        _data, errors, failure = await self._graphql_async(
+            "mutation {\n  " + "\n  ".join(mutations) + "\n}"
+        )
+        if failure is not None:
+            return [r if not r[0] else (False, failure) for r in results]
+        for err in errors:
+            path = err.get("path") or []
+            alias = path[0] if path and isinstance(path[0], str) else ""
+            if alias[1:].isdigit():
+                idx = int(alias[1:])
+                results[idx] = (False, f"Error: {err.get('message', 'GraphQL error')}")
+        return results
 
     async def close_issue_async(self, issue_number: int) -> tuple[bool, str]:
         """Close an issue asynchronously."""
-        cmd = ["gh", "issue", "close", str(issue_number)]
-        return await self._run_command_async(cmd)
+        return await self._run_command_async(("gh", "issue", "close", str(issue_number)))
+
+    async def iter_issues_async(self) -> AsyncIterator[dict[str, Any]]:
+        """Yield issues page by page as each ``gh api`` response arrives.
+
+        Pages are requested with ``If-None-Match`` using ETags cached from the
+        previous run; a 304 reuses the cached page without re-downloading it.
+        Raises ``subprocess.CalledProcessError`` or ``ValueError`` when a page
+        cannot be fetched or decoded.
+        """
+        if self.mock:
+            return
+
+        cache = self._etag_cache
+        if cache is None:
+            cache = self._etag_cache = self._load_etag_cache()
+        dirty = False
+        remaining = _ISSUES_LIMIT
+        url: str | None = _ISSUES_FIRST_PAGE
+        try:
+            while url and remaining > 0:
+                entry = cache.get(url)
+                cmd = ["gh", "api", "-i", url]
+                if entry and entry.get("etag"):
+                    cmd += ["-H", f"If-None-Match: {entry['etag']}"]
+                returncode, stdout, stderr = await self._exec(cmd)
+                status, headers, body = _parse_http_response(stdout.decode())
+                self._rate_limiter.update_from_headers(headers)
+                if status == HTTP_NOT_MODIFIED and entry:
+                    page = entry.get("issues") or []
+                    next_url = entry.get("next")
+                elif returncode == 0 and HTTP_OK <= status < HTTP_REDIRECT_STATUS:
+                    page = [
+                        _project_issue(it) for it in json.loads(body) if "pull_request" not in it
+                    ]
+                    next_url = _next_page(headers.get("link"))
+                    if headers.get("etag"):
+                        cache[url] = {"etag": headers["etag"], "issues": page, "next": next_url}
+                        dirty = True
+                elif returncode != 0:
+                    raise subprocess.CalledProcessError(returncode, cmd, stdout, stderr)
+                else:
+                    raise ValueError(f"unexpected HTTP status {status} for {url}")
+                for issue in page[:remaining]:
+                    yield issue
+                remaining -= len(page)
+                url = next_url
+        finally:
+            if dirty:
+                self._save_etag_cache(cache)
 
     async def get_issues_async(self) -> tuple[bool, list[dict[str, Any]]]:
-        """Get all issues asynchronously."""
-        cmd = [
-            "gh",
-            "issue",
-            "list",
-            "--state",
-            "all",
-            "--limit",
-            "1000",
-            "--json",
-            "number,title,body,labels,milestone,state",
-        ]
+        """Get all issues asynchronously (see ``iter_issues_async``)."""
+        try:
+            return True, [issue async for issue in self.iter_issues_async()]
+        except (subprocess.CalledProcessError, ValueError):
+            return False, []
 
-        success, output = await self._run_command_async(cmd)
-        if success and not self.mock:
-            try:
-                issues = json.loads(output)
-                return True, issues
-            except json.JSONDecodeError:
-                return False, []
-        elif self.mock:
-            # Return mock issues
+    async def iter_issues_graphql_async(self) -> AsyncIterator[dict[str, Any]]:
+        """Yield issues from a cursor-paginated GraphQL query, 100 per request.
+
+        Requests only the fields sync reads and never returns pull requests, at
+        the cost of the per-page ETag reuse ``iter_issues_async`` gets. Raises
+        ``ValueError`` when a page cannot be fetched.
+        """
+        if self.mock:
+            return
+        remaining = _ISSUES_LIMIT
+        after: str | None = None
+        while remaining > 0:
+            fields = ["-F", "owner={owner}", "-F", "name={repo}"]
+            if after:
+                fields += ["-f", f"after={after}"]
+            data, errors, failure = await self._graphql_async(_ISSUES_GRAPHQL_QUERY, *fields)
+            if failure is not None:
+                raise ValueError(failure)
+            issues = (data.get("repository") or {}).get("issues")
+            if not isinstance(issues, dict):
+                message = errors[0].get("message") if errors else "no issues in response"
+                raise ValueError(f"GraphQL issue listing failed: {message}")
+            nodes = issues.get("nodes") or []
+            for node in nodes[:remaining]:
+                yield _project_graphql_issue(node)
+            remaining -= len(nodes)
+            page_info = issues.get("pageInfo") or {}
+            after = page_info.get("endCursor")
+            if not page_info.get("hasNextPage") or not after:
+                return
+
+    async def get_issues_graphql_async(self) -> tuple[bool, list[dict[str, Any]]]:
+        """Get all issues via GraphQL (see ``iter_issues_graphql_async``)."""
+        try:
+            return True, [issue async for issue in self.iter_issues_graphql_async()]
+        except ValueError:
+            return False, []
+
+
+def _resolve_token() -> str | None:
+    """Return the token ``IssuesClient`` would use, falling back to ``gh auth token``."""
+    from .github_issues import IssuesClient  # noqa: PLC0415 - github_issues imports this module
+
+    token = IssuesClient._select_token()
+    if token:
+        return token
+    try:
+        result = subprocess.run(  # nosec B603 B607 - fixed gh invocation
+            ["gh", "auth", "token"], capture_output=True, text=True, check=False
+        )
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+class HttpGitHubClient:
+    """Async GitHub client that calls the REST API over a pooled HTTP session.
+
+    Avoids spawning a ``gh`` process per operation: requests share keep-alive
+    connections, and the blocking calls run in worker threads under the same
+    adaptive cap and rate limiter as ``AsyncGitHubClient``. The token is
+    resolved once, when the client is entered, and the underlying session is
+    shared with every other client for the same token and repository.
+    """
+
+    __slots__ = (
+        "config",
+        "mock",
+        "logger",
+        "repo",
+        "_token",
+        "_rest",
+        "_limit",
+        "_rate_limiter",
+    )
+
+    def __init__(
+        self,
+        concurrency_config: ConcurrencyConfig,
+        repo: str,
+        mock: bool = False,
+        token: str | None = None,
+        rest_client: GitHubRestClient | None = None,
+    ):
+        self.config = concurrency_config
+        self.mock = mock
+        self.logger = get_logger()
+        self.repo = repo
+        self._token = token
+        self._rest = rest_client
+        self._limit = AdaptiveConcurrencyLimit(
+            concurrency_config.max_workers, concurrency_config.max_workers * 2
+        )
+        self._rate_limiter = RateLimiter(concurrency_config.requests_per_second)
+
+    def __enter__(self) -> HttpGitHubClient:
+        if self._rest is None and not self.mock:
+            token = self._token or _resolve_token()
+            if not token:
+                raise GitHubAPIError("No GitHub token available for the http transport")
+            self._rest = _get_shared_rest_client(token, self.repo)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        return None
+
+    async def __aenter__(self) -> HttpGitHubClient:
+        return self.__enter__()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.__exit__(exc_type, exc_val, exc_tb)
+
+    async def _call(self, func: Callable[..., T], **kwargs: Any) -> tuple[bool, T | str]:
+        await self._rate_limiter.acquire()
+        await self._limit.acquire()
+        started = time.perf_counter()
+        try:
+            return True, await asyncio.to_thread(functools.partial(func, **kwargs))
+        except (GitHubAPIError, requests.RequestException) as exc:
+            return False, f"Error: {exc}"
+        finally:
+            await self._limit.release(time.perf_counter() - started)
+
+    def _client(self) -> GitHubRestClient:
+        if self._rest is None:
+            raise GitHubAPIError("HttpGitHubClient must be entered before use")
+        return self._rest
+
+    async def create_issue_async(
+        self,
+        title: str,
+        body: str,
+        labels: list[str] | None = None,
+        milestone: str | None = None,
+    ) -> tuple[bool, str]:
+        """Create an issue with a single POST."""
+        if self.mock:
+            return True, f"MOCK: POST /repos/{self.repo}/issues {title}"
+        ok, number = await self._call(
+            self._client().create_issue, title=title, body=body, labels=labels, milestone=milestone
+        )
+        return (True, f"created #{number}") if ok else (False, str(number))
+
+    async def update_issue_async(
+        self,
+        issue_number: int,
+        body: str | None = None,
+        labels: list[str] | None = None,
+        milestone: str | None = None,
+    ) -> tuple[bool, str]:
+        """Update body/milestone with one PATCH and add labels with one POST."""
+        if self.mock:
+            return True, f"MOCK: PATCH /repos/{self.repo}/issues/{issue_number}"
+        client = self._client()
+        messages: list[str] = []
+        success = True
+        if body or milestone:
+            ok, msg = await self._call(
+                client.update_issue, number=issue_number, body=body or None, milestone=milestone
+            )
+            success = success and ok
+            messages.append(str(msg) if not ok else f"updated #{issue_number}")
+        if labels:
+            ok, msg = await self._call(client.add_labels, number=issue_number, labels=labels)
+            success = success and ok
+            messages.append(str(msg) if not ok else f"labelled #{issue_number}")
+        return success, "\n".join(messages)
+
+    async def close_issue_async(self, issue_number: int) -> tuple[bool, str]:
+        """Close an issue with a single PATCH."""
+        if self.mock:
+            return True, f"MOCK: PATCH /repos/{self.repo}/issues/{issue_number} state=closed"
+        ok, msg = await self._call(self._client().close_issue, number=issue_number)
+        return (True, f"closed #{issue_number}") if ok else (False, str(msg))
+
+    async def get_issues_async(self) -> tuple[bool, list[dict[str, Any]]]:
+        """List issues (all states) in the same shape as ``AsyncGitHubClient``."""
+        if self.mock:
             return True, []
-        else:
+        ok, raw = await self._call(self._client().list_issues, state="all")
+        if not ok or not isinstance(raw, list):
             return False, []
+        issues = [_project_issue(it) for it in raw if "pull_request" not in it]
+        return True, issues[:_ISSUES_LIMIT]
+
+
+def io_bound(func: F) -> F:
+    """Mark a sync processor as I/O-bound so it is dispatched to worker threads.
+
+    Unmarked sync processors are treated as CPU-only and run inline, where the
+    thread hand-off would cost more than it saves.
+    """
+    setattr(func, "_io_bound", True)  # noqa: B010
+    return func
 
 
 class ConcurrentProcessor:
     """Processes issue specs concurrently."""
 
+    __slots__ = ("config", "mock", "logger", "_enabled", "_max_workers", "_batch_size")
+
     def __init__(self, concurrency_config: ConcurrencyConfig, mock: bool = False):
         self.config = concurrency_config
         self.mock = mock
         self.logger = get_logger()
+        # Settings are fixed for the processor's lifetime; read them once here.
+        self._enabled = bool(concurrency_config.enabled)
+        self._max_workers = concurrency_config.max_workers
+        self._batch_size = concurrency_config.batch_size
 
     async def process_specs_concurrent(
         self,
@@ -213,32 +889,57 @@ class ConcurrentProcessor:
         *args: Any,
         **kwargs: Any,
     ) -> list[Any]:
-        """Process specs concurrently using async processing."""
-        if not self.config.enabled or len(specs) <= 1:
-            # Fallback to sequential processing
-            return [processor_func(spec, *args, **kwargs) for spec in specs]
+        """Process specs concurrently using async processing.
+
+        Returns one result per spec, in the same order as ``specs``.
+        """
+        if not self._enabled or len(specs) <= 1:
+            # Fallback to sequential processing; coroutine processors still need awaiting.
+            results: list[Any] = []
+            for spec in specs:
+                result = processor_func(spec, *args, **kwargs)
+                if inspect.isawaitable(result):
+                    result = await result
+                results.append(result)
+            return results
+
+        # Processors that can handle a whole batch in one call (for example a
+        # GraphQL mutation batch) advertise it via a ``batch_call`` attribute.
+        batch_call = getattr(processor_func, "batch_call", None)
+        if callable(batch_call):
+            return await self._process_batched_calls(specs, batch_call, *args, **kwargs)
 
-        # Process in batches to avoid overwhelming the API
-        results = []
-        batch_size = self.config.batch_size
+        is_coro = asyncio.iscoroutinefunction(processor_func)
+        if not is_coro and not getattr(processor_func, "_io_bound", False):
+            return self._process_inline(specs, processor_func, *args, **kwargs)
+
+        batch_size = self._batch_size
+        workers = get_optimal_worker_count(len(specs), self._max_workers)
 
         self.logger.log_operation(
             "concurrent_processing_start",
             spec_count=len(specs),
             batch_size=batch_size,
-            max_workers=self.config.max_workers,
+            max_workers=workers,
         )
 
         start_time = time.perf_counter()
 
-        for i in range(0, len(specs), batch_size):
-            batch = specs[i : i + batch_size]
-            batch_results = await self._process_batch_async(batch, processor_func, *args, **kwargs)
-            results.extend(batch_results)
+        # Resolve sync-vs-async dispatch once rather than per spec.
+        dispatch: Callable[[Any], Awaitable[Any]]
+        if is_coro:
+
+            def dispatch(spec: Any) -> Awaitable[Any]:
+                return cast(Awaitable[Any], processor_func(spec, *args, **kwargs))
+
+        else:
+            # Run sync processors in a worker thread to avoid blocking the loop.
+            call = functools.partial(processor_func, **kwargs) if kwargs else processor_func
+
+            def dispatch(spec: Any) -> Awaitable[Any]:
+                return asyncio.to_thread(call, spec, *args)
 
-            # Brief pause between batches to be respectful to GitHub API
-            if i + batch_size < len(specs):
-                await asyncio.sleep(0.1)
+        results = await self._process_bounded_async(specs, dispatch, workers)
 
         duration_ms = (time.perf_counter() - start_time) * 1000
         self.logger.log_performance(
@@ -250,59 +951,86 @@ class ConcurrentProcessor:
 
         return results
 
-    async def _process_batch_async(
+    def _failure(self, spec: Any, exc: Exception) -> dict[str, Any]:
+        self.logger.log_error(f"Error processing spec {spec}", error=str(exc))
+        # Return a default failure result
+        return {"error": str(exc), "spec": spec}
+
+    def _process_inline(
         self,
-        batch: list[Any],
+        specs: list[Any],
         processor_func: Callable[..., Any],
         *args: Any,
         **kwargs: Any,
     ) -> list[Any]:
-        """Process a batch of specs asynchronously."""
-        if not self.config.enabled:
-            return [processor_func(spec, *args, **kwargs) for spec in batch]
-
-        # Create tasks for concurrent execution
-        tasks = []
-        for spec in batch:
-            task = asyncio.create_task(
-                self._run_processor_async(processor_func, spec, *args, **kwargs)
-            )
-            tasks.append(task)
-
-        # Wait for all tasks to complete
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Handle any exceptions
-        processed_results: list[Any] = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                self.logger.log_error(f"Error processing spec {batch[i]}", error=str(result))
-                # Return a default failure result
-                processed_results.append({"error": str(result), "spec": batch[i]})
-            else:
-                processed_results.append(result)
-
-        return processed_results
+        """Run a CPU-only sync processor in the caller with per-spec error capture."""
+        results: list[Any] = []
+        for spec in specs:
+            try:
+                results.append(processor_func(spec, *args, **kwargs))
+            except Exception as exc:
+                results.append(self._failure(spec, exc))
+        return results
 
-    async def _run_processor_async(
+    async def _process_batched_calls(
         self,
-        processor_func: Callable[..., Any],
-        spec: Any,
+        specs: list[Any],
+        batch_call: Callable[..., Any],
         *args: Any,
         **kwargs: Any,
-    ) -> Any:
-        """Run a processor function asynchronously."""
-        # If the processor function is already async, run it directly
-        if asyncio.iscoroutinefunction(processor_func):
-            return await processor_func(spec, *args, **kwargs)
+    ) -> list[Any]:
+        """Invoke ``batch_call`` once per ``batch_size`` slice of specs."""
+        results: list[Any] = []
+        batch_size = self._batch_size
+        for i in range(0, len(specs), batch_size):
+            batch = specs[i : i + batch_size]
+            batch_results = batch_call(batch, *args, **kwargs)
+            if asyncio.iscoroutine(batch_results):
+                batch_results = await batch_results
+            results.extend(batch_results)
+        return results
+
+    async def _process_bounded_async(
+        self,
+        specs: list[Any],
+        dispatch: Callable[[Any], Awaitable[Any]],
+        max_workers: int,
+    ) -> list[Any]:
+        """Process all specs with at most ``max_workers`` in flight at any time.
 
-        # Otherwise, run in a thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, processor_func, spec, *args, **kwargs)
+        Unlike fixed batches, a slow spec does not hold back the rest: a new
+        spec starts as soon as any running one finishes. Failures are turned
+        into result entries inside each task, so one failing spec never cancels
+        its siblings; results come back in spec order. On 3.11+ the tasks run in
+        a ``TaskGroup`` so cancelling the caller cancels every task with it.
+        """
+        sem = asyncio.Semaphore(max(1, max_workers))
 
+        async def _guarded(spec: Any) -> Any:
+            async with sem:
+                try:
+                    return await dispatch(spec)
+                except Exception as exc:
+                    return self._failure(spec, exc)
 
-def create_async_github_client(config: ConcurrencyConfig, mock: bool = False) -> AsyncGitHubClient:
-    """Factory function to create async GitHub client."""
+        if sys.version_info >= (3, 11):
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(_guarded(spec)) for spec in specs]
+            return [task.result() for task in tasks]
+        return list(await asyncio.gather(*(_guarded(spec) for spec in specs)))
+
+
+def create_async_github_client(
+    config: ConcurrencyConfig, mock: bool = False, repo: str | None = None
+) -> AsyncGitHubClient | HttpGitHubClient:
+    """Factory function to create async GitHub client.
+
+    ``config.transport == "http"`` selects the pooled REST client; it needs an
+    explicit ``repo`` (``gh`` infers it from the working directory), so the
+    ``gh`` client is used when none is given.
+    """
+    if config.transport == "http" and repo:
+        return HttpGitHubClient(config, repo, mock=mock)
     return AsyncGitHubClient(config, mock)
 
 
@@ -327,21 +1055,26 @@ async def run_concurrent_sync(
 
 
 # Utility functions for backward compatibility
+
+# Roadmap size thresholds (spec counts) used to scale worker counts.
+_SMALL = 5
+_MEDIUM = 20
+_LARGE = 50
+
+
 def enable_concurrency_for_large_roadmaps(spec_count: int, threshold: int = 10) -> bool:
     """Determine if concurrency should be enabled based on roadmap size."""
     return spec_count >= threshold
 
 
+@functools.lru_cache(maxsize=128)
 def get_optimal_worker_count(spec_count: int, max_workers: int = 4) -> int:
     """Get optimal worker count based on spec count."""
-    small_threshold = 5
-    medium_threshold = 20
-    large_threshold = 50
-    if spec_count <= small_threshold:
+    if spec_count <= _SMALL:
         return 1
-    elif spec_count <= medium_threshold:
+    elif spec_count <= _MEDIUM:
         return min(2, max_workers)
-    elif spec_count <= large_threshold:
+    elif spec_count <= _LARGE:
         return min(3, max_workers)
     else:
         return max_workers
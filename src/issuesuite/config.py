@@ -1,19 +1,21 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import importlib
+import json
+import mmap
+import operator
 import os
-from dataclasses import dataclass
+import re
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, cast
+from typing import Any
 
 from .schema_registry import get_schema_descriptor
 
-yaml: Any
-try:
-    yaml = cast(Any, importlib.import_module("yaml"))
-except Exception:  # pragma: no cover
-    yaml = cast(Any, None)
-
 DEFAULT_MILESTONES = [
     "Sprint 0: Mobilize & Baseline",
     "M1: Real-Time Foundation",
@@ -21,12 +23,15 @@ DEFAULT_MILESTONES = [
     "M3: Advanced Analytics",
 ]
 
+# The schema registry is static, so resolve the default summary schema version once.
+_SUMMARY_SCHEMA_VERSION = get_schema_descriptor("summary").version
+
 
 class ConfigError(RuntimeError):
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SuiteConfig:
     version: int
     source_file: Path
@@ -79,37 +84,279 @@ class SuiteConfig:
     # Extensions / plugin configuration
     extensions_enabled: bool = True
     extensions_disabled: tuple[str, ...] = ()
+    # GitHub transport for concurrent operations: "gh" (CLI) or "http" (pooled REST)
+    concurrency_transport: str = "gh"
+    # List existing issues with one paginated GraphQL query instead of REST pages (gh only)
+    concurrency_graphql_fetch: bool = False
+    # Opt-in: overlap `gh` calls on a few threads for large live syncs when concurrency
+    # is off. Issues are then created in completion order rather than spec order.
+    concurrency_auto_thread_fallback: bool = False
+    # Patterns compiled once per config instead of at every match site
+    id_pattern_re: re.Pattern[str] = field(init=False, repr=False, compare=False)
+    milestone_pattern_re: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        try:
+            id_re = re.compile(self.id_pattern)
+            milestone_re = re.compile(self.milestone_pattern) if self.milestone_pattern else None
+        except re.error as exc:
+            raise ConfigError(f"Invalid pattern in configuration: {exc}") from exc
+        object.__setattr__(self, "id_pattern_re", id_re)
+        object.__setattr__(self, "milestone_pattern_re", milestone_re)
 
 
 def _resolve_env_var(value: Any, env_var_name: str | None = None) -> Any:
     """Resolve environment variable if value starts with $."""
-    if isinstance(value, str) and value.startswith("$"):
-        env_name = env_var_name or value[1:]  # Remove $ prefix
-        return os.getenv(env_name, value)  # Fallback to original if not found
-    return value
+    # Most values are None or plain strings; bail out with one type and prefix check.
+    if type(value) is not str or value[:1] != "$":
+        return value
+    # Use the explicit variable name, else the value without its "$" prefix;
+    # fall back to the original value when the variable is unset.
+    return os.getenv(env_var_name or value[1:], value)
+
+
+# Below this size mapping the file costs more than reading it.
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _read_yaml(p: Path, size: int) -> Any:
+    # Hand libyaml the byte stream; it detects the encoding and decodes in C.
+    with p.open("rb") as fh:
+        if size <= _MMAP_THRESHOLD:
+            return _safe_load(fh)
+        # Large configs: map the file and ask the OS to read ahead while parsing.
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise"):
+                for advice in ("MADV_SEQUENTIAL", "MADV_WILLNEED"):
+                    if hasattr(mmap, advice):
+                        mm.madvise(getattr(mmap, advice))
+            return _safe_load(mm)
+
+
+def _as_dict(value: Any) -> dict[str, Any]:
+    return value if isinstance(value, dict) else {}
+
+
+def _sect(data: dict[str, Any], key: str) -> dict[str, Any]:
+    """Return ``data[key]`` when it is a mapping, else an empty dict."""
+    return _as_dict(data.get(key))
+
+
+@functools.cache
+def _yaml_loader() -> tuple[Any, Any]:
+    """Import PyYAML on first use and pick its fastest safe loader."""
+    try:
+        yaml: Any = importlib.import_module("yaml")
+    except ImportError:  # pragma: no cover
+        raise ConfigError("PyYAML not installed; pip install PyYAML") from None
+    # Prefer the libyaml-backed loader when PyYAML was built with it.
+    return yaml, getattr(yaml, "CSafeLoader", None) or yaml.SafeLoader
+
+
+def _safe_load(stream: Any) -> Any:
+    """``yaml.safe_load`` equivalent using the fastest available safe loader."""
+    yaml, loader = _yaml_loader()
+    return yaml.load(stream, Loader=loader)  # nosec B506 - safe loader
+
+
+# Environment variables consulted while building a SuiteConfig; part of the cache key.
+_CONFIG_ENV_VARS = ("GITHUB_APP_ID", "GITHUB_APP_PRIVATE_KEY", "GITHUB_APP_INSTALLATION_ID", "HOME")
 
 
 def load_config(path: str | Path) -> SuiteConfig:
+    """Load ``path`` into a (shared, immutable) ``SuiteConfig``.
+
+    Results are cached per file and invalidated when the file's mtime or size,
+    or any environment variable the loader consults, changes.
+    """
     p = Path(path)
-    if not p.exists():
-        raise ConfigError(f"Configuration file not found: {p}")
-    if yaml is None:
-        raise ConfigError("PyYAML not installed; pip install PyYAML")
-    raw = cast(dict[str, Any], yaml.safe_load(p.read_text()) or {})
-    src = cast(dict[str, Any], raw.get("source", {}) or {})
-    gh = cast(dict[str, Any], raw.get("github", {}) or {})
-    defaults = cast(dict[str, Any], raw.get("defaults", {}) or {})
-    out = cast(dict[str, Any], raw.get("output", {}) or {})
-    behavior = cast(dict[str, Any], raw.get("behavior", {}) or {})
-    ai = cast(dict[str, Any], raw.get("ai", {}) or {})
-    project = cast(dict[str, Any], gh.get("project", {}) or {})
-    logging_config = cast(dict[str, Any], raw.get("logging", {}) or {})
-    performance_config = cast(dict[str, Any], raw.get("performance", {}) or {})
-    concurrency_config = cast(dict[str, Any], raw.get("concurrency", {}) or {})
-    github_app = cast(dict[str, Any], gh.get("app", {}) or {})
-    env_auth = cast(dict[str, Any], raw.get("environment", {}) or {})
-    telemetry_config = cast(dict[str, Any], raw.get("telemetry", {}) or {})
-    extensions_config = cast(dict[str, Any], raw.get("extensions", {}) or {})
+    try:
+        st = p.stat()
+    except FileNotFoundError:
+        raise ConfigError(f"Configuration file not found: {p}") from None
+    _yaml_loader()
+    env = tuple(os.environ.get(name) for name in _CONFIG_ENV_VARS)
+    return _load_config_cached(p, os.path.abspath(p), st.st_mtime_ns, st.st_size, env)
+
+
+# Opt-in: persist parsed YAML mappings as JSON under the user's cache directory.
+CONFIG_CACHE_ENV = "ISSUESUITE_CONFIG_CACHE"
+
+
+@functools.lru_cache(maxsize=16)
+def _load_config_cached(
+    p: Path, _abspath: str, _mtime_ns: int, size: int, env: tuple[str | None, ...]
+) -> SuiteConfig:
+    if os.environ.get(CONFIG_CACHE_ENV) == "1":
+        return _build_config(p, _load_mapping_via_cache(p, _abspath))
+    return _build_config(p, _as_dict(_read_yaml(p, size)))
+
+
+def _config_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "issuesuite" / "config"
+
+
+def _load_mapping_via_cache(p: Path, abspath: str) -> dict[str, Any]:
+    """Return the parsed YAML mapping of ``p``, reusing a JSON copy when the bytes match.
+
+    Only plain data is cached (never pickles), and it lives outside the working
+    tree, so a checked-in file cannot inject a cached config. Mappings that do
+    not round-trip through JSON (dates, non-string keys) are not cached.
+    """
+    data = p.read_bytes()
+    path_key = hashlib.blake2b(abspath.encode("utf-8"), digest_size=8).hexdigest()
+    content_key = hashlib.blake2b(data, digest_size=16).hexdigest()
+    cache_dir = _config_cache_dir()
+    entry = cache_dir / f"{path_key}-{content_key}.json"
+    try:
+        cached = json.loads(entry.read_bytes())
+        if isinstance(cached, dict):
+            return cached
+    except (OSError, ValueError):
+        pass
+    mapping = _as_dict(_safe_load(data))
+    try:
+        encoded = json.dumps(mapping)
+    except (TypeError, ValueError):
+        return mapping
+    if json.loads(encoded) != mapping:
+        return mapping
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for stale in cache_dir.glob(f"{path_key}-*.json"):
+            stale.unlink(missing_ok=True)
+        tmp = entry.with_suffix(".tmp")
+        tmp.write_text(encoded, encoding="utf-8")
+        tmp.replace(entry)
+    except OSError:  # pragma: no cover - read-only cache directory
+        pass
+    return mapping
+
+
+# Scalar fields read straight from one section: (field, key, caster, default).
+_FieldSpec = tuple[tuple[str, str, Callable[[Any], Any], Any], ...]
+
+_SOURCE_SPEC: _FieldSpec = (
+    # Milestone enforcement is opt-in; default False to preserve backward compatibility.
+    ("milestone_required", "milestone_required", bool, False),
+    ("auto_status_label", "auto_status_label", bool, True),
+)
+_PROJECT_SPEC: _FieldSpec = (("project_enable", "enable", bool, False),)
+_DEFAULTS_SPEC: _FieldSpec = (
+    ("ensure_labels_enabled", "ensure_labels_enabled", bool, False),
+    ("ensure_milestones_enabled", "ensure_milestones_enabled", bool, False),
+)
+_BEHAVIOR_SPEC: _FieldSpec = (
+    ("truncate_body_diff", "truncate_body_diff", int, 80),
+    ("dry_run_default", "dry_run_default", bool, False),
+    ("emit_change_events", "emit_change_events", bool, False),
+)
+_LOGGING_SPEC: _FieldSpec = (("logging_json_enabled", "json_enabled", bool, False),)
+_PERFORMANCE_SPEC: _FieldSpec = (("performance_benchmarking", "benchmarking", bool, False),)
+_CONCURRENCY_SPEC: _FieldSpec = (
+    ("concurrency_enabled", "enabled", bool, False),
+    ("concurrency_max_workers", "max_workers", int, 4),
+    ("concurrency_transport", "transport", str, "gh"),
+    ("concurrency_graphql_fetch", "graphql_fetch", bool, False),
+    ("concurrency_auto_thread_fallback", "auto_thread_fallback", bool, False),
+)
+_GITHUB_APP_SPEC: _FieldSpec = (("github_app_enabled", "enabled", bool, False),)
+_ENV_AUTH_SPEC: _FieldSpec = (
+    ("env_auth_enabled", "enabled", bool, True),
+    ("env_auth_load_dotenv", "load_dotenv", bool, True),
+)
+_TELEMETRY_SPEC: _FieldSpec = (("telemetry_enabled", "enabled", bool, False),)
+_EXTENSIONS_SPEC: _FieldSpec = (("extensions_enabled", "enabled", bool, True),)
+
+
+def _intern(value: Any) -> Any:
+    """Intern YAML-parsed strings so equal values share one object across configs."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern_list(values: Any) -> Any:
+    return [_intern(v) for v in values] if isinstance(values, list) else values
+
+
+_CONCURRENCY_TRANSPORTS = ("gh", "http")
+
+
+def _coerce(where: str, key: str, caster: Callable[[Any], Any], value: Any) -> Any:
+    """Return ``value`` if it already has the declared type, else coerce or reject it."""
+    if type(value) is caster:
+        return value
+    if caster is int and type(value) is str and value.strip().lstrip("-").isdigit():
+        return int(value)
+    if caster is bool and type(value) is int:
+        # YAML 0/1 flags have always been accepted.
+        return bool(value)
+    type_name = getattr(caster, "__name__", str(caster))
+    raise ConfigError(f"{where}.{key} must be {type_name}, got {type(value).__name__}")
+
+
+def _extract(section: dict[str, Any], spec: _FieldSpec, where: str) -> dict[str, Any]:
+    """Map ``spec`` over ``section`` into ``SuiteConfig`` keyword arguments.
+
+    Missing keys take their default and an explicit null reads as False for flags
+    (as ``bool(None)`` always did) and as the default otherwise. Values of the wrong
+    type raise ``ConfigError`` instead of being silently coerced (``bool("false")``
+    is True).
+    """
+    out: dict[str, Any] = {}
+    for name, key, caster, default in spec:
+        value = section.get(key, default)
+        if value is None:
+            value = False if caster is bool else default
+        out[name] = _intern(_coerce(where, key, caster, value))
+    return out
+
+
+def _extract_concurrency(section: dict[str, Any]) -> dict[str, Any]:
+    out = _extract(section, _CONCURRENCY_SPEC, "concurrency")
+    if out["concurrency_transport"] not in _CONCURRENCY_TRANSPORTS:
+        raise ConfigError(
+            "concurrency.transport must be one of "
+            f"{', '.join(_CONCURRENCY_TRANSPORTS)}, got {out['concurrency_transport']!r}"
+        )
+    return out
+
+
+_TOP_LEVEL_SECTIONS = (
+    "source",
+    "github",
+    "defaults",
+    "output",
+    "behavior",
+    "ai",
+    "logging",
+    "performance",
+    "concurrency",
+    "environment",
+    "telemetry",
+    "extensions",
+)
+_EMPTY_SECTIONS: dict[str, Any] = dict.fromkeys(_TOP_LEVEL_SECTIONS)
+_get_sections = operator.itemgetter(*_TOP_LEVEL_SECTIONS)
+
+
+def _build_config(p: Path, raw: dict[str, Any]) -> SuiteConfig:
+    (
+        src,
+        gh,
+        defaults,
+        out,
+        behavior,
+        ai,
+        logging_config,
+        performance_config,
+        concurrency_config,
+        env_auth,
+        telemetry_config,
+        extensions_config,
+    ) = (_as_dict(section) for section in _get_sections({**_EMPTY_SECTIONS, **raw}))
+    project = _sect(gh, "project")
+    github_app = _sect(gh, "app")
 
     # Resolve environment variables in GitHub App configuration
     github_app_id = _resolve_env_var(github_app.get("app_id"), "GITHUB_APP_ID")
@@ -135,58 +382,49 @@ def load_config(path: str | Path) -> SuiteConfig:
         extensions_disabled = [str(extensions_disabled)]
     extensions_disabled_tuple = tuple(sorted({str(item) for item in extensions_disabled}))
 
-    summary_version = get_schema_descriptor("summary").version
-
     return SuiteConfig(
         version=int(raw.get("version", 1)),
         source_file=p.parent / src.get("file", "ISSUES.md"),
         # New slug-based format default: lowercase alnum plus hyphen/underscore
-        id_pattern=src.get("id_pattern", "^[a-z0-9][a-z0-9-_]*$"),
-        # Milestone enforcement is opt-in; default False to preserve backward compatibility.
-        milestone_required=bool(src.get("milestone_required", False)),
-        auto_status_label=bool(src.get("auto_status_label", True)),
-        milestone_pattern=src.get("milestone_pattern"),
-        github_repo=gh.get("repo"),
-        project_enable=bool(project.get("enable", False)),
+        id_pattern=_intern(src.get("id_pattern", "^[a-z0-9][a-z0-9-_]*$")),
+        milestone_pattern=_intern(src.get("milestone_pattern")),
+        github_repo=_intern(gh.get("repo")),
         project_number=project.get("number"),
         project_field_mappings=project.get("field_mappings", {}) or {},
-        inject_labels=defaults.get("inject_labels", []) or [],
-        ensure_milestones_list=defaults.get("ensure_milestones", DEFAULT_MILESTONES),
-        ensure_labels_enabled=bool(defaults.get("ensure_labels_enabled", False)),
-        ensure_milestones_enabled=bool(defaults.get("ensure_milestones_enabled", False)),
-        summary_json=out.get("summary_json", "issues_summary.json"),
-        plan_json=out.get("plan_json", "issues_plan.json"),
-        export_json=out.get("export_json", "issues_export.json"),
-        report_html=out.get("report_html", "issues_report.html"),
-        hash_state_file=out.get("hash_state_file", ".issuesuite_hashes.json"),
-        mapping_file=out.get("mapping_file", ".issuesuite_mapping.json"),
-        lock_file=out.get("lock_file", ".issuesuite_lock"),
-        truncate_body_diff=int(behavior.get("truncate_body_diff", 80)),
-        dry_run_default=bool(behavior.get("dry_run_default", False)),
-        emit_change_events=bool(behavior.get("emit_change_events", False)),
-        schema_export_file=ai.get("schema_export_file", "issue_export.schema.json"),
-        schema_summary_file=ai.get("schema_summary_file", "issue_change_summary.schema.json"),
-        schema_ai_context_file=ai.get("schema_ai_context_file", "ai_context.schema.json"),
-        schema_version=str(ai.get("schema_version", summary_version)),
+        inject_labels=_intern_list(defaults.get("inject_labels", []) or []),
+        ensure_milestones_list=_intern_list(defaults.get("ensure_milestones", DEFAULT_MILESTONES)),
+        summary_json=_intern(out.get("summary_json", "issues_summary.json")),
+        plan_json=_intern(out.get("plan_json", "issues_plan.json")),
+        export_json=_intern(out.get("export_json", "issues_export.json")),
+        report_html=_intern(out.get("report_html", "issues_report.html")),
+        hash_state_file=_intern(out.get("hash_state_file", ".issuesuite_hashes.json")),
+        mapping_file=_intern(out.get("mapping_file", ".issuesuite_mapping.json")),
+        lock_file=_intern(out.get("lock_file", ".issuesuite_lock")),
+        schema_export_file=_intern(ai.get("schema_export_file", "issue_export.schema.json")),
+        schema_summary_file=_intern(
+            ai.get("schema_summary_file", "issue_change_summary.schema.json")
+        ),
+        schema_ai_context_file=_intern(ai.get("schema_ai_context_file", "ai_context.schema.json")),
+        schema_version=_intern(str(ai.get("schema_version", _SUMMARY_SCHEMA_VERSION))),
         # Logging configuration
-        logging_json_enabled=bool(logging_config.get("json_enabled", False)),
-        logging_level=logging_config.get("level", "INFO"),
-        # Performance configuration
-        performance_benchmarking=bool(performance_config.get("benchmarking", False)),
-        # Concurrency configuration
-        concurrency_enabled=bool(concurrency_config.get("enabled", False)),
-        concurrency_max_workers=int(concurrency_config.get("max_workers", 4)),
+        logging_level=_intern(logging_config.get("level", "INFO")),
         # GitHub App configuration with environment variable resolution
-        github_app_enabled=bool(github_app.get("enabled", False)),
         github_app_id=github_app_id,
         github_app_private_key_path=github_app_private_key_path,
         github_app_installation_id=github_app_installation_id,
         # Environment authentication configuration
-        env_auth_enabled=bool(env_auth.get("enabled", True)),
-        env_auth_load_dotenv=bool(env_auth.get("load_dotenv", True)),
         env_auth_dotenv_path=env_auth.get("dotenv_path"),
-        telemetry_enabled=bool(telemetry_config.get("enabled", False)),
         telemetry_store_path=telemetry_store_path,
-        extensions_enabled=bool(extensions_config.get("enabled", True)),
         extensions_disabled=extensions_disabled_tuple,
+        **_extract(src, _SOURCE_SPEC, "source"),
+        **_extract(project, _PROJECT_SPEC, "github.project"),
+        **_extract(defaults, _DEFAULTS_SPEC, "defaults"),
+        **_extract(behavior, _BEHAVIOR_SPEC, "behavior"),
+        **_extract(logging_config, _LOGGING_SPEC, "logging"),
+        **_extract(performance_config, _PERFORMANCE_SPEC, "performance"),
+        **_extract_concurrency(concurrency_config),
+        **_extract(github_app, _GITHUB_APP_SPEC, "github.app"),
+        **_extract(env_auth, _ENV_AUTH_SPEC, "environment"),
+        **_extract(telemetry_config, _TELEMETRY_SPEC, "telemetry"),
+        **_extract(extensions_config, _EXTENSIONS_SPEC, "extensions"),
     )
@@ -1,22 +1,34 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import importlib
-import json
+import logging
 import os
 import re
 import shutil
 import subprocess  # nosec B404 - subprocess is required for GitHub CLI integration
+import sys
+import threading
+import time
+import weakref
+from collections.abc import Coroutine
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import AbstractContextManager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Protocol, TypedDict, cast
+from typing import Any, NamedTuple, Protocol, TypeVar, cast
 
+from . import _json
 from .benchmarking import BenchmarkConfig, create_benchmark
 from .concurrency import (
+    AsyncGitHubClient,
     ConcurrencyConfig,
+    IssueUpdate,
     create_async_github_client,
     create_concurrent_processor,
     get_optimal_worker_count,
+    io_bound,
 )
 from .config import SuiteConfig
 from .diffing import compute_diff, needs_update
@@ -28,49 +40,143 @@ from .models import IssueSpec
 from .parser import ParseError, parse_issues
 from .project import ProjectConfig, build_project_assigner
 
+_T = TypeVar("_T")
+
+logger = logging.getLogger(__name__)
+
 # Hidden marker template for idempotent issue recognition
 _MARKER_PREFIX = "<!-- issuesuite:slug="
+# Title normalisation patterns used while matching specs against existing issues
+_WS_RE = re.compile(r"\s+")
+_TITLE_PUNCT_RE = re.compile(r"[()\[\]{}:_]+")
+# Issue number in async client create messages ("created #12" or a .../issues/12 URL)
+_CREATED_NUMBER_RE = re.compile(r"(?:#|/issues/)(\d+)")
 
 
 def _ensure_marker(body: str, slug: str) -> str:
     """Ensure the hidden slug marker is present at top of body.
 
-    We always place marker as first line to simplify matching and avoid duplication.
+    We always place marker as first line to simplify matching and avoid duplication,
+    so only the start of the body needs checking.
     """
     marker = f"{_MARKER_PREFIX}{slug} -->"
-    if marker in body:
+    if body.startswith(marker):
         return body
-    if body.startswith("#") or body.startswith("<!--"):
-        # Still prepend marker with blank line after for readability
-        return marker + "\n\n" + body
-    return marker + "\n\n" + body
+    return f"{marker}\n\n{body}"
 
 
-class PlanEntry(TypedDict, total=False):
+@dataclass(frozen=True, slots=True)
+class PlanEntry:
     external_id: str
     title: str
     action: str  # create|update|close|skip
-    number: int | None
-    labels: list[str]
-    milestone: str | None
-    reason: str | None
-    changes: dict[str, int] | None
+    number: int | None = None
+    labels: list[str] = field(default_factory=list)
+    milestone: str | None = None
+    reason: str | None = None
+    changes: dict[str, int] | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """JSON-ready mapping (shallow; cheaper than ``dataclasses.asdict``)."""
+        return {
+            "external_id": self.external_id,
+            "title": self.title,
+            "action": self.action,
+            "number": self.number,
+            "labels": self.labels,
+            "milestone": self.milestone,
+            "reason": self.reason,
+            "changes": self.changes,
+        }
+
+
+def _make_plan_entry(
+    spec: IssueSpec,
+    action: str,
+    *,
+    number: int | None = None,
+    reason: str | None = None,
+    changes: dict[str, int] | None = None,
+) -> PlanEntry:
+    return PlanEntry(
+        spec.external_id,
+        spec.title,
+        action,
+        number,
+        spec.labels,
+        spec.milestone,
+        reason,
+        changes,
+    )
+
 
+class _ExistingIndex(NamedTuple):
+    """Lookup tables over existing issues, built once per sync/plan run."""
 
-def _plan_match_issue(spec: IssueSpec, existing: list[dict[str, Any]]) -> dict[str, Any] | None:
+    issues: list[dict[str, Any]]
+    by_marker: dict[str, dict[str, Any]]
+    by_title: dict[str, dict[str, Any]]
+    by_norm_title: dict[str, dict[str, Any]]
+
+
+_ExistingIssues = list[dict[str, Any]] | _ExistingIndex
+
+
+def _build_existing_index(existing: _ExistingIssues) -> _ExistingIndex:
+    """Index ``existing`` by slug marker, exact title and normalised title.
+
+    The first issue seen for any key wins, mirroring the old linear scans. A
+    normalised title shared by several issues is logged, since sync will update the
+    first of them rather than the one a human might expect.
+    """
+    if isinstance(existing, _ExistingIndex):
+        return existing
+    by_marker: dict[str, dict[str, Any]] = {}
+    by_title: dict[str, dict[str, Any]] = {}
+    by_norm_title: dict[str, dict[str, Any]] = {}
     for issue in existing:
+        body = issue.get("body")
+        if isinstance(body, str):
+            _, found, tail = body.partition(_MARKER_PREFIX)
+            if found:
+                slug, closed, _ = tail.partition(" -->")
+                if closed:
+                    by_marker.setdefault(sys.intern(slug), issue)
         title = issue.get("title")
-        if title == spec.title:
-            return issue
-        normalized_title = re.sub(r"\s+", " ", (title or "").lower())
-        normalized_spec = re.sub(r"\s+", " ", spec.title.lower())
-        if normalized_title == normalized_spec:
+        if isinstance(title, str):
+            by_title.setdefault(sys.intern(title), issue)
+            norm = _WS_RE.sub(" ", title.lower())
+            first = by_norm_title.setdefault(norm, issue)
+            if first is not issue:
+                logger.warning(
+                    "Issues #%s and #%s share normalised title %r; matching #%s",
+                    first.get("number"),
+                    issue.get("number"),
+                    norm,
+                    first.get("number"),
+                )
+    return _ExistingIndex(existing, by_marker, by_title, by_norm_title)
+
+
+def _plan_match_issue(spec: IssueSpec, existing: _ExistingIssues) -> dict[str, Any] | None:
+    index = _build_existing_index(existing)
+    normalized_spec = _WS_RE.sub(" ", spec.title.lower())
+    for issue in (
+        index.by_marker.get(spec.external_id),
+        index.by_title.get(spec.title),
+        index.by_norm_title.get(normalized_spec),
+    ):
+        if issue is not None:
             return issue
-        title_lower = (title or "").lower()
-        if spec.external_id and spec.external_id in title_lower:
+    if not spec.external_id:
+        return None
+    # Titles that embed the slug, e.g. "Title (slug)", need the slug stripped first.
+    for issue in index.issues:
+        title_lower = (issue.get("title") or "").lower()
+        if spec.external_id in title_lower:
             stripped = title_lower.replace(spec.external_id, " ")
-            stripped = re.sub(r"[()\[\]{}:_]+", " ", stripped)
-            stripped = re.sub(r"\s+", " ", stripped).strip()
+            stripped = _TITLE_PUNCT_RE.sub(" ", stripped)
+            stripped = _WS_RE.sub(" ", stripped).strip()
             if stripped == normalized_spec:
                 return issue
     return None
@@ -91,7 +197,7 @@ def _plan_changes(spec: IssueSpec, issue: dict[str, Any]) -> dict[str, int]:
 
 def _plan_entry_for_spec(
     spec: IssueSpec,
-    existing: list[dict[str, Any]],
+    existing: _ExistingIssues,
     prev_hashes: dict[str, str],
     update: bool,
     respect_status: bool,
@@ -99,49 +205,13 @@ def _plan_entry_for_spec(
     issue = _plan_match_issue(spec, existing)
     prev_hash = prev_hashes.get(spec.external_id)
     if not issue:
-        return PlanEntry(
-            external_id=spec.external_id,
-            title=spec.title,
-            action="create",
-            number=None,
-            labels=spec.labels,
-            milestone=spec.milestone,
-            reason="no existing match",
-            changes=None,
-        )
+        return _make_plan_entry(spec, "create", reason="no existing match")
     number = issue.get("number") if isinstance(issue.get("number"), int) else None
     if respect_status and spec.status == "closed" and issue.get("state") != "CLOSED":
-        return PlanEntry(
-            external_id=spec.external_id,
-            title=spec.title,
-            action="close",
-            number=number,
-            labels=spec.labels,
-            milestone=spec.milestone,
-            reason=None,
-            changes=None,
-        )
+        return _make_plan_entry(spec, "close", number=number)
     if update and needs_update(spec, issue, prev_hash):
-        return PlanEntry(
-            external_id=spec.external_id,
-            title=spec.title,
-            action="update",
-            number=number,
-            labels=spec.labels,
-            milestone=spec.milestone,
-            reason=None,
-            changes=_plan_changes(spec, issue),
-        )
-    return PlanEntry(
-        external_id=spec.external_id,
-        title=spec.title,
-        action="skip",
-        number=number,
-        labels=spec.labels,
-        milestone=spec.milestone,
-        reason=None,
-        changes=None,
-    )
+        return _make_plan_entry(spec, "update", number=number, changes=_plan_changes(spec, issue))
+    return _make_plan_entry(spec, "skip", number=number)
 
 
 def _build_plan(
@@ -151,8 +221,9 @@ def _build_plan(
     update: bool,
     respect_status: bool,
 ) -> list[PlanEntry]:
+    index = _build_existing_index(existing)
     return [
-        _plan_entry_for_spec(spec, existing, prev_hashes, update, respect_status) for spec in specs
+        _plan_entry_for_spec(spec, index, prev_hashes, update, respect_status) for spec in specs
     ]
 
 
@@ -165,6 +236,130 @@ _LABEL_CANON_MAP = {
 
 # Concurrency threshold for switching to worker pool
 _concurrency_threshold_default = 10
+# Seconds a `gh auth status` result is reused before probing again
+_GH_AUTH_TTL = 60.0
+# Seconds listed repo labels / milestones are reused by the preflight ensure steps
+_GH_LIST_TTL = 60.0
+# Concurrent `gh` create processes when the preflight has several labels to add
+_GH_CREATE_FANOUT = 5
+# Upper bound on concurrent close calls when pruning over the pooled REST client
+_PRUNE_MAX_IN_FLIGHT = 32
+# Spec count above which the non-concurrent path overlaps `gh` calls on a few threads
+_AUTO_THREAD_MIN_SPECS = 8
+_AUTO_THREAD_MAX_WORKERS = 8
+
+
+def _loop_is_running() -> bool:
+    """Return True when called from inside a running event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _hashes_unchanged(specs: list[IssueSpec], prev_hashes: dict[str, str]) -> bool:
+    """True when ``specs`` carry exactly the hashes loaded from the state file."""
+    return len(specs) == len(prev_hashes) and all(
+        prev_hashes.get(spec.external_id) == spec.hash for spec in specs
+    )
+
+
+def _cache_covers(cache: tuple[float, set[str]] | None, wanted: set[str]) -> bool:
+    """True when a fresh listing cache already holds every name in ``wanted``."""
+    return cache is not None and time.monotonic() - cache[0] < _GH_LIST_TTL and wanted <= cache[1]
+
+
+def _merge_presolved(
+    presolved: list[dict[str, Any] | None], processed: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Fill the ``None`` slots of ``presolved`` with ``processed`` results, in order."""
+    if len(processed) != presolved.count(None):
+        raise ValueError("processed results do not match the pending specs")
+    pending = iter(processed)
+    return [result if result is not None else next(pending) for result in presolved]
+
+
+def _summarize_results(
+    specs: list[IssueSpec], results: list[dict[str, Any]], *, errors_as_skipped: bool
+) -> dict[str, Any]:
+    """Fold per-spec results into the sync summary; shared by the sync and async paths.
+
+    ``results`` must pair one-to-one with ``specs`` in order: a length mismatch
+    raises ``ValueError`` instead of attributing results to the wrong spec. Error
+    results are never counted as changes; the async path has always reported them
+    as skipped (``errors_as_skipped``), the sync path leaves them out of the totals.
+    """
+    created: list[dict[str, Any]] = []
+    updated: list[dict[str, Any]] = []
+    closed: list[dict[str, Any]] = []
+    mapping: dict[str, int] = {}
+    skipped = 0
+    # Local binds: this loop runs once per spec on large roadmaps.
+    add_created = created.append
+    add_updated = updated.append
+    add_closed = closed.append
+    for spec, result in zip(specs, results, strict=True):
+        if "error" in result:
+            if errors_as_skipped:
+                skipped += 1
+            continue
+        get = result.get
+        if mapped := get("mapped"):
+            mapping[spec.external_id] = mapped
+        if get("created"):
+            add_created({"external_id": spec.external_id, "title": spec.title, "hash": spec.hash})
+        if closed_entry := get("closed"):
+            add_closed(closed_entry)
+        if updated_entry := get("updated"):
+            add_updated(updated_entry)
+        if get("skipped"):
+            skipped += 1
+    return {
+        "totals": {
+            "specs": len(specs),
+            "created": len(created),
+            "updated": len(updated),
+            "closed": len(closed),
+            "skipped": skipped,
+        },
+        "changes": {"created": created, "updated": updated, "closed": closed},
+        "mapping": mapping,
+    }
+
+
+def _discard_runner_loop(runner: Any) -> None:
+    """Finalizer for an unclosed suite's runner.
+
+    ``Runner.close()`` joins the default executor, which deadlocks when garbage
+    collection happens on one of that executor's own threads. Closing the loop
+    directly only signals the executor threads to stop.
+    """
+    loop = runner.get_loop()
+    if not loop.is_running() and not loop.is_closed():
+        loop.close()
+
+
+async def _gh_check_calls(cmds: list[list[str]]) -> list[Exception | None]:
+    """Run ``cmds`` concurrently, at most ``_GH_CREATE_FANOUT`` at a time.
+
+    Returns, in input order, ``None`` for each command that exited 0 and the
+    error otherwise.
+    """
+    sem = asyncio.Semaphore(_GH_CREATE_FANOUT)
+
+    async def _one(cmd: list[str]) -> Exception | None:
+        async with sem:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL
+                )
+                returncode = await proc.wait()
+            except Exception as exc:
+                return exc
+        return subprocess.CalledProcessError(returncode, cmd) if returncode else None
+
+    return list(await asyncio.gather(*(_one(cmd) for cmd in cmds)))
 
 
 class ProjectAssignerProtocol(Protocol):  # narrow contract used in core for typing
@@ -211,6 +406,20 @@ class IssueSuite:
         self._mock = os.environ.get("ISSUES_SUITE_MOCK") == "1"
         # Last error classification (populated on failure for orchestrator embedding)
         self._last_error: dict[str, Any] | None = None
+        # Issues clients reused across specs, keyed by (repo, mock, dry_run)
+        self._issues_clients: dict[tuple[str | None, bool, bool], IssuesClient] = {}
+        self._issues_clients_lock = threading.Lock()
+        # gh executable path (resolved on first use) and last auth probe (monotonic time, ok)
+        self._gh_path: str | None = None
+        self._gh_resolved = False
+        self._gh_missing_logged = False
+        self._gh_auth_cache: tuple[float, bool] | None = None
+        # Label / milestone names seen in the repo as (monotonic time, names)
+        self._label_cache: tuple[float, set[str]] | None = None
+        self._milestone_cache: tuple[float, set[str]] | None = None
+        # Event loop runner reused by every concurrent sync (created lazily)
+        self._runner: Any | None = None
+        self._runner_finalizer: weakref.finalize[Any, Any] | None = None
 
         # Configure structured logging based on config
         self._logger = configure_logging(
@@ -235,6 +444,7 @@ class IssueSuite:
             enabled=cfg.concurrency_enabled,
             max_workers=cfg.concurrency_max_workers,
             batch_size=10,  # Default batch size
+            transport=cfg.concurrency_transport,
         )
 
         # Configure GitHub App authentication
@@ -305,8 +515,9 @@ class IssueSuite:
     def _log(self, *parts: Any) -> None:  # lightweight internal debug logger
         if self._debug:
             print("[issuesuite]", *parts)
-        # Also log via structured logger
-        self._logger.debug(" ".join(str(p) for p in parts))
+        # Also log via structured logger; skip building the message when DEBUG is off
+        if self._logger.is_enabled_for(logging.DEBUG):
+            self._logger.debug(" ".join(map(str, parts)))
 
     @classmethod
     def from_config_path(cls, path: str | Path) -> IssueSuite:
@@ -385,9 +596,10 @@ class IssueSuite:
                     self._prune_unmatched(existing, results, dry_run)
                 summary = self._sync_build_summary(specs, results)
                 if plan is not None:
-                    summary["plan"] = plan
+                    summary["plan"] = [entry.as_dict() for entry in plan]
 
-                if not dry_run:
+                # Nothing to persist when no spec hash moved since the state was loaded.
+                if not dry_run and not _hashes_unchanged(specs, prev_hashes):
                     with self._benchmark.measure("save_hash_state"):
                         self._save_hash_state(specs)
 
@@ -459,13 +671,22 @@ class IssueSuite:
 
     # --- Issues client factory -------------------------------------------------
     def _build_issues_client(self, *, dry_run: bool) -> IssuesClient:
-        return IssuesClient(
-            IssuesClientConfig(
-                repo=self.cfg.github_repo,
-                mock=self._mock,
-                dry_run=dry_run,
-            )
-        )
+        key = (self.cfg.github_repo, self._mock, dry_run)
+        client = self._issues_clients.get(key)
+        if client is None:
+            with self._issues_clients_lock:  # spec processing may run in worker threads
+                client = self._issues_clients.get(key)
+                if client is None:
+                    client = IssuesClient(
+                        IssuesClientConfig(
+                            repo=self.cfg.github_repo,
+                            mock=self._mock,
+                            dry_run=dry_run,
+                            requests_per_second=self._concurrency_config.requests_per_second,
+                        )
+                    )
+                    self._issues_clients[key] = client
+        return client
 
     def _sync_fetch_existing(self, preflight: bool) -> list[dict[str, Any]]:
         with self._benchmark.measure("fetch_existing_issues"):
@@ -482,57 +703,97 @@ class IssueSuite:
     def _sync_process_specs(
         self,
         specs: list[IssueSpec],
-        existing: list[dict[str, Any]],
+        existing: _ExistingIssues,
         prev_hashes: dict[str, str],
         dry_run: bool,
         update: bool,
         respect_status: bool,
         project_assigner: ProjectAssignerProtocol,
     ) -> list[dict[str, Any]]:
+        existing = _build_existing_index(existing)
         # Sequential fast path (default) unless concurrency explicitly enabled in config.
         if not self._concurrency_config.enabled or len(specs) < _concurrency_threshold_default:
-            results: list[dict[str, Any]] = []
             with self._benchmark.measure("process_specs", spec_count=len(specs), mode="sequential"):
-                for spec in specs:
-                    result = self._process_spec(
-                        spec=spec,
-                        existing=existing,
-                        prev_hashes=prev_hashes,
-                        dry_run=dry_run,
-                        update=update,
-                        respect_status=respect_status,
-                        project_assigner=project_assigner,
-                    )
-                    results.append({"spec": spec, "result": result})
-            return results
+                fallback = self._process_specs_fallback(
+                    specs, existing, prev_hashes, dry_run, update, respect_status, project_assigner
+                )
+            return [
+                {"spec": spec, "result": result}
+                for spec, result in zip(specs, fallback, strict=True)
+            ]
 
         # Concurrency path: leverage concurrent processor to parallelize _process_spec.
         async def _run() -> list[dict[str, Any]]:
             processor = create_concurrent_processor(self._concurrency_config, mock=self._mock)
+            presolved = self._presolve_unchanged(specs, existing, prev_hashes, respect_status)
+            pending = [spec for spec, done in zip(specs, presolved, strict=True) if done is None]
 
-            def _wrapper(spec: IssueSpec) -> dict[str, Any]:  # executed in threads
-                return self._process_spec(
-                    spec=spec,
-                    existing=existing,
-                    prev_hashes=prev_hashes,
-                    dry_run=dry_run,
-                    update=update,
-                    respect_status=respect_status,
-                    project_assigner=project_assigner,
-                )
+            if self._uses_http_transport(dry_run):
+                # Pooled REST transport: process specs as coroutines, no thread per spec.
+                async with create_async_github_client(
+                    self._concurrency_config, self._mock, repo=self.cfg.github_repo
+                ) as client:
+
+                    async def _spec_coro(spec: IssueSpec) -> dict[str, Any]:
+                        return await self._process_spec_async(
+                            spec=spec,
+                            client=client,
+                            existing=existing,
+                            prev_hashes=prev_hashes,
+                            update=update,
+                            respect_status=respect_status,
+                            project_assigner=project_assigner,
+                        )
+
+                    http_processed = await processor.process_specs_concurrent(pending, _spec_coro)
+                return [
+                    {"spec": spec, "result": result}
+                    for spec, result in zip(
+                        specs, _merge_presolved(presolved, http_processed), strict=True
+                    )
+                ]
 
-            processed = await processor.process_specs_concurrent(specs, _wrapper)
+            # Executed in worker threads; partial avoids a Python-level frame per spec.
+            process_one = functools.partial(
+                self._process_spec,
+                existing=existing,
+                prev_hashes=prev_hashes,
+                dry_run=dry_run,
+                update=update,
+                respect_status=respect_status,
+                project_assigner=project_assigner,
+            )
+            dispatch = io_bound(process_one)
+            if update and not dry_run:
+                # Collapse each batch's issue edits into one GraphQL batch instead
+                # of up to three ``gh`` calls per issue.
+                batched = io_bound(functools.partial(process_one))
+                setattr(  # noqa: B010
+                    batched,
+                    "batch_call",
+                    functools.partial(
+                        self._process_spec_batch,
+                        processor=processor,
+                        dispatch=dispatch,
+                        client=AsyncGitHubClient(self._concurrency_config, self._mock),
+                        existing=existing,
+                        prev_hashes=prev_hashes,
+                        respect_status=respect_status,
+                        project_assigner=project_assigner,
+                    ),
+                )
+                dispatch = batched
+            processed = await processor.process_specs_concurrent(pending, dispatch)
             return [
                 {"spec": spec, "result": result}
-                for spec, result in zip(specs, processed, strict=False)
+                for spec, result in zip(specs, _merge_presolved(presolved, processed), strict=True)
             ]
 
         with self._benchmark.measure("process_specs", spec_count=len(specs), mode="concurrent"):
             try:
                 # If already in an event loop (e.g., when called from async tests),
                 # fall back to explicit sequential processing to avoid recursion.
-                loop = asyncio.get_event_loop()
-                if loop.is_running():  # pragma: no cover - defensive
+                if _loop_is_running():  # pragma: no cover - defensive
                     seq_sequential: list[dict[str, Any]] = []
                     with self._benchmark.measure(
                         "process_specs", spec_count=len(specs), mode="sequential"
@@ -549,7 +810,7 @@ class IssueSuite:
                             )
                             seq_sequential.append({"spec": spec, "result": result})
                     return seq_sequential
-                return asyncio.run(_run())
+                return self._run_async(_run())
             except Exception:  # pragma: no cover - defensive fallback
                 seq_fallback: list[dict[str, Any]] = []
                 with self._benchmark.measure(
@@ -568,50 +829,42 @@ class IssueSuite:
                         seq_fallback.append({"spec": spec, "result": result})
                 return seq_fallback
 
+    def _run_async(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Run ``coro`` on this suite's persistent event loop.
+
+        Reusing one ``asyncio.Runner`` avoids building and tearing down a loop
+        (and its default executor) on every sync. Python 3.10 has no Runner and
+        falls back to ``asyncio.run``.
+        """
+        runner_cls = getattr(asyncio, "Runner", None)
+        if runner_cls is None:  # pragma: no cover - Python 3.10
+            return asyncio.run(coro)
+        if self._runner is None:
+            self._runner = runner_cls()
+            self._runner_finalizer = weakref.finalize(self, _discard_runner_loop, self._runner)
+        return cast(_T, self._runner.run(coro))
+
+    def close(self) -> None:
+        """Release the event loop kept for concurrent syncs."""
+        if self._runner_finalizer is not None:
+            self._runner_finalizer.detach()
+        if self._runner is not None:
+            self._runner.close()
+        self._runner = None
+        self._runner_finalizer = None
+
     def _sync_build_summary(
         self, specs: list[IssueSpec], processed: list[dict[str, Any]]
     ) -> dict[str, Any]:
-        created: list[dict[str, Any]] = []
-        updated: list[dict[str, Any]] = []
-        closed: list[dict[str, Any]] = []
-        mapping: dict[str, int] = {}
-        skipped = 0
-        for entry in processed:
-            spec: IssueSpec = entry["spec"]
-            result: dict[str, Any] = entry["result"]
-            if result.get("created"):
-                created.append(
-                    {
-                        "external_id": spec.external_id,
-                        "title": spec.title,
-                        "hash": spec.hash,
-                    }
-                )
-            if mapped := result.get("mapped"):
-                mapping[spec.external_id] = mapped
-            if closed_entry := result.get("closed"):
-                closed.append(closed_entry)
-            if updated_entry := result.get("updated"):
-                updated.append(updated_entry)
-            if result.get("skipped"):
-                skipped += 1
-        return {
-            "totals": {
-                "specs": len(specs),
-                "created": len(created),
-                "updated": len(updated),
-                "closed": len(closed),
-                "skipped": skipped,
-            },
-            "changes": {"created": created, "updated": updated, "closed": closed},
-            "mapping": mapping,
-        }
+        return _summarize_results(
+            specs, [entry["result"] for entry in processed], errors_as_skipped=False
+        )
 
     def _process_spec(
         self,
-        *,
         spec: IssueSpec,
-        existing: list[dict[str, Any]],
+        *,
+        existing: _ExistingIssues,
         prev_hashes: dict[str, str],
         dry_run: bool,
         update: bool,
@@ -636,14 +889,16 @@ class IssueSuite:
         number = match.get("number") if match else None
         if isinstance(number, int):
             result["mapped"] = number
-            try:  # project assignment (noop currently)
-                project_assigner.assign(number, spec)
-            except Exception as exc:  # pragma: no cover - defensive
-                self._logger.log_error(
-                    "Project assignment failed",
-                    error=str(exc),
-                    external_id=spec.external_id,
-                )
+            # Disabled projects get a no-op assigner; skip the dispatch entirely.
+            if self.cfg.project_enable:
+                try:
+                    project_assigner.assign(number, spec)
+                except Exception as exc:  # pragma: no cover - defensive
+                    self._logger.log_error(
+                        "Project assignment failed",
+                        error=str(exc),
+                        external_id=spec.external_id,
+                    )
         if respect_status and spec.status == "closed" and match.get("state") != "CLOSED":
             self._close(match, dry_run)
             result["closed"] = {
@@ -663,11 +918,246 @@ class IssueSuite:
         result["skipped"] = True
         return result
 
+    def _presolve_unchanged(
+        self,
+        specs: list[IssueSpec],
+        existing: _ExistingIssues,
+        prev_hashes: dict[str, str],
+        respect_status: bool,
+    ) -> list[dict[str, Any] | None]:
+        """Resolve specs that ``_process_spec`` would only map and skip, without dispatch.
+
+        A spec qualifies when its hash matches the previous sync, it matches an
+        existing issue, no status close is due and project assignment is off.
+        Every other spec gets ``None`` and must go through ``_process_spec``.
+        """
+        index = _build_existing_index(existing)
+        presolved: list[dict[str, Any] | None] = []
+        for spec in specs:
+            prev_hash = prev_hashes.get(spec.external_id)
+            match = (
+                self._match(spec, index)
+                if prev_hash and prev_hash == spec.hash and not self.cfg.project_enable
+                else None
+            )
+            number = match.get("number") if match else None
+            if (
+                match is None
+                or not isinstance(number, int)
+                or (respect_status and spec.status == "closed" and match.get("state") != "CLOSED")
+            ):
+                presolved.append(None)
+            else:
+                presolved.append({"mapped": number, "skipped": True})
+        return presolved
+
+    async def _process_spec_batch(
+        self,
+        batch: list[IssueSpec],
+        *,
+        processor: Any,
+        dispatch: Any,
+        client: AsyncGitHubClient,
+        existing: _ExistingIssues,
+        prev_hashes: dict[str, str],
+        respect_status: bool,
+        project_assigner: ProjectAssignerProtocol,
+    ) -> list[dict[str, Any]]:
+        """Process one batch of specs, sending its issue edits as a single GraphQL batch.
+
+        Specs whose only action is an edit of a matched issue become ``IssueUpdate``
+        entries for ``client.batch_update_issues_async``; creates, closes and skips
+        still go through ``dispatch``. Failures become per-spec error results, as
+        the concurrent processor records them, so this never raises.
+        """
+        edits: dict[int, dict[str, Any]] = {}
+        for i, spec in enumerate(batch):
+            match = self._match(spec, existing)
+            if (
+                match is not None
+                and isinstance(match.get("number"), int)
+                and not (
+                    respect_status and spec.status == "closed" and match.get("state") != "CLOSED"
+                )
+                and needs_update(spec, match, prev_hashes.get(spec.external_id))
+            ):
+                edits[i] = match
+        others = [spec for i, spec in enumerate(batch) if i not in edits]
+        other_results = iter(await processor.process_specs_concurrent(others, dispatch))
+        if not edits:
+            return list(other_results)
+
+        updates: list[IssueUpdate] = []
+        for i, match in edits.items():
+            spec = batch[i]
+            number = int(match["number"])
+            self._log("update", spec.external_id, f"#{number}")
+            self._logger.log_issue_action("update", spec.external_id, number, dry_run=False)
+            updates.append(
+                IssueUpdate(
+                    number,
+                    body=_ensure_marker(spec.body, spec.external_id),
+                    labels=tuple(spec.labels),
+                    milestone=spec.milestone,
+                )
+            )
+        try:
+            outcomes = await client.batch_update_issues_async(updates, repo=self.cfg.github_repo)
+        except Exception as exc:  # pragma: no cover - defensive
+            outcomes = [(False, str(exc))] * len(updates)
+        if self.cfg.project_enable:
+            await asyncio.gather(
+                *(
+                    self._assign_project_async(project_assigner, int(match["number"]), batch[i])
+                    for i, match in edits.items()
+                )
+            )
+
+        outcome_by_index = dict(zip(edits, outcomes, strict=True))
+        results: list[dict[str, Any]] = []
+        for i, spec in enumerate(batch):
+            if i not in edits:
+                results.append(next(other_results))
+                continue
+            ok, message = outcome_by_index[i]
+            if not ok:
+                results.append({"error": message, "spec": spec})
+                continue
+            match = edits[i]
+            results.append(
+                {
+                    "mapped": match["number"],
+                    "updated": {
+                        "external_id": spec.external_id,
+                        "number": match["number"],
+                        "diff": compute_diff(spec, match),
+                    },
+                }
+            )
+        return results
+
+    async def _assign_project_async(
+        self, project_assigner: ProjectAssignerProtocol, number: int, spec: IssueSpec
+    ) -> None:
+        try:
+            await asyncio.to_thread(project_assigner.assign, number, spec)
+        except Exception as exc:  # pragma: no cover - defensive
+            self._logger.log_error(
+                "Project assignment failed", error=str(exc), external_id=spec.external_id
+            )
+
+    def _uses_http_transport(self, dry_run: bool) -> bool:
+        """True when live concurrent syncs should go through the pooled REST client."""
+        return (
+            self.cfg.concurrency_transport == "http"
+            and bool(self.cfg.github_repo)
+            and not dry_run
+            and not self._mock
+        )
+
+    async def _process_spec_async(
+        self,
+        *,
+        spec: IssueSpec,
+        client: Any,
+        existing: _ExistingIssues,
+        prev_hashes: dict[str, str],
+        update: bool,
+        respect_status: bool,
+        project_assigner: ProjectAssignerProtocol,
+    ) -> dict[str, Any]:
+        """Coroutine twin of ``_process_spec`` for live syncs over ``client``.
+
+        ``client`` is an async GitHub client (``create_async_github_client``).
+        A failed call raises ``RuntimeError`` so the concurrent processor records
+        it as that spec's error result.
+        """
+        result: dict[str, Any] = {}
+        match = self._match(spec, existing)
+        if not match:
+            self._log("create", spec.external_id)
+            self._logger.log_issue_action("create", spec.external_id, dry_run=False)
+            ok, message = await client.create_issue_async(
+                spec.title,
+                _ensure_marker(spec.body, spec.external_id),
+                labels=spec.labels,
+                milestone=spec.milestone,
+            )
+            if not ok:
+                raise RuntimeError(message)
+            result["created"] = True
+            if created := _CREATED_NUMBER_RE.search(message):
+                result["mapped"] = int(created.group(1))
+            return result
+        number = match.get("number")
+        if isinstance(number, int):
+            result["mapped"] = number
+            # Disabled projects get a no-op assigner; skip the dispatch entirely.
+            if self.cfg.project_enable:
+                await self._assign_project_async(project_assigner, number, spec)
+        if respect_status and spec.status == "closed" and match.get("state") != "CLOSED":
+            self._log("close", f"#{match['number']}")
+            self._logger.log_issue_action(
+                "close", match.get("title", "unknown"), int(match["number"]), dry_run=False
+            )
+            ok, message = await client.close_issue_async(int(match["number"]))
+            if not ok:
+                raise RuntimeError(message)
+            result["closed"] = {"external_id": spec.external_id, "number": match["number"]}
+            return result
+        if update and needs_update(spec, match, prev_hashes.get(spec.external_id)):
+            diff = compute_diff(spec, match)
+            self._log("update", spec.external_id, f"#{match['number']}")
+            self._logger.log_issue_action(
+                "update", spec.external_id, int(match["number"]), dry_run=False
+            )
+            ok, message = await client.update_issue_async(
+                int(match["number"]),
+                body=_ensure_marker(spec.body, spec.external_id),
+                labels=spec.labels,
+                milestone=spec.milestone,
+            )
+            if not ok:
+                raise RuntimeError(message)
+            result["updated"] = {
+                "external_id": spec.external_id,
+                "number": match["number"],
+                "diff": diff,
+            }
+            return result
+        result["skipped"] = True
+        return result
+
     # --- internal helpers ---
+    def _gh_executable(self) -> str | None:
+        """Resolve ``gh`` on PATH once per suite; a miss is remembered too."""
+        if not self._gh_resolved:
+            self._gh_path = shutil.which("gh")
+            self._gh_resolved = True
+        return self._gh_path
+
+    def _gh_for_ensure(self, step: str) -> str | None:
+        """``gh`` path for a preflight ensure step; a missing CLI is logged only once."""
+        gh_path = self._gh_executable()
+        if gh_path is None and not self._gh_missing_logged:
+            self._gh_missing_logged = True
+            self._logger.log_error(f"GitHub CLI unavailable for {step} ensure step")
+        return gh_path
+
     def _gh_auth(self) -> bool:
+        """Whether ``gh auth status`` succeeds; cached for ``_GH_AUTH_TTL`` seconds."""
         if self._mock:
             return False
-        gh_path = shutil.which("gh")
+        cached = self._gh_auth_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < _GH_AUTH_TTL:
+            return cached[1]
+        ok = self._probe_gh_auth()
+        self._gh_auth_cache = (now, ok)
+        return ok
+
+    def _probe_gh_auth(self) -> bool:
+        gh_path = self._gh_executable()
         if not gh_path:
             self._logger.debug("GitHub CLI not available for auth status probe")
             return False
@@ -689,28 +1179,23 @@ class IssueSuite:
         return False
 
     def _existing_issues(self) -> list[dict[str, Any]]:
-        client = self._build_issues_client(dry_run=False)
-        existing_raw = client.list_existing()
-        # Explicit typing for static analysis
-        existing: list[dict[str, Any]] = []
-        for e in existing_raw:
-            existing.append(e)
-        return existing
+        # list_existing already builds a fresh list per call; no defensive copy needed.
+        return self._build_issues_client(dry_run=False).list_existing()
 
-    def _match(self, spec: IssueSpec, existing: list[dict[str, Any]]) -> dict[str, Any] | None:
-        def _norm(text: str) -> str:
-            return re.sub(r"\s+", " ", text.lower())
+    def _match(self, spec: IssueSpec, existing: _ExistingIssues) -> dict[str, Any] | None:
+        """Match ``spec`` by slug marker, then exact title, then normalised title.
 
-        marker = f"{_MARKER_PREFIX}{spec.external_id} -->"
-        for issue in existing:
-            body = issue.get("body") or ""
-            if isinstance(body, str) and marker in body:
-                return issue
-            title = issue.get("title")
-            if title == spec.title:
-                return issue
-            if spec.external_id in (title or "") and _norm(title or "") == _norm(spec.title):
-                return issue
+        A normalised-title match only counts when the title also contains the slug.
+        """
+        index = _build_existing_index(existing)
+        issue = index.by_marker.get(spec.external_id)
+        if issue is None:
+            issue = index.by_title.get(spec.title)
+        if issue is not None:
+            return issue
+        issue = index.by_norm_title.get(_WS_RE.sub(" ", spec.title.lower()))
+        if issue is not None and spec.external_id in (issue.get("title") or ""):
+            return issue
         return None
 
     # diff / update helpers now provided by diffing module
@@ -740,12 +1225,16 @@ class IssueSuite:
             milestone=spec.milestone,
         )
 
-    def _close(self, issue: dict[str, Any], dry_run: bool) -> None:
+    def _log_close(self, issue: dict[str, Any], dry_run: bool) -> int:
         number = int(issue["number"])
         self._log("close", f"#{number}", "dry_run" if dry_run else "")
         self._logger.log_issue_action(
             "close", issue.get("title", "unknown"), number, dry_run=dry_run
         )
+        return number
+
+    def _close(self, issue: dict[str, Any], dry_run: bool) -> None:
+        number = self._log_close(issue, dry_run)
         client = self._build_issues_client(dry_run=dry_run)
         client.close_issue(number=number)
 
@@ -759,25 +1248,70 @@ class IssueSuite:
 
         Only operates when prune flag set and not dry-run.
         """
-        matched_numbers: set[int] = set()
-        for entry in processed:
-            res = entry.get("result")
-            if isinstance(res, dict) and "mapped" in res and isinstance(res["mapped"], int):
-                matched_numbers.add(res["mapped"])
-        for issue in existing:
-            num = issue.get("number")
-            if isinstance(num, int) and num not in matched_numbers:
-                try:
-                    self._close(issue, dry_run)
-                except Exception as exc:
+        # One pass over the results and one over the existing issues; both are
+        # set lookups, so pruning stays linear however many issues there are.
+        matched_numbers = {
+            mapped
+            for entry in processed
+            if isinstance(res := entry.get("result"), dict)
+            and isinstance(mapped := res.get("mapped"), int)
+        }
+        stale = [
+            issue
+            for issue in existing
+            if isinstance(issue.get("number"), int) and issue["number"] not in matched_numbers
+        ]
+        if (
+            len(stale) > 1
+            and self._concurrency_config.enabled
+            and self._uses_http_transport(dry_run)
+            and not _loop_is_running()
+        ):
+            self._run_async(self._prune_unmatched_async(stale))
+            return
+        if len(stale) > 1:
+            # The issues client batches the closes into GraphQL mutations over gh.
+            numbers = [self._log_close(issue, dry_run) for issue in stale]
+            client = self._build_issues_client(dry_run=dry_run)
+            for number, error in client.close_issues(numbers).items():
+                self._logger.log_error(
+                    "Failed to prune unmatched issue", error=error, issue_number=number
+                )
+            return
+        for issue in stale:
+            try:
+                self._close(issue, dry_run)
+            except Exception as exc:
+                self._logger.log_error(
+                    "Failed to prune unmatched issue",
+                    error=str(exc),
+                    issue_number=issue["number"],
+                )
+
+    async def _prune_unmatched_async(self, stale: list[dict[str, Any]]) -> None:
+        """Close ``stale`` issues concurrently over the pooled REST client.
+
+        Failures are logged per issue, as in the sequential path, and never abort
+        the remaining closes.
+        """
+        sem = asyncio.Semaphore(_PRUNE_MAX_IN_FLIGHT)
+        async with create_async_github_client(
+            self._concurrency_config, self._mock, repo=self.cfg.github_repo
+        ) as client:
+
+            async def _close_one(issue: dict[str, Any]) -> None:
+                async with sem:
+                    number = self._log_close(issue, dry_run=False)
+                    try:
+                        ok, message = await client.close_issue_async(number)
+                    except Exception as exc:
+                        ok, message = False, str(exc)
+                if not ok:
                     self._logger.log_error(
-                        "Failed to prune unmatched issue",
-                        error=str(exc),
-                        issue_number=num,
+                        "Failed to prune unmatched issue", error=message, issue_number=number
                     )
 
-    def _hash_state_path(self) -> Path:
-        return self.cfg.source_file.parent / self.cfg.hash_state_file
+            await asyncio.gather(*(_close_one(issue) for issue in stale))
 
     def _maybe_assign_project_on_create(
         self,
@@ -792,14 +1326,15 @@ class IssueSuite:
         Real mode would require capturing returned issue number from creation; left
         for future enhancement (will integrate once create path captures GH response).
         """
-        if dry_run or not getattr(self.cfg, "project_enable", False):
+        if dry_run or not self.cfg.project_enable:
             return
         if not self._mock:
             return  # defer until real post-create number capture implemented
-        try:
-            synthetic_number = int(spec.external_id)
-        except ValueError:
+        # Predicate instead of try/int(): non-numeric slugs are the common case.
+        eid = spec.external_id
+        if not (eid.isascii() and eid.isdigit()):
             return
+        synthetic_number = int(eid)
         if synthetic_number <= 0:
             return
         try:  # pragma: no cover - defensive around external project assigner
@@ -812,12 +1347,17 @@ class IssueSuite:
                 external_id=spec.external_id,
             )
 
+    def _hash_state_path(self) -> Path:
+        # Read from the current cfg: callers may swap ``self.cfg`` on a live suite.
+        return self.cfg.source_file.parent / self.cfg.hash_state_file
+
     def _load_hash_state(self) -> dict[str, str]:
         p = self._hash_state_path()
         if not p.exists():
             return {}
         try:
-            raw: Any = json.loads(p.read_text())
+            data = p.read_bytes()
+            raw: Any = _json.loads(data)
         except Exception:  # pragma: no cover
             return {}
         if not isinstance(raw, dict):
@@ -825,39 +1365,129 @@ class IssueSuite:
         hashes = raw.get("hashes")
         if not isinstance(hashes, dict):
             return {}
-        out: dict[str, str] = {}
-        for k, v in hashes.items():
-            if isinstance(k, str) and isinstance(v, str):
-                out[k] = v
-        return out  # noqa: RUF100
+        # JSON keys and values are exact str instances, so an identity check suffices.
+        return {k: v for k, v in hashes.items() if type(k) is str and type(v) is str}
 
     def _save_hash_state(self, specs: list[IssueSpec]) -> None:
         p = self._hash_state_path()
-        p.write_text(
-            json.dumps({"hashes": {s.external_id: s.hash for s in specs}}, indent=2) + "\n"
-        )
+        state = {"hashes": {s.external_id: s.hash for s in specs}}
+        data = _json.dumps(state, indent=True) + b"\n"
+        # Write then rename so an interrupted sync never leaves a truncated hash file.
+        tmp = p.with_suffix(p.suffix + ".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(p)
 
     # --- preflight helpers (label & milestone ensure) ---
     def _preflight(self, specs: list[IssueSpec]) -> None:  # orchestrator entry
         if not (self.cfg.ensure_labels_enabled or self.cfg.ensure_milestones_enabled):
             return
+        # Steady state: everything wanted is already known to exist, so skip gh entirely.
         if self.cfg.ensure_labels_enabled:
-            self._ensure_labels(specs)
+            desired = set(self.cfg.inject_labels).union(*(spec.labels for spec in specs))
+            if not _cache_covers(self._label_cache, desired):
+                self._ensure_labels(specs)
         if self.cfg.ensure_milestones_enabled and self.cfg.ensure_milestones_list:
-            self._ensure_milestones()
+            if not _cache_covers(self._milestone_cache, set(self.cfg.ensure_milestones_list)):
+                self._ensure_milestones()
 
     def _ensure_labels(
         self, specs: list[IssueSpec]
     ) -> None:  # pragma: no cover - network side-effects
         if self._mock:
             return
-        gh_path = shutil.which("gh")
+        gh_path = self._gh_for_ensure("label")
         if not gh_path:
-            self._logger.log_error("GitHub CLI unavailable for label ensure step")
             return
-        desired = sorted(
-            {label for spec in specs for label in spec.labels} | set(self.cfg.inject_labels)
-        )
+        desired = sorted(set(self.cfg.inject_labels).union(*(spec.labels for spec in specs)))
+        listed = self._label_cache
+        existing = self._existing_labels(gh_path)
+        missing = [lbl for lbl in desired if lbl not in existing]
+        if missing and listed is not None and self._label_cache is listed:
+            # Served from cache: re-list once in case they were created elsewhere since.
+            existing = self._existing_labels(gh_path, refresh=True)
+            missing = [lbl for lbl in missing if lbl not in existing]
+        cmds = [
+            [
+                gh_path,
+                "label",
+                "create",
+                lbl,
+                "--color",
+                "ededed",
+                "--description",
+                "Auto-created (issuesuite)",
+            ]
+            for lbl in missing
+        ]
+        for lbl, error in zip(missing, self._gh_check_all(cmds), strict=True):
+            if error is None:
+                existing.add(lbl)
+            else:
+                self._logger.log_error("Failed to ensure label", error=str(error), label=lbl)
+
+    def _ensure_milestones(self) -> None:  # pragma: no cover - network side-effects
+        if self._mock:
+            return
+        gh_path = self._gh_for_ensure("milestone")
+        if not gh_path:
+            return
+        listed = self._milestone_cache
+        existing = self._existing_milestones(gh_path)
+        missing = [
+            ms for ms in dict.fromkeys(self.cfg.ensure_milestones_list) if ms not in existing
+        ]
+        if missing and listed is not None and self._milestone_cache is listed:
+            # Served from cache: re-list once in case they were created elsewhere since.
+            existing = self._existing_milestones(gh_path, refresh=True)
+            missing = [ms for ms in missing if ms not in existing]
+        cmds = [
+            [
+                gh_path,
+                "api",
+                "repos/:owner/:repo/milestones",
+                "-f",
+                f"title={ms}",
+                "-f",
+                "description=Auto-created (issuesuite)",
+            ]
+            for ms in missing
+        ]
+        for ms, error in zip(missing, self._gh_check_all(cmds), strict=True):
+            if error is None:
+                existing.add(ms)
+            else:
+                self._logger.log_error("Failed to ensure milestone", error=str(error), milestone=ms)
+
+    def _gh_check_all(self, cmds: list[list[str]]) -> list[Exception | None]:
+        """Run independent ``gh`` commands, fanning out when there are several.
+
+        Outside a running event loop, several commands are spawned concurrently
+        on the suite's runner. Otherwise they run one after another.
+        """
+        if len(cmds) > 1 and not _loop_is_running():
+            return self._run_async(_gh_check_calls(cmds))
+        errors: list[Exception | None] = []
+        for cmd in cmds:
+            try:
+                subprocess.check_call(  # nosec B603 - command uses resolved gh path and static args
+                    cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                )
+            except Exception as exc:
+                errors.append(exc)
+            else:
+                errors.append(None)
+        return errors
+
+    def _existing_labels(self, gh_path: str, *, refresh: bool = False) -> set[str]:
+        """Label names in the repo; cached for ``_GH_LIST_TTL`` seconds unless ``refresh``.
+
+        The returned set is the cached one, so callers add labels they create to it.
+        A failed listing is logged and not cached.
+        """
+        cached = self._label_cache
+        now = time.monotonic()
+        if not refresh and cached is not None and now - cached[0] < _GH_LIST_TTL:
+            return cached[1]
         try:
             out = subprocess.check_output(  # nosec B603 - command uses resolved gh path and static args
                 [
@@ -873,38 +1503,19 @@ class IssueSuite:
                 ],
                 text=True,
             )
-            existing: set[str] = set(out.strip().splitlines())
         except Exception as exc:
             self._logger.log_error("Failed to list labels", error=str(exc), executable=gh_path)
-            existing = set()
-        for lbl in desired:
-            if lbl in existing:
-                continue
-            try:
-                subprocess.check_call(  # nosec B603 - command uses resolved gh path and static args
-                    [
-                        gh_path,
-                        "label",
-                        "create",
-                        lbl,
-                        "--color",
-                        "ededed",
-                        "--description",
-                        "Auto-created (issuesuite)",
-                    ],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
-            except Exception as exc:
-                self._logger.log_error("Failed to ensure label", error=str(exc), label=lbl)
-
-    def _ensure_milestones(self) -> None:  # pragma: no cover - network side-effects
-        if self._mock:
-            return
-        gh_path = shutil.which("gh")
-        if not gh_path:
-            self._logger.log_error("GitHub CLI unavailable for milestone ensure step")
-            return
+            return set()
+        names = {line for line in out.splitlines() if line}
+        self._label_cache = (now, names)
+        return names
+
+    def _existing_milestones(self, gh_path: str, *, refresh: bool = False) -> set[str]:
+        """Milestone titles in the repo; cached like ``_existing_labels``."""
+        cached = self._milestone_cache
+        now = time.monotonic()
+        if not refresh and cached is not None and now - cached[0] < _GH_LIST_TTL:
+            return cached[1]
         try:
             out = subprocess.check_output(  # nosec B603 - command uses resolved gh path and static args
                 [
@@ -917,29 +1528,12 @@ class IssueSuite:
                 ],
                 text=True,
             )
-            existing: set[str] = set(out.strip().splitlines())
         except Exception as exc:
             self._logger.log_error("Failed to list milestones", error=str(exc), executable=gh_path)
-            existing = set()
-        for ms in self.cfg.ensure_milestones_list:
-            if ms in existing:
-                continue
-            try:
-                subprocess.check_call(  # nosec B603 - command uses resolved gh path and static args
-                    [
-                        gh_path,
-                        "api",
-                        "repos/:owner/:repo/milestones",
-                        "-f",
-                        f"title={ms}",
-                        "-f",
-                        "description=Auto-created (issuesuite)",
-                    ],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
-            except Exception as exc:
-                self._logger.log_error("Failed to ensure milestone", error=str(exc), milestone=ms)
+            return set()
+        titles = {line for line in out.splitlines() if line}
+        self._milestone_cache = (now, titles)
+        return titles
 
     # Concurrency support methods
     async def _get_existing_issues_async(self) -> list[dict[str, Any]]:
@@ -947,14 +1541,20 @@ class IssueSuite:
         if self._mock:
             return []
 
-        with create_async_github_client(self._concurrency_config, self._mock) as client:
-            success, issues = await client.get_issues_async()
+        with create_async_github_client(
+            self._concurrency_config, self._mock, repo=self.cfg.github_repo
+        ) as client:
+            if self.cfg.concurrency_graphql_fetch and isinstance(client, AsyncGitHubClient):
+                success, issues = await client.get_issues_graphql_async()
+            else:
+                success, issues = await client.get_issues_async()
             return issues if success else []
 
+    @io_bound
     def _process_spec_wrapper(
         self,
         spec: IssueSpec,
-        existing: list[dict[str, Any]],
+        existing: _ExistingIssues,
         prev_hashes: dict[str, str],
         dry_run: bool,
         update: bool,
@@ -1005,7 +1605,7 @@ class IssueSuite:
                 respect_status,
                 project_assigner,
             )
-            summary = self._aggregate_results(specs, results, dry_run)
+            summary = self._aggregate_results(specs, results, dry_run, prev_hashes=prev_hashes)
             self._logger.log_operation(
                 "sync_async_complete",
                 **{
@@ -1036,19 +1636,23 @@ class IssueSuite:
     async def _process_specs_async(
         self,
         specs: list[IssueSpec],
-        existing: list[dict[str, Any]],
+        existing: _ExistingIssues,
         prev_hashes: dict[str, str],
         dry_run: bool,
         update: bool,
         respect_status: bool,
         project_assigner: ProjectAssignerProtocol,
     ) -> list[dict[str, Any]]:
+        existing = _build_existing_index(existing)
         if self.cfg.concurrency_enabled and len(specs) > 1:
             processor: _ConcurrentProcessorProtocol = create_concurrent_processor(
                 self._concurrency_config, self._mock
             )
+            # Unchanged specs that only need mapping never reach the worker pool.
+            presolved = self._presolve_unchanged(specs, existing, prev_hashes, respect_status)
+            pending = [spec for spec, done in zip(specs, presolved, strict=True) if done is None]
             concurrent_results: list[dict[str, Any]] = await processor.process_specs_concurrent(
-                specs,
+                pending,
                 self._process_spec_wrapper,
                 existing,
                 prev_hashes,
@@ -1057,61 +1661,58 @@ class IssueSuite:
                 respect_status,
                 project_assigner,
             )
-            return concurrent_results
-        # Sequential fallback
-        results: list[dict[str, Any]] = []
-        for spec in specs:
-            result = self._process_spec(
-                spec=spec,
-                existing=existing,
-                prev_hashes=prev_hashes,
-                dry_run=dry_run,
-                update=update,
-                respect_status=respect_status,
-                project_assigner=project_assigner,
-            )
-            results.append(result)
-        return results
+            return _merge_presolved(presolved, concurrent_results)
+        return self._process_specs_fallback(
+            specs, existing, prev_hashes, dry_run, update, respect_status, project_assigner
+        )
+
+    def _process_specs_fallback(
+        self,
+        specs: list[IssueSpec],
+        existing: _ExistingIssues,
+        prev_hashes: dict[str, str],
+        dry_run: bool,
+        update: bool,
+        respect_status: bool,
+        project_assigner: ProjectAssignerProtocol,
+    ) -> list[dict[str, Any]]:
+        """Process specs without the concurrent processor, one at a time in spec order.
+
+        With ``concurrency.auto_thread_fallback`` enabled, live runs over more than
+        ``_AUTO_THREAD_MIN_SPECS`` specs overlap the blocking ``gh`` calls on a small
+        thread pool instead; results stay in spec order but creates do not.
+        """
+        process = functools.partial(
+            self._process_spec,
+            existing=existing,
+            prev_hashes=prev_hashes,
+            dry_run=dry_run,
+            update=update,
+            respect_status=respect_status,
+            project_assigner=project_assigner,
+        )
+        if (
+            self.cfg.concurrency_auto_thread_fallback
+            and not dry_run
+            and not self._mock
+            and len(specs) > _AUTO_THREAD_MIN_SPECS
+        ):
+            with ThreadPoolExecutor(
+                max_workers=min(_AUTO_THREAD_MAX_WORKERS, len(specs)),
+                thread_name_prefix="issuesuite-spec",
+            ) as pool:
+                return list(pool.map(process, specs))
+        return [process(spec) for spec in specs]
 
     def _aggregate_results(
-        self, specs: list[IssueSpec], results: list[dict[str, Any]], dry_run: bool
-    ) -> dict[str, Any]:  # noqa: PLR0915
-        created: list[dict[str, Any]] = []
-        updated: list[dict[str, Any]] = []
-        closed: list[dict[str, Any]] = []
-        mapping: dict[str, int] = {}
-        skipped = 0
-        for i, result in enumerate(results):
-            if "error" in result:
-                skipped += 1
-                continue
-            spec = specs[i]
-            if result.get("created"):
-                created.append(
-                    {
-                        "external_id": spec.external_id,
-                        "title": spec.title,
-                        "hash": spec.hash,
-                    }
-                )
-            if mapped := result.get("mapped"):
-                mapping[spec.external_id] = mapped
-            if closed_entry := result.get("closed"):
-                closed.append(closed_entry)
-            if updated_entry := result.get("updated"):
-                updated.append(updated_entry)
-            if result.get("skipped"):
-                skipped += 1
-        if not dry_run:
+        self,
+        specs: list[IssueSpec],
+        results: list[dict[str, Any]],
+        dry_run: bool,
+        *,
+        prev_hashes: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        summary = _summarize_results(specs, results, errors_as_skipped=True)
+        if not dry_run and (prev_hashes is None or not _hashes_unchanged(specs, prev_hashes)):
             self._save_hash_state(specs)
-        return {
-            "totals": {
-                "specs": len(specs),
-                "created": len(created),
-                "updated": len(updated),
-                "closed": len(closed),
-                "skipped": skipped,
-            },
-            "changes": {"created": created, "updated": updated, "closed": closed},
-            "mapping": mapping,
-        }
+        return summary
@@ -26,10 +26,11 @@ import os
 import re
 import shutil
 import subprocess  # nosec B404 - subprocess is required for GitHub CLI invocation
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from typing import Any
 
+from .concurrency import RateLimiter
 from .github_rest import (
     DEFAULT_API_URL,
     DEFAULT_GRAPHQL_URL,
@@ -39,6 +40,10 @@ from .github_rest import (
 from .retry import run_with_retries
 
 NUMBER_PATTERN = re.compile(r"/issues/(\d+)")
+# Issues closed per aliased GraphQL lookup + mutation pair.
+CLOSE_BATCH_SIZE = 50
+# Below this many issues, one ``gh issue close`` each is no more processes than a batch.
+_MIN_GRAPHQL_CLOSE_BATCH = 3
 
 
 @dataclass
@@ -46,6 +51,49 @@ class IssuesClientConfig:
     repo: str | None = None  # owner/repo; if None gh defaults to current directory remote
     mock: bool = False
     dry_run: bool = False
+    # Ceiling on live GitHub calls per second across threads; <= 0 disables pacing.
+    requests_per_second: float = 0.0
+
+
+def _extract_json_object(text: str) -> dict[str, Any] | None:
+    """Return the first JSON object in ``text`` (gh may mix in stderr lines)."""
+    start = text.find("{")
+    if start < 0:
+        return None
+    try:
+        value, _end = json.JSONDecoder().raw_decode(text, start)
+    except ValueError:
+        return None
+    return value if isinstance(value, dict) else None
+
+
+def _alias_failures(
+    errors: list[dict[str, Any]], chunk: Sequence[int], prefix: str
+) -> tuple[dict[int, str], str | None]:
+    """Map GraphQL errors back to ``chunk`` through their ``<prefix><index>`` alias.
+
+    Returns the per-issue messages and the first error that names no alias, which
+    callers treat as a failure of the whole request.
+    """
+    failures: dict[int, str] = {}
+    general: str | None = None
+    for err in errors:
+        message = str(err.get("message", "GraphQL error"))
+        index = next(
+            (
+                int(part[len(prefix) :])
+                for part in err.get("path") or []
+                if isinstance(part, str)
+                and part.startswith(prefix)
+                and part[len(prefix) :].isdigit()
+            ),
+            None,
+        )
+        if index is None or index >= len(chunk):
+            general = general or message
+        else:
+            failures[chunk[index]] = message
+    return failures, general
 
 
 class IssuesClient:
@@ -63,6 +111,9 @@ class IssuesClient:
         self.cfg = cfg
         self._env_quiet = os.environ.get("ISSUESUITE_QUIET") == "1"
         self._gh_path = shutil.which("gh")
+        # Spec processing may call the client from several worker threads; pacing
+        # keeps a burst of writes under GitHub's secondary rate limit.
+        self._pacer = RateLimiter(cfg.requests_per_second)
         self._rest_client: GitHubRestClient | None
         if rest_client is not None:
             self._rest_client = rest_client
@@ -84,6 +135,7 @@ class IssuesClient:
         if self.cfg.dry_run:
             print("DRY-RUN", " ".join(cmd))
             return ""
+        self._pacer.acquire_blocking()
         try:
             return run_with_retries(
                 lambda: subprocess.check_output(  # nosec B603 B607 - command uses controlled arguments
@@ -109,6 +161,7 @@ class IssuesClient:
             if self.cfg.dry_run:
                 print("DRY-RUN REST POST /issues", title)
                 return None
+            self._pacer.acquire_blocking()
             try:
                 return rest_client.create_issue(
                     title=title,
@@ -154,6 +207,7 @@ class IssuesClient:
             if self.cfg.dry_run:
                 print(f"DRY-RUN REST PATCH /issues/{number}")
                 return
+            self._pacer.acquire_blocking()
             try:
                 rest_client.update_issue(
                     number=number,
@@ -194,6 +248,7 @@ class IssuesClient:
             if self.cfg.dry_run:
                 print(f"DRY-RUN REST PATCH /issues/{number} state=closed")
                 return
+            self._pacer.acquire_blocking()
             try:
                 rest_client.close_issue(number=number)
                 return
@@ -202,6 +257,102 @@ class IssuesClient:
                     print(f"[rest] close_issue fallback to gh: {exc}")
         self._run(self._base_cmd("issue", "close", str(number)))
 
+    def close_issues(self, numbers: Sequence[int]) -> dict[int, str]:
+        """Close several issues, returning an error message for each one that failed.
+
+        Over the gh CLI every chunk of up to ``CLOSE_BATCH_SIZE`` issues costs two
+        ``gh api graphql`` processes (an aliased node-id lookup, then one aliased
+        ``closeIssue`` mutation) instead of one ``gh issue close`` per issue. The
+        REST, mock and dry-run paths close issues one at a time.
+        """
+        failures: dict[int, str] = {}
+        if (
+            self.cfg.mock
+            or self.cfg.dry_run
+            or self._get_rest_client() is not None
+            or len(numbers) < _MIN_GRAPHQL_CLOSE_BATCH
+        ):
+            for number in numbers:
+                try:
+                    self.close_issue(number=number)
+                except Exception as exc:  # one failed close must not stop the rest
+                    failures[number] = str(exc)
+            return failures
+        for start in range(0, len(numbers), CLOSE_BATCH_SIZE):
+            failures.update(
+                self._close_chunk_via_graphql(numbers[start : start + CLOSE_BATCH_SIZE])
+            )
+        return failures
+
+    def _close_chunk_via_graphql(self, chunk: Sequence[int]) -> dict[int, str]:
+        lookups = "\n    ".join(f"i{i}: issue(number: {n}) {{ id }}" for i, n in enumerate(chunk))
+        query = (
+            "query($owner: String!, $name: String!) {\n"
+            f"  repository(owner: $owner, name: $name) {{\n    {lookups}\n  }}\n}}"
+        )
+        try:
+            data, errors = self._graphql(query, *self._graphql_repo_fields())
+        except RuntimeError as exc:
+            return dict.fromkeys(chunk, str(exc))
+        lookup_failures, general = _alias_failures(errors, chunk, "i")
+        if general is not None:
+            return dict.fromkeys(chunk, general)
+        repo = data.get("repository") or {}
+        failures: dict[int, str] = {}
+        mutations: list[str] = []
+        for i, number in enumerate(chunk):
+            node = repo.get(f"i{i}")
+            issue_id = node.get("id") if isinstance(node, dict) else None
+            if not isinstance(issue_id, str):
+                failures[number] = lookup_failures.get(number, f"issue #{number} not found")
+                continue
+            mutations.append(
+                f"c{i}: closeIssue(input: {{issueId: {json.dumps(issue_id)}}}) "
+                "{ clientMutationId }"
+            )
+        if not mutations:
+            return failures
+        try:
+            _data, errors = self._graphql("mutation {\n  " + "\n  ".join(mutations) + "\n}")
+        except RuntimeError as exc:
+            failures.update((n, str(exc)) for n in chunk if n not in failures)
+            return failures
+        close_failures, general = _alias_failures(errors, chunk, "c")
+        if general is not None:
+            # No alias to blame: the mutation as a whole failed.
+            failures.update((n, general) for n in chunk if n not in failures)
+        failures.update(close_failures)
+        return failures
+
+    def _graphql_repo_fields(self) -> list[str]:
+        owner, sep, name = (self.cfg.repo or "").strip().partition("/")
+        if sep and owner and name:
+            return ["-f", f"owner={owner}", "-f", f"name={name}"]
+        # Let gh fill in the repository of the current directory.
+        return ["-F", "owner={owner}", "-F", "name={repo}"]
+
+    def _graphql(self, query: str, *fields: str) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        cmd = [self._gh_path or "gh", "api", "graphql", *fields, "-F", "query=@-"]
+        self._pacer.acquire_blocking()
+        try:
+            out = run_with_retries(
+                lambda: subprocess.check_output(  # nosec B603 B607 - command uses controlled arguments
+                    cmd, input=query, text=True, stderr=subprocess.STDOUT
+                )
+            )
+        except subprocess.CalledProcessError as exc:
+            # gh exits non-zero when the response carries GraphQL ``errors``; the body
+            # still says which aliases failed, so hand it back instead of raising.
+            payload = _extract_json_object(exc.output or "")
+            if payload is None or not ("data" in payload or "errors" in payload):
+                raise RuntimeError(f"Command failed: {' '.join(cmd)}: {exc.output}") from exc
+        else:
+            try:
+                payload = json.loads(out)
+            except ValueError as exc:
+                raise RuntimeError(f"Invalid GraphQL response: {exc}") from exc
+        return payload.get("data") or {}, payload.get("errors") or []
+
     def list_existing(self) -> list[dict[str, Any]]:
         rest_client = self._get_rest_client()
         if rest_client is not None:
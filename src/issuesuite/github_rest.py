@@ -145,6 +145,11 @@ class GitHubRestClient:
         if payload:
             self._request("PATCH", f"/repos/{self.repo}/issues/{number}", json_body=payload)
 
+    def add_labels(self, *, number: int, labels: Iterable[str]) -> None:
+        self._request(
+            "POST", f"/repos/{self.repo}/issues/{number}/labels", json_body={"labels": list(labels)}
+        )
+
     def close_issue(self, *, number: int) -> None:
         self.update_issue(number=number, state="closed")
 
@@ -87,7 +87,13 @@ class StructuredLogger:
             self._last_signature = signature
         self._logger.log(level, message, extra=extra)
 
+    def is_enabled_for(self, level: int) -> bool:
+        """Whether a record at ``level`` would be handled (lets callers skip formatting)."""
+        return self._logger.isEnabledFor(level)
+
     def log_operation(self, operation: str, **kw: Any) -> None:
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
         # Maintain legacy message format validated by tests
         extra = {"operation": operation, **kw}
         self._emit(logging.INFO, f"Operation: {operation}", extra)
@@ -100,6 +106,8 @@ class StructuredLogger:
         dry_run: bool = False,
         **kw: Any,
     ) -> None:
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
         extra: dict[str, Any] = {
             "operation": f"issue_{action}",
             "external_id": external_id,
@@ -117,6 +125,8 @@ class StructuredLogger:
         self._emit(logging.INFO, msg, extra)
 
     def log_performance(self, operation: str, duration_ms: float, **kw: Any) -> None:
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
         extra = {"operation": operation, "duration_ms": round(duration_ms, 2), **kw}
         self._emit(
             logging.INFO,
@@ -3,6 +3,7 @@ from __future__ import annotations
 import hashlib
 import importlib
 import re
+import sys
 from collections.abc import Iterable
 from typing import Any, TypedDict, cast
 
@@ -70,7 +71,7 @@ def _parse_single(slug: str, block: list[str]) -> IssueSpec:  # noqa: C901 - acc
         label_tokens = [p.strip() for p in labels_any.split(",") if p.strip()]
     elif isinstance(labels_any, list):
         label_tokens = [str(p).strip() for p in labels_any if str(p).strip()]
-    labels = [LABEL_CANON_MAP.get(lbl.lower(), lbl) for lbl in label_tokens]
+    labels = [sys.intern(LABEL_CANON_MAP.get(lbl.lower(), lbl)) for lbl in label_tokens]
     milestone_val = data.get("milestone") if "milestone" in data else None
     milestone = milestone_val if isinstance(milestone_val, str) and milestone_val.strip() else None
     status_val = data.get("status") if "status" in data else None
@@ -90,9 +91,11 @@ def _parse_single(slug: str, block: list[str]) -> IssueSpec:  # noqa: C901 - acc
             ]
         ).encode("utf-8")
     )
+    # Slugs, titles and labels key the existing-issue index, hash state and label
+    # sets; interning lets those lookups short-circuit on identity.
     return IssueSpec(
-        external_id=slug,
-        title=title,
+        external_id=sys.intern(slug),
+        title=sys.intern(title),
         labels=labels,
         milestone=milestone,
         body=body,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 import time
 from collections.abc import Callable
 from typing import Any, Protocol
@@ -25,15 +26,14 @@ def prepare_config(
     cfg = loader(args.config)
     repo_override = getattr(args, "repo", None)
     if repo_override:
-        cfg.github_repo = repo_override
+        cfg = dataclasses.replace(cfg, github_repo=repo_override)
     if getattr(args, "cmd", None) == "sync" and getattr(args, "project_number", None) is not None:
         try:
             project_number = int(args.project_number)
         except (TypeError, ValueError):  # pragma: no cover - defensive
             project_number = None
         if project_number and project_number > 0:
-            cfg.project_number = project_number
-            cfg.project_enable = True
+            cfg = dataclasses.replace(cfg, project_number=project_number, project_enable=True)
     return cfg
 
 
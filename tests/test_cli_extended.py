@@ -1,5 +1,7 @@
+import argparse
 import json
 import os
+import sys
 import textwrap
 from datetime import date
 from pathlib import Path
@@ -7,7 +9,7 @@ from pathlib import Path
 import pytest
 from packaging.specifiers import SpecifierSet
 
-from issuesuite import cli
+from issuesuite import cli, github_projects_sync
 from issuesuite.cli import main
 from issuesuite.dependency_audit import AllowlistedAdvisory, Finding, SuppressedFinding
 from issuesuite.github_issues import IssuesClient
@@ -98,7 +100,7 @@ def test_cli_ai_context_writes_file_and_configures_telemetry(
     monkeypatch.setenv("ISSUESUITE_OTEL_EXPORTER", "console")
     monkeypatch.setenv("ISSUESUITE_SERVICE_NAME", "issuesuite-tests")
     monkeypatch.setenv("ISSUESUITE_OTEL_ENDPOINT", "http://otel.local")
-    monkeypatch.setattr("issuesuite.cli.configure_telemetry", _fake_configure)
+    monkeypatch.setattr("issuesuite.observability.configure_telemetry", _fake_configure)
 
     rc = main(
         [
@@ -321,6 +323,7 @@ def test_cli_setup_vscode_handles_reformatted_assets(
     assert "[setup] already current .vscode/tasks.json" in rerun_output
     assert "[setup] no VS Code files created or changed" in rerun_output
 
+
 def test_cli_doctor_reports_warnings_and_problems(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
 ) -> None:
@@ -363,7 +366,7 @@ def test_cli_security_refresh_offline(
     def _refresh() -> None:
         invoked["called"] = True
 
-    monkeypatch.setattr("issuesuite.cli.refresh_advisories", _refresh)
+    monkeypatch.setattr("issuesuite.advisory_refresh.refresh_advisories", _refresh)
     rc = main(["security", "--offline-only", "--refresh-offline"])
     captured = capsys.readouterr()
 
@@ -382,7 +385,7 @@ def test_cli_security_scopes_disable_flag(
         marker["env"] = os.environ.get("ISSUESUITE_PIP_AUDIT_DISABLE_ONLINE")
         return 0
 
-    monkeypatch.setattr("issuesuite.cli.run_resilient_pip_audit", _fake_run)
+    monkeypatch.setattr("issuesuite.pip_audit_integration.run_resilient_pip_audit", _fake_run)
     monkeypatch.delenv("ISSUESUITE_PIP_AUDIT_DISABLE_ONLINE", raising=False)
 
     rc = main(["security", "--offline-only", "--pip-audit", "--pip-audit-disable-online"])
@@ -418,15 +421,15 @@ def test_cli_security_reports_allowlisted(
     suppressed = SuppressedFinding(finding=finding, allowlisted=allow)
 
     monkeypatch.setattr(
-        "issuesuite.cli.run_dependency_audit",
+        "issuesuite.dependency_audit.perform_audit",
         lambda advisories, packages, online_probe=True, online_collector=None: (
             [finding],
             None,
         ),
     )
-    monkeypatch.setattr("issuesuite.cli.load_security_allowlist", lambda: [allow])
+    monkeypatch.setattr("issuesuite.dependency_audit.load_allowlist", lambda: [allow])
     monkeypatch.setattr(
-        "issuesuite.cli.apply_security_allowlist",
+        "issuesuite.dependency_audit.apply_allowlist",
         lambda findings, allowlist: ([], [suppressed]),
     )
 
@@ -688,8 +691,8 @@ def test_cli_projects_sync_uses_config_defaults(
 
     captured_config: dict[str, object] = {}
 
-    original_build = cli.build_projects_sync_config
-    original_sync = cli.sync_projects
+    original_build = github_projects_sync.build_config
+    original_sync = github_projects_sync.sync_projects
 
     def fake_build_config(**kwargs: object) -> object:
         captured_config.update(kwargs)
@@ -704,8 +707,8 @@ def test_cli_projects_sync_uses_config_defaults(
             "report": {"status": "on_track", "message": "ok"},
         }
 
-    monkeypatch.setattr(cli, "build_projects_sync_config", fake_build_config)
-    monkeypatch.setattr(cli, "sync_projects", fake_sync_projects)
+    monkeypatch.setattr(github_projects_sync, "build_config", fake_build_config)
+    monkeypatch.setattr(github_projects_sync, "sync_projects", fake_sync_projects)
 
     rc = main(
         [
@@ -724,3 +727,79 @@ def test_cli_projects_sync_uses_config_defaults(
     assert captured_config["owner"] == "acme"
     assert captured_config["project_number"] == 7
     assert captured_config["status_field"] == "Status"
+
+
+def test_cli_schema_skips_unchanged_files(
+    fixture_repo: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    monkeypatch.chdir(fixture_repo)
+    config = str(fixture_repo / "issue_suite.config.yaml")
+
+    assert main(["--quiet", "schema", "--config", config]) == 0
+    first = capsys.readouterr().out
+    assert "[schema] wrote issue_export.schema.json" in first
+
+    export_schema = fixture_repo / "issue_export.schema.json"
+    mtime = export_schema.stat().st_mtime_ns
+
+    assert main(["--quiet", "schema", "--config", config]) == 0
+    second = capsys.readouterr().out
+    assert "[schema] wrote none" in second
+    assert "[schema] unchanged issue_export.schema.json" in second
+    assert export_schema.stat().st_mtime_ns == mtime
+
+
+@pytest.mark.parametrize(
+    ("title", "expected"),
+    [
+        ("Alpha Launch", "alpha-launch"),
+        ("  Fix: crash (again)!  ", "fix-crash-again"),
+        ("keep--double_dash", "keep--double_dash"),
+        ("Café déjà vu", "caf-d-j-vu"),
+        ("!!!", "issue"),
+        ("x" * 80, "x" * 50),
+    ],
+)
+def test_slugify_matches_import_slug_rules(title: str, expected: str) -> None:
+    assert cli._slugify(title) == expected
+
+
+def test_build_parser_skips_agent_apply_arguments_for_other_commands() -> None:
+    assert cli._sniff_subcommand(["--quiet", "agent-apply", "--no-sync"]) == "agent-apply"
+    assert cli._sniff_subcommand(["--quiet"]) is None
+
+    args = cli._build_parser("agent-apply").parse_args(["agent-apply", "--no-respect-status"])
+    assert args.respect_status is False
+
+    args = cli._build_parser("sync").parse_args(["sync", "--dry-run"])
+    assert args.cmd == "sync"
+    with pytest.raises(SystemExit):
+        cli._build_parser("sync").parse_args(["agent-apply", "--no-respect-status"])
+
+
+def test_dumps_indented_falls_back_to_stdlib_json(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("issuesuite._json._orjson", lambda: None)
+    payload = {"count": 1, "suggestions": [{"message": "Café", "current": None}]}
+    out = cli._dumps_indented(payload)
+    assert out == json.dumps(payload, indent=2, ensure_ascii=False)
+    # orjson never escapes non-ASCII, so the fallback must not either.
+    assert '"message": "Café"' in out and "\\u00e9" not in out
+
+
+def test_maybe_run_pip_audit_skips_import_when_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delitem(sys.modules, "issuesuite.pip_audit_integration", raising=False)
+
+    assert cli._maybe_run_pip_audit(argparse.Namespace(pip_audit=False), 3) == 3
+    assert "issuesuite.pip_audit_integration" not in sys.modules
+
+
+def test_get_parser_is_cached_per_command() -> None:
+    assert cli._get_parser("sync") is cli._get_parser("sync")
+    assert cli._get_parser("sync") is not cli._get_parser("agent-apply")
+    # Unknown tokens share the full parser instead of each caching their own.
+    assert cli._get_parser("snyc") is cli._get_parser("sycn") is cli._get_parser(None)
+    first = cli._get_parser("init").parse_args(["init"])
+    second = cli._get_parser("init").parse_args(["init", "--include", "vscode"])
+    assert first.include == [] and second.include == ["vscode"]
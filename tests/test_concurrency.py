@@ -8,16 +8,23 @@ literal numbers for readability and disable ruff rules for this file.
 # ruff: noqa
 
 import asyncio
+import json
 from typing import Any, List
 from unittest.mock import MagicMock, patch
 
 from issuesuite.concurrency import (
+    AdaptiveConcurrencyLimit,
+    AsyncGitHubClient,
     ConcurrencyConfig,
     ConcurrentProcessor,
+    HttpGitHubClient,
+    IssueUpdate,
+    RateLimiter,
     create_async_github_client,
     create_concurrent_processor,
     enable_concurrency_for_large_roadmaps,
     get_optimal_worker_count,
+    io_bound,
     run_concurrent_sync,
 )
 
@@ -34,6 +41,9 @@ def test_concurrency_config_defaults() -> None:
     assert config.enabled is False
     assert config.max_workers == 4
     assert config.batch_size == 10
+    assert config.requests_per_second == 10.0
+    assert config.mock_latency == 0.0
+    assert not hasattr(config, "__dict__")
 
 
 def test_async_github_client_mock() -> None:
@@ -47,7 +57,11 @@ def test_async_github_client_mock() -> None:
             success, msg = await client.update_issue_async(
                 123, "New body", ["enhancement"], "Sprint 2"
             )
-            assert success and "MOCK" in msg
+            assert success and msg.splitlines() == [
+                "MOCK: gh issue edit 123 --add-label enhancement",
+                "MOCK: gh issue edit 123 --milestone Sprint 2",
+                "MOCK: gh api repos/:owner/:repo/issues/123 --method PATCH -f body=New body",
+            ]
             success, msg = await client.close_issue_async(456)
             assert success and "MOCK" in msg
             success, issues = await client.get_issues_async()
@@ -56,17 +70,46 @@ def test_async_github_client_mock() -> None:
     asyncio.run(_run())
 
 
+class _FakeProcess:
+    def __init__(self, returncode: int, stdout: bytes = b"", stderr: bytes = b"") -> None:
+        self.returncode = returncode
+        self._stdout = stdout
+        self._stderr = stderr
+
+    async def communicate(self, stdin: bytes | None = None) -> tuple[bytes, bytes]:
+        return self._stdout, self._stderr
+
+
 def test_async_github_client_disabled_concurrency() -> None:
     async def _run() -> None:
         config = ConcurrencyConfig(enabled=False)
-        with patch("subprocess.run") as mock_run:
-            mock_result = MagicMock()
-            mock_result.stdout = "success"
-            mock_run.return_value = mock_result
+        calls: List[tuple[Any, ...]] = []
+
+        async def fake_exec(*cmd: Any, **kwargs: Any) -> _FakeProcess:
+            calls.append(cmd)
+            return _FakeProcess(0, b"success")
+
+        with patch("asyncio.create_subprocess_exec", fake_exec):
             with create_async_github_client(config, mock=False) as client:
                 success, msg = await client.create_issue_async("Test", "Body")
                 assert success and msg == "success"
-                mock_run.assert_called_once()
+                assert len(calls) == 1 and calls[0][:3] == ("gh", "issue", "create")
+
+    asyncio.run(_run())
+
+
+def test_async_github_client_reports_command_failure() -> None:
+    async def _run() -> None:
+        config = ConcurrencyConfig(enabled=True, max_workers=2)
+
+        async def fake_exec(*cmd: Any, **kwargs: Any) -> _FakeProcess:
+            return _FakeProcess(1, b"", b"boom")
+
+        with patch("asyncio.create_subprocess_exec", fake_exec):
+            async with create_async_github_client(config, mock=False) as client:
+                success, msg = await client.close_issue_async(7)
+                assert success is False
+                assert msg.startswith("Error: ") and "non-zero exit status 1" in msg
 
     asyncio.run(_run())
 
@@ -78,6 +121,7 @@ def test_concurrent_processor_creation() -> None:
     assert processor.config.enabled is True
     assert processor.config.max_workers == 4
     assert processor.mock is True
+    assert not hasattr(processor, "__dict__")
 
 
 def test_concurrent_processor_sequential_fallback() -> None:
@@ -130,6 +174,45 @@ def test_concurrent_processor_error_handling() -> None:
     asyncio.run(_run())
 
 
+def test_concurrent_processor_async_failure_and_cancellation() -> None:
+    async def _run() -> None:
+        processor = ConcurrentProcessor(ConcurrencyConfig(enabled=True, max_workers=4), mock=True)
+
+        async def flaky(item: str) -> str:
+            await asyncio.sleep(0)
+            if item == "bad":
+                raise ValueError("boom")
+            return item.upper()
+
+        results = await processor.process_specs_concurrent(["a", "bad", "c"], flaky)
+        assert results[0] == "A" and results[2] == "C"
+        assert isinstance(results[1], dict) and results[1]["error"] == "boom"
+
+        cancelled: list[str] = []
+
+        async def slow(item: str) -> str:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(item)
+                raise
+            return item
+
+        outer = asyncio.ensure_future(processor.process_specs_concurrent(["x", "y", "z"], slow))
+        await asyncio.sleep(0.01)
+        outer.cancel()
+        try:
+            await outer
+        except asyncio.CancelledError:
+            pass
+        assert outer.cancelled()
+        assert cancelled
+        # No spec task outlives the cancelled call.
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    asyncio.run(_run())
+
+
 def test_run_concurrent_sync() -> None:
     async def _run() -> None:
         config = ConcurrencyConfig(enabled=True, max_workers=2)
@@ -165,7 +248,6 @@ def test_async_github_client_context_manager() -> None:
     async def _run() -> None:
         config = ConcurrencyConfig(enabled=True, max_workers=2)
         async with create_async_github_client(config, mock=True) as client:
-            assert client._executor is not None
             success, _ = await client.create_issue_async("Test", "Body")
             assert success is True
 
@@ -201,3 +283,457 @@ def test_async_coroutine_processor() -> None:
         assert len(results) == 2 and all("async_processed_" in str(r) for r in results)
 
     asyncio.run(_run())
+
+
+def test_batch_update_issues_graphql() -> None:
+    async def _run() -> None:
+        config = ConcurrencyConfig(enabled=True, max_workers=2)
+        requests: List[tuple[tuple[Any, ...], bytes]] = []
+        lookup = {
+            "data": {
+                "repository": {
+                    "i0": {"id": "I_1"},
+                    "i1": None,
+                    "i2": {"id": "I_3"},
+                    "l0": {"id": "L_bug"},
+                    "m0": {"nodes": [{"id": "M_1", "title": "Sprint 1"}]},
+                }
+            }
+        }
+        mutation = {"data": {}, "errors": [{"path": ["u2"], "message": "nope"}]}
+        responses = [lookup, mutation]
+
+        class _Proc(_FakeProcess):
+            def __init__(self, payload: dict[str, Any]) -> None:
+                super().__init__(0, json.dumps(payload).encode())
+
+            async def communicate(self, stdin: bytes | None = None) -> tuple[bytes, bytes]:
+                requests[-1] = (requests[-1][0], stdin or b"")
+                return await super().communicate(stdin)
+
+        async def fake_exec(*cmd: Any, **kwargs: Any) -> _Proc:
+            requests.append((cmd, b""))
+            return _Proc(responses[len(requests) - 1])
+
+        updates = [
+            IssueUpdate(1, body="new body", labels=("bug",), milestone="Sprint 1"),
+            IssueUpdate(2, body="missing"),
+            IssueUpdate(3, body="rejected"),
+        ]
+        with patch("asyncio.create_subprocess_exec", fake_exec):
+            async with create_async_github_client(config, mock=False) as client:
+                results = await client.batch_update_issues_async(updates)
+
+        assert len(requests) == 2
+        assert requests[0][0][:3] == ("gh", "api", "graphql")
+        assert b'l0: label(name: "bug")' in requests[0][1]
+        mutation_doc = requests[1][1].decode()
+        assert 'u0: updateIssue(input: {id: "I_1", body: "new body", milestoneId: "M_1"})' in (
+            mutation_doc
+        )
+        assert 'labelIds: ["L_bug"]' in mutation_doc
+        assert results[0] == (True, "updated #1")
+        assert results[1][0] is False and "not found" in results[1][1]
+        assert results[2] == (False, "Error: nope")
+
+    asyncio.run(_run())
+
+
+def test_batch_update_issues_targets_explicit_repo() -> None:
+    async def _run() -> None:
+        config = ConcurrencyConfig(enabled=True)
+        calls: List[tuple[Any, ...]] = []
+
+        async def fake_exec(*cmd: Any, **kwargs: Any) -> _FakeProcess:
+            calls.append(cmd)
+            return _FakeProcess(0, b'{"data": {"repository": {}}}')
+
+        with patch("asyncio.create_subprocess_exec", fake_exec):
+            async with create_async_github_client(config, mock=False) as client:
+                results = await client.batch_update_issues_async(
+                    [IssueUpdate(1, body="x")], repo="octo/widgets"
+                )
+
+        assert calls[0][3:7] == ("-f", "owner=octo", "-f", "name=widgets")
+        assert results[0][0] is False
+
+    asyncio.run(_run())
+
+
+def test_batch_update_issues_mock() -> None:
+    async def _run() -> None:
+        config = ConcurrencyConfig(enabled=True)
+        async with create_async_github_client(config, mock=True) as client:
+            results = await client.batch_update_issues_async([IssueUpdate(5, body="x")])
+        assert results == [(True, "MOCK: graphql update #5")]
+
+    asyncio.run(_run())
+
+
+def test_concurrent_processor_uses_batch_call() -> None:
+    async def _run() -> None:
+        config = ConcurrencyConfig(enabled=True, max_workers=2, batch_size=2)
+        processor = ConcurrentProcessor(config, mock=True)
+        batches: List[List[str]] = []
+
+        def per_spec(item: str) -> str:  # pragma: no cover - replaced by batch_call
+            raise AssertionError("per-spec path should not run")
+
+        async def batch_call(batch: List[str]) -> List[str]:
+            batches.append(list(batch))
+            return [f"batched_{item}" for item in batch]
+
+        per_spec.batch_call = batch_call  # type: ignore[attr-defined]
+        results = await processor.process_specs_concurrent(["a", "b", "c"], per_spec)
+        assert batches == [["a", "b"], ["c"]]
+        assert results == ["batched_a", "batched_b", "batched_c"]
+
+    asyncio.run(_run())
+
+
+def test_get_issues_async_uses_etag_cache(tmp_path: Any) -> None:
+    async def _run() -> None:
+        config = ConcurrencyConfig(enabled=True, max_workers=2)
+        cache_path = tmp_path / "etag-cache.json"
+        page = [
+            {"number": 1, "title": "A", "body": "b", "labels": [{"name": "bug"}], "state": "open"},
+            {"number": 2, "title": "PR", "pull_request": {}, "state": "open"},
+        ]
+        seen: List[tuple[Any, ...]] = []
+
+        async def fake_exec(*cmd: Any, **kwargs: Any) -> _FakeProcess:
+            seen.append(cmd)
+            if "-H" in cmd:
+                return _FakeProcess(1, b'HTTP/2.0 304 Not Modified\r\nEtag: "v1"\r\n\r\n')
+            raw = 'HTTP/2.0 200 OK\r\nEtag: "v1"\r\n\r\n' + json.dumps(page)
+            return _FakeProcess(0, raw.encode())
+
+        with patch("asyncio.create_subprocess_exec", fake_exec):
+            with AsyncGitHubClient(config, etag_cache_path=cache_path) as client:
+                ok, first = await client.get_issues_async()
+            with AsyncGitHubClient(config, etag_cache_path=cache_path) as client:
+                ok2, second = await client.get_issues_async()
+
+        assert ok and ok2
+        assert first == second
+        assert [i["number"] for i in first] == [1]
+        assert first[0]["state"] == "OPEN" and first[0]["labels"] == [{"name": "bug"}]
+        assert seen[1][-2:] == ("-H", 'If-None-Match: "v1"')
+        assert json.loads(cache_path.read_text())
+
+    asyncio.run(_run())
+
+
+def test_iter_issues_async_streams_pages_lazily(tmp_path: Any) -> None:
+    async def _run() -> None:
+        config = ConcurrencyConfig(enabled=True, max_workers=2)
+        seen: List[tuple[Any, ...]] = []
+
+        async def fake_exec(*cmd: Any, **kwargs: Any) -> _FakeProcess:
+            seen.append(cmd)
+            link = 'Link: <https://api.github.com/repos/o/r/issues?page=2>; rel="next"\r\n'
+            raw = "HTTP/2.0 200 OK\r\n" + link + "\r\n" + json.dumps([{"number": len(seen)}])
+            return _FakeProcess(0, raw.encode())
+
+        with patch("asyncio.create_subprocess_exec", fake_exec):
+            with AsyncGitHubClient(config, etag_cache_path=tmp_path / "c.json") as client:
+                async for issue in client.iter_issues_async():
+                    assert issue["number"] == 1
+                    break
+
+        # Only the first page was requested before the consumer stopped.
+        assert len(seen) == 1
+
+    asyncio.run(_run())
+
+
+def test_iter_issues_graphql_async_follows_cursor() -> None:
+    async def _run() -> None:
+        config = ConcurrencyConfig(enabled=True, max_workers=2)
+        requests: List[tuple[Any, ...]] = []
+        pages = [
+            {
+                "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+                "nodes": [
+                    {
+                        "number": 1,
+                        "title": "One",
+                        "body": "b",
+                        "state": "OPEN",
+                        "labels": {"nodes": [{"name": "bug"}]},
+                        "milestone": {"number": 3, "title": "M1"},
+                    }
+                ],
+            },
+            {
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+                "nodes": [
+                    {"number": 2, "title": "Two", "body": "", "state": "CLOSED", "labels": None}
+                ],
+            },
+        ]
+
+        async def fake_exec(*cmd: Any, **kwargs: Any) -> _FakeProcess:
+            requests.append(cmd)
+            payload = {"data": {"repository": {"issues": pages[len(requests) - 1]}}}
+            return _FakeProcess(0, json.dumps(payload).encode())
+
+        with patch("asyncio.create_subprocess_exec", fake_exec):
+            async with create_async_github_client(config, mock=False) as client:
+                ok, issues = await client.get_issues_graphql_async()
+
+        assert ok is True
+        assert len(requests) == 2
+        assert "after=c1" not in requests[0] and "after=c1" in requests[1]
+        assert issues[0] == {
+            "number": 1,
+            "title": "One",
+            "body": "b",
+            "labels": [{"name": "bug"}],
+            "milestone": {"number": 3, "title": "M1"},
+            "state": "OPEN",
+        }
+        assert issues[1]["labels"] == [] and issues[1]["milestone"] is None
+
+    asyncio.run(_run())
+
+
+def test_get_issues_async_reports_failure(tmp_path: Any) -> None:
+    async def _run() -> None:
+        config = ConcurrencyConfig(enabled=True, max_workers=2)
+
+        async def fake_exec(*cmd: Any, **kwargs: Any) -> _FakeProcess:
+            return _FakeProcess(1, b"", b"gh: not found")
+
+        with patch("asyncio.create_subprocess_exec", fake_exec):
+            with AsyncGitHubClient(config, etag_cache_path=tmp_path / "c.json") as client:
+                assert await client.get_issues_async() == (False, [])
+
+    asyncio.run(_run())
+
+
+def test_rate_limiter_paces_after_burst() -> None:
+    async def _run() -> None:
+        limiter = RateLimiter(requests_per_second=50.0)
+        limiter.tokens = 1.0
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await limiter.acquire()
+        await limiter.acquire()
+        assert loop.time() - start >= 0.015
+
+    asyncio.run(_run())
+
+
+def test_rate_limiter_adapts_to_headers() -> None:
+    import time
+
+    limiter = RateLimiter(requests_per_second=10.0)
+    reset = str(time.time() + 100)
+    limiter.update_from_headers({"x-ratelimit-remaining": "50", "x-ratelimit-reset": reset})
+    assert 0.4 < limiter.refill_rate < 0.6
+    limiter.update_from_headers({"x-ratelimit-remaining": "100000", "x-ratelimit-reset": reset})
+    assert limiter.refill_rate == 10.0
+    limiter.update_from_headers({"x-ratelimit-remaining": "0", "x-ratelimit-reset": reset})
+    assert limiter.tokens == 0.0
+    limiter.update_from_headers({})
+    assert limiter.tokens == 0.0
+
+
+def test_rate_limiter_header_update_holds_bucket_lock() -> None:
+    import threading
+    import time
+
+    limiter = RateLimiter(requests_per_second=10.0)
+    limiter._lock.acquire()
+    updater = threading.Thread(
+        target=limiter.update_from_headers,
+        args=({"x-ratelimit-remaining": "50", "x-ratelimit-reset": str(time.time() + 100)},),
+    )
+    updater.start()
+    updater.join(0.05)
+    # The update waits for the bucket lock instead of racing token takers.
+    assert updater.is_alive() and limiter.refill_rate == 10.0
+    limiter._lock.release()
+    updater.join()
+    assert limiter.refill_rate < 1.0
+
+
+def test_rate_limiter_disabled() -> None:
+    async def _run() -> None:
+        limiter = RateLimiter(requests_per_second=0)
+        limiter.tokens = 0.0
+        await asyncio.wait_for(limiter.acquire(), timeout=0.1)
+
+    asyncio.run(_run())
+
+
+def test_concurrent_processor_bounds_in_flight_and_keeps_order() -> None:
+    async def _run() -> None:
+        config = ConcurrencyConfig(enabled=True, max_workers=2, batch_size=2)
+        processor = ConcurrentProcessor(config, mock=True)
+        in_flight = 0
+        peak = 0
+
+        async def slow_processor(item: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02 if item == 0 else 0.001)
+            in_flight -= 1
+            return item * 10
+
+        results = await processor.process_specs_concurrent(list(range(6)), slow_processor)
+        assert results == [0, 10, 20, 30, 40, 50]
+        assert peak == 2
+
+    asyncio.run(_run())
+
+
+def test_concurrent_processor_forwards_args_and_kwargs_to_sync_processor() -> None:
+    async def _run() -> None:
+        config = ConcurrencyConfig(enabled=True, max_workers=2)
+        processor = ConcurrentProcessor(config, mock=True)
+
+        def tagged(item: str, prefix: str, *, suffix: str) -> str:
+            return f"{prefix}{item}{suffix}"
+
+        results = await processor.process_specs_concurrent(["a", "b"], tagged, "<", suffix=">")
+        assert results == ["<a>", "<b>"]
+
+    asyncio.run(_run())
+
+
+def test_concurrent_processor_threads_only_io_bound_sync_processors() -> None:
+    import threading
+
+    async def _run() -> None:
+        config = ConcurrencyConfig(enabled=True, max_workers=4)
+        processor = ConcurrentProcessor(config, mock=True)
+        main_thread = threading.get_ident()
+
+        def cpu_only(item: int) -> int:
+            return threading.get_ident()
+
+        @io_bound
+        def waits_on_io(item: int) -> int:
+            return threading.get_ident()
+
+        specs = list(range(8))
+        inline = await processor.process_specs_concurrent(specs, cpu_only)
+        threaded = await processor.process_specs_concurrent(specs, waits_on_io)
+        assert set(inline) == {main_thread}
+        assert main_thread not in threaded
+
+    asyncio.run(_run())
+
+
+def test_adaptive_concurrency_limit_grows_then_backs_off() -> None:
+    async def _run() -> None:
+        limit = AdaptiveConcurrencyLimit(initial=2, ceiling=4)
+
+        async def _complete(n: int, elapsed: float) -> None:
+            for _ in range(n):
+                await limit.acquire()
+                await limit.release(elapsed)
+
+        # Steady latency: the cap grows by one slot per window up to the ceiling.
+        await _complete(8, 0.1)
+        assert limit.limit == 3
+        await _complete(16, 0.1)
+        assert limit.limit == 4
+
+        # Latency jumps well above the baseline: the cap shrinks.
+        await _complete(8, 1.0)
+        assert limit.limit < 4
+        assert limit.short_ewma is not None and limit.short_ewma > 0.5
+
+    asyncio.run(_run())
+
+
+def test_adaptive_concurrency_limit_blocks_at_cap() -> None:
+    async def _run() -> None:
+        limit = AdaptiveConcurrencyLimit(initial=1, ceiling=1)
+        await limit.acquire()
+        waiter = asyncio.create_task(limit.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        await limit.release(0.01)
+        await asyncio.wait_for(waiter, timeout=0.1)
+
+    asyncio.run(_run())
+
+
+class _FakeRestClient:
+    def __init__(self) -> None:
+        self.calls: List[tuple[str, dict[str, Any]]] = []
+
+    def create_issue(self, **kwargs: Any) -> int:
+        self.calls.append(("create", kwargs))
+        return 7
+
+    def update_issue(self, **kwargs: Any) -> None:
+        self.calls.append(("update", kwargs))
+
+    def add_labels(self, **kwargs: Any) -> None:
+        self.calls.append(("labels", kwargs))
+
+    def close_issue(self, **kwargs: Any) -> None:
+        from issuesuite.github_rest import GitHubAPIError
+
+        raise GitHubAPIError("boom", status=500)
+
+    def list_issues(self, **kwargs: Any) -> List[dict[str, Any]]:
+        return [
+            {"number": 1, "title": "A", "labels": [{"name": "bug"}], "state": "open"},
+            {"number": 2, "title": "PR", "pull_request": {}, "state": "open"},
+        ]
+
+
+def test_http_github_client_uses_rest_calls() -> None:
+    async def _run() -> None:
+        config = ConcurrencyConfig(enabled=True, max_workers=2, transport="http")
+        rest = _FakeRestClient()
+        async with HttpGitHubClient(config, "o/r", rest_client=rest) as client:  # type: ignore[arg-type]
+            assert await client.create_issue_async("T", "B", ["bug"]) == (True, "created #7")
+            ok, msg = await client.update_issue_async(7, body="New", labels=["x"])
+            assert ok and msg.splitlines() == ["updated #7", "labelled #7"]
+            ok, msg = await client.close_issue_async(7)
+            assert not ok and msg.startswith("Error: boom")
+            ok, issues = await client.get_issues_async()
+            assert ok and [i["number"] for i in issues] == [1]
+            assert issues[0]["state"] == "OPEN"
+        assert [name for name, _ in rest.calls] == ["create", "update", "labels"]
+        assert rest.calls[1][1] == {"number": 7, "body": "New", "milestone": None}
+
+    asyncio.run(_run())
+
+
+def test_http_github_clients_share_rest_session() -> None:
+    config = ConcurrencyConfig(enabled=True, transport="http")
+    with HttpGitHubClient(config, "o/shared", token="t0") as first:
+        session = first._rest
+    with HttpGitHubClient(config, "o/shared", token="t0") as second:
+        assert second._rest is session
+    with HttpGitHubClient(config, "o/other", token="t0") as third:
+        assert third._rest is not session
+
+
+def test_http_github_client_honours_enterprise_api_url() -> None:
+    config = ConcurrencyConfig(enabled=True, transport="http")
+    with patch.dict("os.environ", {"ISSUESUITE_GITHUB_API": "https://ghe.example/api/v3"}):
+        with HttpGitHubClient(config, "o/enterprise", token="t0") as enterprise:
+            assert enterprise._rest is not None
+            assert enterprise._rest.base_url == "https://ghe.example/api/v3"
+    with HttpGitHubClient(config, "o/enterprise", token="t0") as public:
+        assert public._rest is not enterprise._rest
+
+
+def test_create_async_github_client_selects_transport() -> None:
+    http_config = ConcurrencyConfig(transport="http")
+    assert isinstance(create_async_github_client(http_config, repo="o/r"), HttpGitHubClient)
+    # Without an explicit repo the gh CLI (which infers it) is used.
+    assert isinstance(create_async_github_client(http_config), AsyncGitHubClient)
+    assert isinstance(
+        create_async_github_client(ConcurrencyConfig(), repo="o/r"), AsyncGitHubClient
+    )
@@ -285,6 +285,7 @@ ai: {}
     # Verify default concurrency settings
     assert cfg.concurrency_enabled is False
     assert cfg.concurrency_max_workers == 4
+    assert cfg.concurrency_transport == "gh"
 
 
 def test_optimal_worker_adjustment(monkeypatch, tmp_path):
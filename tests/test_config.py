@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import dataclasses
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+from issuesuite import config
+from issuesuite.config import load_config
+
+MINIMAL_CONFIG = """\
+version: 1
+source:
+  file: ISSUES.md
+github:
+  repo: octo/demo
+concurrency:
+  enabled: true
+  max_workers: 3
+"""
+
+
+def test_safe_loader_prefers_libyaml() -> None:
+    expected = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    assert config._yaml_loader() == (yaml, expected)
+
+
+def test_load_config_reads_sections(tmp_path: Path) -> None:
+    cfg_path = tmp_path / "issue_suite.config.yaml"
+    cfg_path.write_text(MINIMAL_CONFIG)
+
+    cfg = load_config(cfg_path)
+
+    assert cfg.source_file == tmp_path / "ISSUES.md"
+    assert cfg.github_repo == "octo/demo"
+    assert cfg.concurrency_enabled is True
+    assert cfg.concurrency_max_workers == 3
+
+
+def test_load_config_is_cached_until_file_changes(tmp_path: Path) -> None:
+    cfg_path = tmp_path / "issue_suite.config.yaml"
+    cfg_path.write_text(MINIMAL_CONFIG)
+
+    first = load_config(cfg_path)
+    assert load_config(cfg_path) is first
+
+    cfg_path.write_text(MINIMAL_CONFIG.replace("max_workers: 3", "max_workers: 12"))
+    second = load_config(cfg_path)
+    assert second is not first
+    assert second.concurrency_max_workers == 12
+
+
+def test_load_config_cache_tracks_environment(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cfg_path = tmp_path / "issue_suite.config.yaml"
+    cfg_path.write_text("version: 1\ngithub:\n  app:\n    app_id: $GITHUB_APP_ID\n")
+
+    monkeypatch.setenv("GITHUB_APP_ID", "111")
+    assert load_config(cfg_path).github_app_id == "111"
+    monkeypatch.setenv("GITHUB_APP_ID", "222")
+    assert load_config(cfg_path).github_app_id == "222"
+
+
+def test_suite_config_is_immutable(tmp_path: Path) -> None:
+    cfg_path = tmp_path / "issue_suite.config.yaml"
+    cfg_path.write_text(MINIMAL_CONFIG)
+    cfg = load_config(cfg_path)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        cfg.github_repo = "other/repo"  # type: ignore[misc]
+    assert not hasattr(cfg, "__dict__")
+
+
+def test_load_config_decodes_utf8_regardless_of_locale(tmp_path: Path) -> None:
+    cfg_path = tmp_path / "issue_suite.config.yaml"
+    cfg_path.write_bytes("version: 1\ndefaults:\n  inject_labels: [café]\n".encode())
+    assert load_config(cfg_path).inject_labels == ["café"]
+
+
+def test_resolve_env_var(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ISSUESUITE_TEST_VALUE", "resolved")
+    monkeypatch.delenv("ISSUESUITE_TEST_MISSING", raising=False)
+    assert config._resolve_env_var(None, "ISSUESUITE_TEST_VALUE") is None
+    assert config._resolve_env_var(42) == 42
+    assert config._resolve_env_var("plain", "ISSUESUITE_TEST_VALUE") == "plain"
+    assert config._resolve_env_var("$anything", "ISSUESUITE_TEST_VALUE") == "resolved"
+    assert config._resolve_env_var("$ISSUESUITE_TEST_VALUE") == "resolved"
+    assert config._resolve_env_var("$ISSUESUITE_TEST_MISSING") == "$ISSUESUITE_TEST_MISSING"
+
+
+def test_load_config_ignores_non_mapping_sections(tmp_path: Path) -> None:
+    cfg_path = tmp_path / "issue_suite.config.yaml"
+    cfg_path.write_text("version: 1\nsource: null\nconcurrency: [oops]\n")
+    cfg = load_config(cfg_path)
+    assert cfg.source_file == tmp_path / "ISSUES.md"
+    assert cfg.concurrency_enabled is False
+
+
+def test_load_config_maps_large_files(tmp_path: Path) -> None:
+    cfg_path = tmp_path / "issue_suite.config.yaml"
+    padding = "".join(f"# filler line {i:06d}\n" for i in range(4000))
+    cfg_path.write_text(padding + MINIMAL_CONFIG)
+    assert cfg_path.stat().st_size > config._MMAP_THRESHOLD
+
+    cfg = load_config(cfg_path)
+
+    assert cfg.github_repo == "octo/demo"
+    assert cfg.concurrency_max_workers == 3
+
+
+def test_load_config_json_cache_is_opt_in(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cfg_path = tmp_path / "issue_suite.config.yaml"
+    cfg_path.write_text(MINIMAL_CONFIG)
+    cache_root = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_root))
+    cache_dir = cache_root / "issuesuite" / "config"
+    monkeypatch.delenv(config.CONFIG_CACHE_ENV, raising=False)
+    config._load_config_cached.cache_clear()
+    load_config(cfg_path)
+    assert not cache_dir.exists()
+
+    monkeypatch.setenv(config.CONFIG_CACHE_ENV, "1")
+    config._load_config_cached.cache_clear()
+    first = load_config(cfg_path)
+    entries = list(cache_dir.glob("*.json"))
+    assert len(entries) == 1
+    # Nothing is written next to the config in the working tree.
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["cache", "issue_suite.config.yaml"]
+
+    with monkeypatch.context() as m:
+        m.setattr(config, "_safe_load", lambda _stream: pytest.fail("reparsed"))
+        config._load_config_cached.cache_clear()
+        assert load_config(cfg_path) == first
+
+    cfg_path.write_text(MINIMAL_CONFIG.replace("max_workers: 3", "max_workers: 5"))
+    config._load_config_cached.cache_clear()
+    assert load_config(cfg_path).concurrency_max_workers == 5
+    remaining = list(cache_dir.glob("*.json"))
+    assert len(remaining) == 1 and remaining != entries
+
+
+def test_load_config_scalar_defaults(tmp_path: Path) -> None:
+    cfg_path = tmp_path / "issue_suite.config.yaml"
+    cfg_path.write_text("version: 1\nbehavior:\n  truncate_body_diff: '120'\n")
+    cfg = load_config(cfg_path)
+    assert cfg.truncate_body_diff == 120
+    assert cfg.auto_status_label is True
+    assert cfg.milestone_required is False
+    assert cfg.env_auth_enabled is True
+    assert cfg.extensions_enabled is True
+    assert cfg.concurrency_max_workers == 4
+    assert cfg.concurrency_transport == "gh"
+    assert cfg.concurrency_graphql_fetch is False
+    assert cfg.concurrency_auto_thread_fallback is False
+
+
+def test_load_config_interns_string_fields(tmp_path: Path) -> None:
+    first = tmp_path / "a.yaml"
+    second = tmp_path / "b.yaml"
+    first.write_text(MINIMAL_CONFIG)
+    second.write_text(MINIMAL_CONFIG + "logging:\n  level: DEBUG\n")
+    one = load_config(first)
+    two = load_config(second)
+    assert one.github_repo is two.github_repo
+    assert two.logging_level is sys.intern("DEBUG")
+    assert one.ensure_milestones_list is not config.DEFAULT_MILESTONES
+
+
+def test_load_config_precompiles_patterns(tmp_path: Path) -> None:
+    cfg_path = tmp_path / "issue_suite.config.yaml"
+    cfg_path.write_text(
+        MINIMAL_CONFIG.replace(
+            "file: ISSUES.md", "file: ISSUES.md\n  milestone_pattern: '^M[0-9]+:'"
+        )
+    )
+    cfg = load_config(cfg_path)
+    assert cfg.id_pattern_re.pattern == cfg.id_pattern
+    assert cfg.milestone_pattern_re is not None
+    assert cfg.milestone_pattern_re.match("M1: Foundation")
+    assert dataclasses.replace(cfg, id_pattern="^x$").id_pattern_re.match("x")
+
+    cfg_path.write_text("version: 1\nsource:\n  id_pattern: '[unclosed'\n")
+    with pytest.raises(config.ConfigError, match="Invalid pattern"):
+        load_config(cfg_path)
+
+
+@pytest.mark.parametrize(
+    ("section", "message"),
+    [
+        ("concurrency:\n  enabled: 'false'\n", "concurrency.enabled must be bool, got str"),
+        ("concurrency:\n  max_workers: true\n", "concurrency.max_workers must be int, got bool"),
+        ("behavior:\n  truncate_body_diff: [1]\n", "behavior.truncate_body_diff must be int"),
+        ("concurrency:\n  transport: grpc\n", "concurrency.transport must be one of gh, http"),
+    ],
+)
+def test_load_config_rejects_mistyped_scalars(tmp_path: Path, section: str, message: str) -> None:
+    cfg_path = tmp_path / "issue_suite.config.yaml"
+    cfg_path.write_text("version: 1\n" + section)
+    with pytest.raises(config.ConfigError, match=message):
+        load_config(cfg_path)
+
+
+def test_load_config_null_scalars_keep_baseline_meaning(tmp_path: Path) -> None:
+    cfg_path = tmp_path / "issue_suite.config.yaml"
+    cfg_path.write_text(
+        "version: 1\nenvironment:\n  enabled:\nbehavior:\n  truncate_body_diff:\n"
+        "concurrency:\n  enabled: 1\n  graphql_fetch: 0\n"
+    )
+    cfg = load_config(cfg_path)
+    # A null flag is False, as bool(None) was; other nulls take the default.
+    assert cfg.env_auth_enabled is False
+    assert cfg.truncate_body_diff == 80
+    assert cfg.concurrency_enabled is True
+    assert cfg.concurrency_graphql_fetch is False
@@ -1,6 +1,7 @@
 from typing import Any
 
 from issuesuite.core import (
+    _build_existing_index,
     _build_plan,
     _ensure_marker,
     _plan_changes,
@@ -31,13 +32,23 @@ def test_ensure_marker_idempotent() -> None:
     assert _ensure_marker(with_marker, "frontier-apex") == with_marker
 
 
+def test_ensure_marker_prepends_when_marker_not_leading() -> None:
+    foreign = "<!-- issuesuite:slug=other -->\n\nBody"
+    trailing = "Body <!-- issuesuite:slug=frontier-apex -->"
+
+    for body in (foreign, trailing, ""):
+        result = _ensure_marker(body, "frontier-apex")
+        assert result.startswith("<!-- issuesuite:slug=frontier-apex -->\n\n")
+        assert result.endswith(body)
+
+
 def test_plan_entry_create_when_missing() -> None:
     spec = _make_issue_spec()
 
     entry = _plan_entry_for_spec(spec, [], {}, update=True, respect_status=True)
 
-    assert entry["action"] == "create"
-    assert entry["number"] is None
+    assert entry.action == "create"
+    assert entry.number is None
 
 
 def test_plan_entry_close_when_status_closed() -> None:
@@ -46,8 +57,8 @@ def test_plan_entry_close_when_status_closed() -> None:
 
     entry = _plan_entry_for_spec(spec, existing, {}, update=True, respect_status=True)
 
-    assert entry["action"] == "close"
-    assert entry["number"] == 7
+    assert entry.action == "close"
+    assert entry.number == 7
 
 
 def test_plan_entry_update_when_labels_change() -> None:
@@ -63,9 +74,9 @@ def test_plan_entry_update_when_labels_change() -> None:
 
     entry = _plan_entry_for_spec(spec, existing, {}, update=True, respect_status=True)
 
-    assert entry["action"] == "update"
-    assert entry["changes"]["labels_added"] == 1
-    assert entry["changes"]["body_changed"] == 1
+    assert entry.action == "update"
+    assert entry.changes["labels_added"] == 1
+    assert entry.changes["body_changed"] == 1
 
 
 def test_plan_entry_skip_when_hash_matches() -> None:
@@ -87,8 +98,8 @@ def test_plan_entry_skip_when_hash_matches() -> None:
         respect_status=True,
     )
 
-    assert entry["action"] == "skip"
-    assert entry["number"] == 9
+    assert entry.action == "skip"
+    assert entry.number == 9
 
 
 def test_plan_match_issue_fuzzy_slug() -> None:
@@ -106,6 +117,38 @@ def test_plan_match_issue_fuzzy_slug() -> None:
     assert match["number"] == 11
 
 
+def test_plan_match_issue_prefers_slug_marker() -> None:
+    spec = _make_issue_spec()
+    existing = [
+        {"title": "Frontier Apex launch", "number": 1, "body": ""},
+        {"title": "Renamed", "number": 2, "body": "<!-- issuesuite:slug=frontier-apex -->\nBody"},
+    ]
+
+    match = _plan_match_issue(spec, existing)
+
+    assert match is not None
+    assert match["number"] == 2
+
+
+def test_build_existing_index_keeps_first_issue_per_key(caplog: Any) -> None:
+    existing = [
+        {"title": "Same  Title", "number": 1, "body": "<!-- issuesuite:slug=a -->"},
+        {"title": "same title", "number": 2, "body": "<!-- issuesuite:slug=a -->"},
+        {"title": None, "number": 3, "body": None},
+        {"title": "Other  Title", "number": 4, "body": ""},
+    ]
+
+    index = _build_existing_index(existing)
+
+    assert index.by_marker["a"]["number"] == 1
+    assert index.by_title["same title"]["number"] == 2
+    # Issues 1 and 2 share a normalised title; the first keeps the match.
+    assert index.by_norm_title["same title"]["number"] == 1
+    assert "share normalised title" in caplog.text
+    assert index.by_norm_title["other title"]["number"] == 4
+    assert _build_existing_index(index) is index
+
+
 def test_build_plan_aggregates_entries() -> None:
     spec_open = _make_issue_spec()
     spec_closed = _make_issue_spec(external_id="frontier-done", title="Frontier done", status="closed")
@@ -115,7 +158,7 @@ def test_build_plan_aggregates_entries() -> None:
 
     plan = _build_plan([spec_open, spec_closed], existing, {}, update=True, respect_status=True)
 
-    actions = {entry["external_id"]: entry["action"] for entry in plan}
+    actions = {entry.external_id: entry.action for entry in plan}
     assert actions["frontier-apex"] == "create"
     assert actions["frontier-done"] == "close"
 
@@ -134,3 +177,20 @@ def test_plan_changes_counts_differences() -> None:
     assert changes["labels_removed"] == 0
     assert changes["body_changed"] == 1
     assert changes["milestone_changed"] == 1
+
+
+def test_plan_entry_as_dict_round_trips_fields() -> None:
+    spec = _make_issue_spec(milestone="Launch")
+
+    entry = _plan_entry_for_spec(spec, [], {}, update=True, respect_status=True)
+
+    assert entry.as_dict() == {
+        "external_id": "frontier-apex",
+        "title": "Frontier Apex launch",
+        "action": "create",
+        "number": None,
+        "labels": ["governance"],
+        "milestone": "Launch",
+        "reason": "no existing match",
+        "changes": None,
+    }
@@ -1,4 +1,5 @@
 import json
+import subprocess
 from dataclasses import dataclass
 from typing import Any
 
@@ -168,3 +169,101 @@ def test_issues_client_rest_client_uses_first_available_token(monkeypatch):
     assert rest.token == "primary"
     assert rest.base_url == DEFAULT_API_URL
     assert rest.graphql_url == DEFAULT_GRAPHQL_URL
+
+
+def test_issues_client_close_issues_batches_over_graphql(monkeypatch):
+    monkeypatch.setenv("ISSUESUITE_REST_DISABLED", "1")
+    client = IssuesClient(IssuesClientConfig(repo="acme/widgets"), rest_client=None)
+    queries: list[tuple[list[str], str]] = []
+    responses = [
+        {"data": {"repository": {"i0": {"id": "I_1"}, "i1": None, "i2": {"id": "I_3"}}}},
+        {"data": {}, "errors": [{"path": ["c2"], "message": "locked"}]},
+    ]
+
+    def fake_check_output(cmd: list[str], **kwargs: Any) -> str:
+        queries.append((cmd, kwargs["input"]))
+        return json.dumps(responses[len(queries) - 1])
+
+    monkeypatch.setattr("issuesuite.github_issues.subprocess.check_output", fake_check_output)
+    monkeypatch.setattr(client, "_run", lambda cmd: pytest.fail("per-issue gh call used"))
+
+    failures = client.close_issues([1, 2, 3])
+
+    assert failures == {2: "issue #2 not found", 3: "locked"}
+    assert len(queries) == 2
+    lookup_cmd, _lookup = queries[0]
+    assert "owner=acme" in lookup_cmd and "name=widgets" in lookup_cmd
+    mutation = queries[1][1]
+    assert mutation.count("closeIssue") == 2
+    assert '"I_1"' in mutation and '"I_3"' in mutation
+
+
+def test_issues_client_close_issues_maps_errors_from_failed_gh_exit(monkeypatch):
+    monkeypatch.setenv("ISSUESUITE_REST_DISABLED", "1")
+    client = IssuesClient(IssuesClientConfig(repo="acme/widgets"), rest_client=None)
+    lookup = {
+        "data": {"repository": {"i0": {"id": "I_1"}, "i1": None, "i2": {"id": "I_3"}}},
+        "errors": [{"path": ["repository", "i1"], "message": "Could not resolve issue 2"}],
+    }
+    responses = [
+        lookup,
+        {"data": {"c0": {}}, "errors": [{"path": ["c2"], "message": "locked"}]},
+        lookup,
+        {"errors": [{"message": "Something went wrong"}]},
+    ]
+    calls = 0
+
+    def fake_check_output(cmd: list[str], **kwargs: Any) -> str:
+        nonlocal calls
+        body = json.dumps(responses[calls])
+        calls += 1
+        raise subprocess.CalledProcessError(1, cmd, output=body + "\ngh: GraphQL error\n")
+
+    monkeypatch.setattr("issuesuite.github_issues.subprocess.check_output", fake_check_output)
+
+    assert client.close_issues([1, 2, 3]) == {2: "Could not resolve issue 2", 3: "locked"}
+    # A top-level error with no alias path fails every issue in the chunk.
+    assert client.close_issues([1, 2, 3]) == {
+        1: "Something went wrong",
+        2: "Could not resolve issue 2",
+        3: "Something went wrong",
+    }
+
+
+def test_issues_client_close_issues_keeps_going_after_unexpected_error(monkeypatch):
+    client = IssuesClient(
+        IssuesClientConfig(repo="acme/widgets"), rest_client=_RecordingRestClient()
+    )
+    closed: list[int] = []
+
+    def flaky_close(*, number: int) -> None:
+        if number == 1:
+            raise ValueError("bad payload")
+        closed.append(number)
+
+    monkeypatch.setattr(client, "close_issue", flaky_close)
+
+    assert client.close_issues([1, 2]) == {1: "bad payload"}
+    assert closed == [2]
+
+
+def test_issues_client_paces_writes_across_calls(monkeypatch):
+    clock = [100.0]
+    sleeps: list[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr("issuesuite.concurrency.time.monotonic", lambda: clock[0])
+    monkeypatch.setattr("issuesuite.concurrency.time.sleep", fake_sleep)
+    rest = _RecordingRestClient()
+    cfg = IssuesClientConfig(repo="acme/widgets", requests_per_second=2.0)
+    client = IssuesClient(cfg, rest_client=rest)
+
+    for number in range(4):
+        client.close_issue(number=number)
+
+    # Two calls fit the initial burst; each further call waits half a second.
+    assert sleeps == pytest.approx([0.5, 0.5])
+    assert len(rest.calls) == 4
@@ -1,19 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import shutil
 import subprocess
 import textwrap
+import threading
+import time
 from contextlib import nullcontext
 from pathlib import Path
 from typing import Any
 
 import pytest
 
+from issuesuite.concurrency import AsyncGitHubClient, IssueUpdate
 from issuesuite.core import IssueSuite
 from issuesuite.models import IssueSpec
 
 
 class _StubLogger:
+    def is_enabled_for(self, _level: int) -> bool:
+        return True
+
     def debug(self, *_args: Any, **_kwargs: Any) -> None:
         pass
 
@@ -26,6 +34,9 @@ class _StubLogger:
     def log_error(self, *_args: Any, **_kwargs: Any) -> None:
         pass
 
+    def log_issue_action(self, *_args: Any, **_kwargs: Any) -> None:
+        pass
+
     def timed_operation(self, *_args: Any, **_kwargs: Any):  # noqa: ANN201 - context manager
         return nullcontext()
 
@@ -201,6 +212,13 @@ def test_issue_suite_build_summary(tmp_path: Path) -> None:
     }
     assert summary["mapping"]["frontier-apex"] == 5
 
+    with pytest.raises(ValueError):
+        suite._sync_build_summary([spec1, spec2], processed[:1])
+
+    # Failed specs are left out of the sync totals rather than counted as skipped.
+    failed = [processed[0], {"spec": spec2, "result": {"error": "boom", "spec": spec2}}]
+    assert suite._sync_build_summary([spec1, spec2], failed)["totals"]["skipped"] == 0
+
 
 def test_sync_parse_and_preflight_enforces_milestones(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
@@ -427,6 +445,145 @@ def test_process_spec_skip_branch(monkeypatch: pytest.MonkeyPatch, tmp_path: Pat
     assert result["skipped"] is True
 
 
+def test_concurrent_sync_skips_dispatch_for_unchanged_specs(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    config_path = _write_basic_config(tmp_path)
+    config_path.write_text(config_path.read_text() + "concurrency:\n  enabled: true\n")
+    suite = IssueSuite.from_config_path(config_path)
+    specs = [
+        IssueSpec(external_id=f"s{i}", title=f"S {i}", labels=[], milestone=None, body="")
+        for i in range(12)
+    ]
+    for i, spec in enumerate(specs):
+        spec.hash = f"h{i}"
+    specs[1].status = "closed"
+    existing = [{"number": 100 + i, "title": f"S {i}", "state": "OPEN"} for i in range(11)]
+    prev_hashes = {spec.external_id: spec.hash or "" for spec in specs}
+    prev_hashes["s2"] = "stale"
+    dispatched: list[str] = []
+
+    def fake_process(spec: IssueSpec, **_: Any) -> dict[str, Any]:
+        dispatched.append(spec.external_id)
+        return {"processed": spec.external_id}
+
+    monkeypatch.setattr(suite, "_process_spec", fake_process)
+
+    processed = suite._sync_process_specs(
+        specs, existing, prev_hashes, False, True, True, project_assigner=_StubAssigner()
+    )
+    suite.close()
+
+    # s1 needs a status close, s2 changed and s11 has no issue yet.
+    assert sorted(dispatched) == ["s1", "s11", "s2"]
+    assert [entry["spec"] for entry in processed] == specs
+    assert processed[0]["result"] == {"mapped": 100, "skipped": True}
+    assert processed[2]["result"] == {"processed": "s2"}
+
+
+def test_concurrent_sync_batches_issue_edits(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    config_path = _write_basic_config(tmp_path)
+    config_path.write_text(config_path.read_text() + "concurrency:\n  enabled: true\n")
+    suite = IssueSuite.from_config_path(config_path)
+    specs = [
+        IssueSpec(external_id=f"s{i}", title=f"S {i}", labels=[], milestone=None, body="new")
+        for i in range(12)
+    ]
+    existing = [
+        {"number": 100 + i, "title": f"S {i}", "state": "OPEN", "body": "old"} for i in range(11)
+    ]
+    batches: list[list[int]] = []
+
+    async def fake_batch(
+        self: Any, updates: list[IssueUpdate], repo: str | None = None
+    ) -> list[tuple[bool, str]]:
+        batches.append([u.number for u in updates])
+        return [(u.number != 101, "Error: nope" if u.number == 101 else "") for u in updates]
+
+    dispatched: list[str] = []
+
+    def fake_process(spec: IssueSpec, **_: Any) -> dict[str, Any]:
+        dispatched.append(spec.external_id)
+        return {"created": True}
+
+    monkeypatch.setattr(AsyncGitHubClient, "batch_update_issues_async", fake_batch)
+    monkeypatch.setattr(suite, "_process_spec", fake_process)
+
+    processed = suite._sync_process_specs(
+        specs, existing, {}, False, True, True, project_assigner=_StubAssigner()
+    )
+    suite.close()
+
+    # One GraphQL batch per processor batch; only the unmatched spec is dispatched.
+    assert batches == [list(range(100, 110)), [110]]
+    assert dispatched == ["s11"]
+    assert processed[0]["result"]["updated"]["number"] == 100
+    assert processed[1]["result"] == {"error": "Error: nope", "spec": specs[1]}
+    assert processed[11]["result"] == {"created": True}
+
+
+def test_sequential_sync_creates_in_spec_order_by_default(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    suite = IssueSuite.from_config_path(_write_basic_config(tmp_path))
+    suite._mock = False
+    specs = [
+        IssueSpec(external_id=f"s{i}", title=f"S {i}", labels=[], milestone=None, body="")
+        for i in range(12)
+    ]
+    created: list[str] = []
+
+    def fake_create(spec: IssueSpec, dry_run: bool) -> int:
+        time.sleep(0.001 * (12 - len(created)))
+        created.append(spec.external_id)
+        return 200 + len(created)
+
+    monkeypatch.setattr(suite, "_create", fake_create)
+
+    processed = suite._sync_process_specs(
+        specs, [], {}, False, True, True, project_assigner=_StubAssigner()
+    )
+    suite.close()
+
+    assert created == [spec.external_id for spec in specs]
+    assert [entry["result"]["mapped"] for entry in processed] == list(range(201, 213))
+
+
+def test_sequential_sync_threads_large_live_runs_when_enabled(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    config_path = _write_basic_config(tmp_path)
+    config_path.write_text(config_path.read_text() + "concurrency:\n  auto_thread_fallback: true\n")
+    suite = IssueSuite.from_config_path(config_path)
+    suite._mock = False
+    specs = [
+        IssueSpec(external_id=f"s{i}", title=f"S {i}", labels=[], milestone=None, body="")
+        for i in range(12)
+    ]
+    threads: set[str] = set()
+
+    def fake_process(spec: IssueSpec, **_: Any) -> dict[str, Any]:
+        threads.add(threading.current_thread().name)
+        return {"processed": spec.external_id}
+
+    monkeypatch.setattr(suite, "_process_spec", fake_process)
+
+    processed = suite._sync_process_specs(
+        specs, [], {}, False, True, True, project_assigner=_StubAssigner()
+    )
+    live_threads = set(threads)
+    threads.clear()
+    suite._sync_process_specs(specs, [], {}, True, True, True, project_assigner=_StubAssigner())
+    suite.close()
+
+    assert [entry["result"]["processed"] for entry in processed] == [s.external_id for s in specs]
+    assert all(name.startswith("issuesuite-spec") for name in live_threads)
+    # Dry runs make no `gh` calls, so they stay on the calling thread.
+    assert threads == {threading.current_thread().name}
+
+
 def test_prune_unmatched_closes_missing(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     suite = IssueSuite.from_config_path(_write_basic_config(tmp_path))
     closed: list[int] = []
@@ -439,10 +596,88 @@ def test_prune_unmatched_closes_missing(monkeypatch: pytest.MonkeyPatch, tmp_pat
     assert closed == [6]
 
 
+def test_prune_unmatched_closes_many_in_one_client_call(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    suite = IssueSuite.from_config_path(_write_basic_config(tmp_path))
+    batches: list[list[int]] = []
+
+    class _Client:
+        def close_issues(self, numbers: list[int]) -> dict[int, str]:
+            batches.append(list(numbers))
+            return {}
+
+    monkeypatch.setattr(suite, "_build_issues_client", lambda dry_run: _Client())
+    existing = [{"number": n} for n in (4, 5, 6, 7)]
+
+    suite._prune_unmatched(existing, [{"result": {"mapped": 5}}], dry_run=False)
+
+    assert batches == [[4, 6, 7]]
+
+
+def test_prune_unmatched_closes_concurrently_over_http(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    config_path = _write_basic_config(tmp_path)
+    config_path.write_text(
+        config_path.read_text()
+        + "github:\n  repo: octo/demo\nconcurrency:\n  enabled: true\n  transport: http\n"
+    )
+    suite = IssueSuite.from_config_path(config_path)
+    suite._mock = False
+    client = _FakeAsyncClient()
+    monkeypatch.setattr("issuesuite.core.create_async_github_client", lambda *a, **k: client)
+    monkeypatch.setattr(suite, "_close", lambda *a: pytest.fail("sync close used"))
+    errors: list[Any] = []
+    monkeypatch.setattr(
+        suite._logger, "log_error", lambda *a, **k: errors.append(k.get("issue_number"))
+    )
+    existing = [{"number": n, "title": f"Old {n}"} for n in (5, 6, 7, 8)]
+
+    suite._prune_unmatched(existing, [{"result": {"mapped": 5}}], dry_run=False)
+    suite.close()
+
+    assert sorted(number for _, number in client.calls) == [6, 7, 8]
+    # The fake client reports every close as failed; each one is logged, none aborts.
+    assert sorted(errors) == [6, 7, 8]
+
+
+class _RecordingAssigner:
+    def __init__(self) -> None:
+        self.numbers: list[int] = []
+
+    def assign(self, issue_number: int, spec: Any) -> None:
+        self.numbers.append(issue_number)
+
+
+def test_process_spec_skips_project_assign_when_disabled(tmp_path: Path) -> None:
+    suite = IssueSuite.from_config_path(_write_basic_config(tmp_path))
+    spec = IssueSpec(
+        external_id="frontier-apex", title="Frontier Apex", labels=[], milestone=None, body=""
+    )
+    existing = [{"number": 9, "title": "Frontier Apex", "state": "OPEN", "body": ""}]
+    assigner = _RecordingAssigner()
+
+    for enabled in (False, True):
+        suite.cfg = dataclasses.replace(suite.cfg, project_enable=enabled)
+        result = suite._process_spec(
+            spec,
+            existing=existing,
+            prev_hashes={},
+            dry_run=True,
+            update=False,
+            respect_status=False,
+            project_assigner=assigner,
+        )
+        assert result["mapped"] == 9
+
+    assert assigner.numbers == [9]
+
+
 def test_maybe_assign_project_on_create_mock_mode(tmp_path: Path) -> None:
     suite = IssueSuite.from_config_path(_write_basic_config(tmp_path))
     suite._mock = True
-    suite.cfg.project_enable = True
+    suite.cfg = dataclasses.replace(suite.cfg, project_enable=True)
     spec = IssueSpec(
         external_id="123",
         title="Numeric",
@@ -456,6 +691,12 @@ def test_maybe_assign_project_on_create_mock_mode(tmp_path: Path) -> None:
 
     assert result["mapped"] == 123
 
+    for slug in ("alpha", "0", "\u00b2"):
+        untouched: dict[str, Any] = {}
+        spec.external_id = slug
+        suite._maybe_assign_project_on_create(spec, _StubAssigner(), untouched, dry_run=False)
+        assert untouched == {}
+
 
 def test_match_prefers_marker(tmp_path: Path) -> None:
     suite = IssueSuite.from_config_path(_write_basic_config(tmp_path))
@@ -476,6 +717,39 @@ def test_load_and_save_hash_state(tmp_path: Path) -> None:
     loaded = suite._load_hash_state()
 
     assert loaded == {"frontier-apex": "abc123"}
+    assert [p.name for p in tmp_path.glob(".issuesuite_hashes.json*")] == [
+        ".issuesuite_hashes.json"
+    ]
+
+
+def test_hash_state_path_follows_swapped_cfg(tmp_path: Path) -> None:
+    suite = IssueSuite.from_config_path(_write_basic_config(tmp_path))
+    suite.cfg = dataclasses.replace(suite.cfg, hash_state_file="other_hashes.json")
+    spec = _make_spec()
+    spec.hash = "abc123"
+
+    suite._save_hash_state([spec])
+
+    assert (tmp_path / "other_hashes.json").exists()
+    assert suite._load_hash_state() == {"frontier-apex": "abc123"}
+
+
+def test_aggregate_results_skips_save_when_hashes_unchanged(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    suite = IssueSuite.from_config_path(_write_basic_config(tmp_path))
+    saves: list[int] = []
+    monkeypatch.setattr(suite, "_save_hash_state", lambda specs: saves.append(len(specs)))
+    spec = _make_spec()
+    spec.hash = "abc123"
+    results = [{"skipped": True}]
+
+    suite._aggregate_results([spec], results, False, prev_hashes={"frontier-apex": "abc123"})
+    assert saves == []
+
+    suite._aggregate_results([spec], results, False, prev_hashes={"frontier-apex": "old"})
+    suite._aggregate_results([spec], results, False, prev_hashes={})
+    assert saves == [1, 1]
 
 
 def test_existing_issues_uses_client(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
@@ -508,6 +782,165 @@ def test_gh_auth_success(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Non
     assert suite._gh_auth() is True
 
 
+def test_missing_gh_is_resolved_and_reported_once(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    suite = IssueSuite.from_config_path(_write_basic_config(tmp_path))
+    suite._mock = False
+    lookups: list[str] = []
+    errors: list[str] = []
+    monkeypatch.setattr(shutil, "which", lambda cmd: lookups.append(cmd))
+    monkeypatch.setattr(suite._logger, "log_error", lambda message, **_: errors.append(message))
+    suite.cfg = dataclasses.replace(suite.cfg, ensure_milestones_list=["M1"])
+
+    for _ in range(2):
+        suite._ensure_labels([])
+        suite._ensure_milestones()
+
+    assert lookups == ["gh"]
+    assert errors == ["GitHub CLI unavailable for label ensure step"]
+
+
+def test_gh_auth_result_is_cached(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    suite = IssueSuite.from_config_path(_write_basic_config(tmp_path))
+    suite._mock = False
+    probes: list[list[str]] = []
+    monkeypatch.setattr(shutil, "which", lambda cmd: "/usr/bin/gh")
+    monkeypatch.setattr(
+        subprocess, "check_output", lambda args, stderr: probes.append(args) or b"ok"
+    )
+
+    assert suite._gh_auth() is True
+    assert suite._gh_auth() is True
+    assert len(probes) == 1
+
+    suite._gh_auth_cache = (time.monotonic() - 61.0, True)
+    assert suite._gh_auth() is True
+    assert len(probes) == 2
+
+
+def test_preflight_fetch_skips_gh_when_nothing_to_ensure(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    suite = IssueSuite.from_config_path(_write_basic_config(tmp_path))
+    monkeypatch.setattr(suite, "_gh_auth", lambda: pytest.fail("gh auth probed"))
+    monkeypatch.setattr(suite, "_existing_issues", lambda: pytest.fail("issues listed"))
+
+    assert suite._sync_fetch_existing(preflight=True) == []
+
+
+def test_ensure_labels_reuses_listed_labels(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    suite = IssueSuite.from_config_path(_write_basic_config(tmp_path))
+    suite._mock = False
+    monkeypatch.setattr(shutil, "which", lambda cmd: "/usr/bin/gh")
+    listed: list[list[str]] = []
+    created: list[str] = []
+    monkeypatch.setattr(
+        subprocess, "check_output", lambda args, text: listed.append(args) or "bug\n"
+    )
+    monkeypatch.setattr(subprocess, "check_call", lambda args, **_: created.append(args[3]))
+    specs = [IssueSpec(external_id="a", title="A", labels=["bug", "ops"], milestone=None, body="")]
+
+    suite._ensure_labels(specs)
+    suite._ensure_labels(specs)
+
+    assert len(listed) == 1
+    assert created == ["ops"]
+
+
+def test_preflight_skips_ensure_when_caches_cover_specs(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    suite = IssueSuite.from_config_path(_write_basic_config(tmp_path))
+    suite.cfg = dataclasses.replace(
+        suite.cfg,
+        ensure_labels_enabled=True,
+        ensure_milestones_enabled=True,
+        ensure_milestones_list=["M1"],
+    )
+    ensured: list[str] = []
+    monkeypatch.setattr(suite, "_ensure_labels", lambda specs: ensured.append("labels"))
+    monkeypatch.setattr(suite, "_ensure_milestones", lambda: ensured.append("milestones"))
+    specs = [IssueSpec(external_id="a", title="A", labels=["bug"], milestone=None, body="")]
+    suite._label_cache = (time.monotonic(), {"bug", "ops"})
+    suite._milestone_cache = (time.monotonic(), {"M1"})
+
+    suite._preflight(specs)
+    assert ensured == []
+
+    specs[0].labels.append("new")
+    suite._milestone_cache = (time.monotonic() - 61.0, {"M1"})
+    suite._preflight(specs)
+    assert ensured == ["labels", "milestones"]
+
+
+def test_ensure_labels_relists_once_when_cache_misses(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    suite = IssueSuite.from_config_path(_write_basic_config(tmp_path))
+    suite._mock = False
+    monkeypatch.setattr(shutil, "which", lambda cmd: "/usr/bin/gh")
+    listings = iter(["bug\n", "bug\nops\n"])
+    listed: list[list[str]] = []
+    created: list[str] = []
+
+    def fake_list(args: list[str], text: bool) -> str:
+        listed.append(args)
+        return next(listings)
+
+    monkeypatch.setattr(subprocess, "check_output", fake_list)
+    monkeypatch.setattr(subprocess, "check_call", lambda args, **_: created.append(args[3]))
+    bug = [IssueSpec(external_id="a", title="A", labels=["bug"], milestone=None, body="")]
+    ops = [IssueSpec(external_id="b", title="B", labels=["ops"], milestone=None, body="")]
+
+    suite._ensure_labels(bug)
+    # "ops" was created elsewhere after the cached listing: re-list, do not create.
+    suite._ensure_labels(ops)
+
+    assert len(listed) == 2
+    assert created == []
+
+
+def test_ensure_labels_fans_out_creates(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    suite = IssueSuite.from_config_path(_write_basic_config(tmp_path))
+    suite._mock = False
+    monkeypatch.setattr(shutil, "which", lambda cmd: "/usr/bin/gh")
+    monkeypatch.setattr(subprocess, "check_output", lambda args, text: "")
+    monkeypatch.setattr(subprocess, "check_call", lambda *a, **k: pytest.fail("serial create"))
+    in_flight = peak = 0
+    spawned: list[str] = []
+
+    class _Proc:
+        def __init__(self, label: str) -> None:
+            self.label = label
+
+        async def wait(self) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return 1 if self.label == "bad" else 0
+
+    async def fake_exec(*cmd: str, **_: Any) -> _Proc:
+        spawned.append(cmd[3])
+        return _Proc(cmd[3])
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+    labels = [f"l{i}" for i in range(7)] + ["bad"]
+    specs = [IssueSpec(external_id="a", title="A", labels=labels, milestone=None, body="")]
+
+    suite._ensure_labels(specs)
+    suite.close()
+
+    assert sorted(spawned) == sorted(labels)
+    assert 1 < peak <= 5
+    assert suite._label_cache is not None
+    assert suite._label_cache[1] == set(labels) - {"bad"}
+
+
 def test_aggregate_results_compiles_summary(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     suite = IssueSuite.from_config_path(_write_basic_config(tmp_path))
     specs = [_make_spec(), _make_spec(), _make_spec(), _make_spec()]
@@ -532,11 +965,14 @@ def test_aggregate_results_compiles_summary(tmp_path: Path, monkeypatch: pytest.
     }
     assert summary["mapping"]["frontier-apex"] == 5
 
+    with pytest.raises(ValueError):
+        suite._aggregate_results(specs, results[:3], dry_run=True)
+
 
 @pytest.mark.asyncio
 async def test_process_specs_async_sequential(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     suite = IssueSuite.from_config_path(_write_basic_config(tmp_path))
-    suite.cfg.concurrency_enabled = False
+    suite.cfg = dataclasses.replace(suite.cfg, concurrency_enabled=False)
     spec = _make_spec()
     monkeypatch.setattr(
         suite,
@@ -554,8 +990,7 @@ async def test_process_specs_async_sequential(monkeypatch: pytest.MonkeyPatch, t
 @pytest.mark.asyncio
 async def test_process_specs_async_concurrent(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     suite = IssueSuite.from_config_path(_write_basic_config(tmp_path))
-    suite.cfg.concurrency_enabled = True
-    suite.cfg.concurrency_max_workers = 2
+    suite.cfg = dataclasses.replace(suite.cfg, concurrency_enabled=True, concurrency_max_workers=2)
     specs = [_make_spec(), _make_spec()]
 
     class _StubProcessor:
@@ -578,7 +1013,7 @@ async def test_fetch_existing_async_with_concurrency(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     suite = IssueSuite.from_config_path(_write_basic_config(tmp_path))
-    suite.cfg.concurrency_enabled = True
+    suite.cfg = dataclasses.replace(suite.cfg, concurrency_enabled=True)
     monkeypatch.setattr(suite, "_gh_auth", lambda: True)
 
     async def _fake_existing() -> list[dict[str, Any]]:
@@ -620,7 +1055,7 @@ async def test_sync_async_flow(monkeypatch: pytest.MonkeyPatch, tmp_path: Path)
     monkeypatch.setattr(
         suite,
         "_aggregate_results",
-        lambda specs, results, dry_run: {
+        lambda specs, results, dry_run, prev_hashes=None: {
             "totals": {"specs": 1, "created": 1, "updated": 0, "closed": 0, "skipped": 0}
         },
     )
@@ -630,3 +1065,127 @@ async def test_sync_async_flow(monkeypatch: pytest.MonkeyPatch, tmp_path: Path)
     assert summary["totals"]["created"] == 1
     assert adjusted == [1]
     assert preflight_calls == [1]
+
+
+def test_build_issues_client_reuses_client_per_mode(tmp_path: Path) -> None:
+    suite = IssueSuite.from_config_path(_write_basic_config(tmp_path))
+
+    dry = suite._build_issues_client(dry_run=True)
+    live = suite._build_issues_client(dry_run=False)
+
+    assert suite._build_issues_client(dry_run=True) is dry
+    assert live is not dry
+    assert live.cfg.dry_run is False
+    suite.cfg = dataclasses.replace(suite.cfg, github_repo="octo/other")
+    assert suite._build_issues_client(dry_run=True).cfg.repo == "octo/other"
+
+
+def test_run_async_reuses_event_loop_until_closed(tmp_path: Path) -> None:
+    suite = IssueSuite.from_config_path(_write_basic_config(tmp_path))
+
+    async def _current_loop() -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    first = suite._run_async(_current_loop())
+    assert suite._run_async(_current_loop()) is first
+    suite.close()
+    assert first.is_closed()
+    assert suite._run_async(_current_loop()) is not first
+    suite.close()
+
+
+class _FakeAsyncClient:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, Any]] = []
+
+    async def __aenter__(self) -> _FakeAsyncClient:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    async def create_issue_async(
+        self, title: str, body: str, labels: Any = None, milestone: Any = None
+    ) -> tuple[bool, str]:
+        self.calls.append(("create", title))
+        return True, f"created #{500 + len(self.calls)}"
+
+    async def update_issue_async(self, number: int, **_: Any) -> tuple[bool, str]:
+        self.calls.append(("update", number))
+        return True, f"updated #{number}"
+
+    async def close_issue_async(self, number: int) -> tuple[bool, str]:
+        self.calls.append(("close", number))
+        return False, "Error: boom"
+
+
+def test_sync_process_specs_uses_http_client_coroutines(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    config_path = _write_basic_config(tmp_path)
+    config_path.write_text(
+        config_path.read_text()
+        + "github:\n  repo: octo/demo\nconcurrency:\n  enabled: true\n  transport: http\n"
+    )
+    suite = IssueSuite.from_config_path(config_path)
+    suite._mock = False
+    client = _FakeAsyncClient()
+    monkeypatch.setattr("issuesuite.core.create_async_github_client", lambda *a, **k: client)
+    monkeypatch.setattr(suite, "_create", lambda *a: pytest.fail("sync create used"))
+    specs = [
+        IssueSpec(external_id=f"spec-{i}", title=f"Spec {i}", labels=[], milestone=None, body="")
+        for i in range(12)
+    ]
+    specs[0].status = "closed"
+    existing = [
+        {"number": 7, "title": "Spec 0", "state": "OPEN", "body": ""},
+        {"number": 8, "title": "Spec 1", "state": "OPEN", "body": "old", "labels": []},
+    ]
+
+    processed = suite._sync_process_specs(
+        specs, existing, {}, False, True, True, project_assigner=_StubAssigner()
+    )
+    suite.close()
+
+    results = {entry["spec"].external_id: entry["result"] for entry in processed}
+    assert "boom" in results["spec-0"]["error"]
+    assert results["spec-1"]["updated"]["number"] == 8
+    assert results["spec-2"]["created"] is True
+    assert isinstance(results["spec-2"]["mapped"], int)
+    assert sum(1 for kind, _ in client.calls if kind == "create") == 10
+
+
+def test_sync_process_specs_awaits_single_changed_spec_over_http(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    config_path = _write_basic_config(tmp_path)
+    config_path.write_text(
+        config_path.read_text()
+        + "github:\n  repo: octo/demo\nconcurrency:\n  enabled: true\n  transport: http\n"
+    )
+    suite = IssueSuite.from_config_path(config_path)
+    suite._mock = False
+    client = _FakeAsyncClient()
+    monkeypatch.setattr("issuesuite.core.create_async_github_client", lambda *a, **k: client)
+    specs = [
+        IssueSpec(external_id=f"spec-{i}", title=f"Spec {i}", labels=[], milestone=None, body="")
+        for i in range(12)
+    ]
+    for i, spec in enumerate(specs):
+        spec.hash = f"h{i}"
+    existing = [
+        {"number": 100 + i, "title": f"Spec {i}", "state": "OPEN", "body": "old", "labels": []}
+        for i in range(12)
+    ]
+    prev_hashes = {spec.external_id: spec.hash or "" for spec in specs}
+    prev_hashes["spec-3"] = "stale"
+
+    processed = suite._sync_process_specs(
+        specs, existing, prev_hashes, False, True, True, project_assigner=_StubAssigner()
+    )
+    summary = suite._sync_build_summary(specs, processed)
+    suite.close()
+
+    assert processed[3]["result"]["updated"]["number"] == 103
+    assert client.calls == [("update", 103)]
+    assert summary["totals"]["updated"] == 1
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from issuesuite import _json
+
+
+def test_stdlib_fallback_matches_orjson_conventions(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_json, "_orjson", lambda: None)
+    payload = {"name": "Café", 1: [True, None]}
+
+    compact = _json.dumps(payload)
+    indented = _json.dumps(payload, indent=True)
+
+    assert compact == '{"name":"Café","1":[true,null]}'.encode()
+    assert indented.decode("utf-8") == json.dumps(payload, indent=2, ensure_ascii=False)
+    assert _json.loads(indented) == {"name": "Café", "1": [True, None]}
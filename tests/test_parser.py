@@ -1,3 +1,4 @@
+import sys
 from pathlib import Path
 
 import pytest
@@ -65,3 +66,12 @@ def test_parse_legacy_numeric_detected(tmp_path: Path) -> None:
     md.write_text(LEGACY_NUMERIC_MD)
     with pytest.raises(ParseError):
         parse_issues(md.read_text().splitlines())
+
+
+def test_parse_interns_slug_and_title(tmp_path: Path) -> None:
+    md = tmp_path / "ISSUES.md"
+    md.write_text(SIMPLE_MD)
+    first = parse_issues(md.read_text().splitlines())[0]
+    assert first.external_id is sys.intern("first-feature")
+    assert first.title is sys.intern("First Feature")
+    assert first.labels[0] is sys.intern("".join(["enhance", "ment"]))
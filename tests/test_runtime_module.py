@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from types import SimpleNamespace
 
 import pytest
@@ -7,11 +8,11 @@ import pytest
 from issuesuite import runtime
 
 
+@dataclass(frozen=True)
 class StubConfig:
-    def __init__(self) -> None:
-        self.github_repo: str | None = None
-        self.project_number: int | None = None
-        self.project_enable: bool = False
+    github_repo: str | None = None
+    project_number: int | None = None
+    project_enable: bool = False
 
 
 def test_prepare_config_returns_none_for_init_command() -> None:
@@ -96,6 +96,19 @@ def test_structured_logger_issue_actions(capsys) -> None:
     assert log_data["dry_run"] is True
 
 
+def test_structured_logger_skips_disabled_levels(capsys) -> None:
+    """INFO-level helpers emit nothing when the logger level is higher."""
+    logger = StructuredLogger(name="test-quiet", json_logging=True, level="WARNING")
+    assert logger.is_enabled_for(30)
+    assert not logger.is_enabled_for(20)
+
+    logger.log_operation("sync_start", spec_count=3)
+    logger.log_issue_action("create", "EXT001", issue_number=1)
+    logger.log_performance("sync", 1.5)
+
+    assert capsys.readouterr().out == ""
+
+
 def test_structured_logger_performance_timing(capsys) -> None:
     """Test performance timing logging."""
     logger = StructuredLogger(name="test", json_logging=True, level="INFO")